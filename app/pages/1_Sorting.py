@@ -1,9 +1,12 @@
+import math
 import os
 import sys
 import time
-import random
 import streamlit as st
 
+# Script time of each rerun, shown at the bottom of the page
+run_started = time.perf_counter()
+
 # Correctly calculate and add project root to sys.path
 script_dir = os.path.dirname(os.path.abspath(__file__))  # app/pages
 project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))  # dsa_hub root
@@ -13,757 +16,31 @@ if project_root not in sys.path:
 # Debug print (visible in terminal; remove after testing)
 print(f"Added to sys.path: {project_root}")
 
-# Define Frame class (assuming it's not defined or missing attributes in core.models.frame)
-class Frame:
-    def __init__(self, step, view, narration, data, metrics, highlights):
-        self.step = step
-        self.view = view
-        self.narration = narration
-        self.data = data
-        self.metrics = metrics
-        self.highlights = highlights
+from core.models.buffer import FrameBuffer
+from core.views.playback import render_scrubber, render_budget_picker
+from core.views.metrics_panel import render_metrics
+from core.algorithms.registry import SORTING, load, choices, info, input_type, supports
+from core.utils.inputs import DISTRIBUTIONS
 
 st.set_page_config(page_title="Sorting Forest", layout="wide")
 
-# Data for all sorting algorithms (GFG-style info)
-sorting_algorithms = {
-    "Insertion Sort": {
-        "description": """
-- **Insertion Sort**: Builds a sorted array one item at a time, like sorting playing cards. Efficient for small or nearly sorted datasets.
-- **Use Cases**: Small lists, online sorting where data arrives incrementally.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n²) worst/average case, O(n) best case.  
-- **Space Complexity**: O(1) (in-place).  
-- **Stable**: Yes.
-        """,
-        "code": {
-            "Python": """
-def insertion_sort(arr):
-    for i in range(1, len(arr)):
-        key = arr[i]
-        j = i - 1
-        while j >= 0 and key < arr[j]:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-    return arr
-
-# Example
-arr = [12, 11, 13, 5, 6]
-print(insertion_sort(arr))  # [5, 6, 11, 12, 13]
-            """,
-            "Java": """
-void insertionSort(int arr[]) {
-    int n = arr.length;
-    for (int i = 1; i < n; ++i) {
-        int key = arr[i];
-        int j = i - 1
-        while (j >= 0 && arr[j] > key) {
-            arr[j + 1] = arr[j];
-            j = j - 1;
-        }
-        arr[j + 1] = key;
-    }
-}
-
-// Example
-int arr[] = {12, 11, 13, 5, 6};
-insertionSort(arr);
-            """,
-            "C++": """
-void insertionSort(int arr[], int n) {
-    for (int i = 1; i < n; i++) {
-        int key = arr[i];
-        int j = i - 1;
-        while (j >= 0 && arr[j] > key) {
-            arr[j + 1] = arr[j];
-            j = j - 1;
-        }
-        arr[j + 1] = key;
-    }
-}
-
-// Example
-int arr[] = {12, 11, 13, 5, 6};
-int n = sizeof(arr)/sizeof(arr[0]);
-insertionSort(arr, n);
-            """
-        },
-        "problems": [
-            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"},
-            {"title": "Insertion Sort List", "url": "https://leetcode.com/problems/insertion-sort-list/"},
-            {"title": "Sort Array By Parity", "url": "https://leetcode.com/problems/sort-array-by-parity/"}
-        ],
-        "resources": [
-            {"title": "GFG: Insertion Sort", "url": "https://www.geeksforgeeks.org/insertion-sort/"}
-        ]
-    },
-    "Bubble Sort": {
-        "description": """
-- **Bubble Sort**: Repeatedly swaps adjacent elements if they are in the wrong order. Simple but inefficient for large lists.
-- **Use Cases**: Educational purposes, small datasets.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n²) worst/best/average case.  
-- **Space Complexity**: O(1).  
-- **Stable**: Yes.
-        """,
-        "code": {
-            "Python": """
-def bubble_sort(arr):
-    n = len(arr)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-    return arr
-
-# Example
-arr = [64, 34, 25, 12, 22]
-print(bubble_sort(arr))  # [12, 22, 25, 34, 64]
-            """,
-            "Java": """
-void bubbleSort(int arr[]) {
-    int n = arr.length;
-    for (int i = 0; i < n - 1; i++)
-        for (int j = 0; j < n - i - 1; j++)
-            if (arr[j] > arr[j + 1]) {
-                int temp = arr[j];
-                arr[j] = arr[j + 1];
-                arr[j + 1] = temp;
-            }
-}
-            """,
-            "C++": """
-void bubbleSort(int arr[], int n) {
-    for (int i = 0; i < n - 1; i++)
-        for (int j = 0; j < n - i - 1; j++)
-            if (arr[j] > arr[j + 1])
-                swap(arr[j], arr[j + 1]);
-}
-            """
-        },
-        "problems": [
-            {"title": "Sort Colors", "url": "https://leetcode.com/problems/sort-colors/"},
-            {"title": "Sort List", "url": "https://leetcode.com/problems/sort-list/"}
-        ],
-        "resources": [
-            {"title": "GFG: Bubble Sort", "url": "https://www.geeksforgeeks.org/bubble-sort/"}
-        ]
-    },
-    "Selection Sort": {
-        "description": """
-- **Selection Sort**: Finds the minimum element in the unsorted part and swaps it with the first unsorted element.
-- **Use Cases**: Small lists, when minimizing swaps is important.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n²) all cases.  
-- **Space Complexity**: O(1).  
-- **Stable**: No.
-        """,
-        "code": {
-            "Python": """
-def selection_sort(arr):
-    n = len(arr)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            if arr[j] < arr[min_idx]:
-                min_idx = j
-        arr[i], arr[min_idx] = arr[min_idx], arr[i]
-    return arr
-
-# Example
-arr = [64, 25, 12, 22, 11]
-print(selection_sort(arr))  # [11, 12, 22, 25, 64]
-            """,
-            "Java": """
-void selectionSort(int arr[]) {
-    int n = arr.length;
-    for (int i = 0; i < n - 1; i++) {
-        int min_idx = i;
-        for (int j = i + 1; j < n; j++)
-            if (arr[j] < arr[min_idx])
-                min_idx = j;
-        int temp = arr[min_idx];
-        arr[min_idx] = arr[i];
-        arr[i] = temp;
-    }
-}
-            """,
-            "C++": """
-void selectionSort(int arr[], int n) {
-    for (int i = 0; i < n - 1; i++) {
-        int min_idx = i;
-        for (int j = i + 1; j < n; j++)
-            if (arr[j] < arr[min_idx])
-                min_idx = j;
-        swap(arr[min_idx], arr[i]);
-    }
-}
-            """
-        },
-        "problems": [
-            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"},
-            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"}
-        ],
-        "resources": [
-            {"title": "GFG: Selection Sort", "url": "https://www.geeksforgeeks.org/selection-sort/"}
-        ]
-    },
-    "Merge Sort": {
-        "description": """
-- **Merge Sort**: Divide-and-conquer algorithm that splits the array, sorts halves, and merges them.
-- **Use Cases**: Large datasets, external sorting.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n log n) all cases.  
-- **Space Complexity**: O(n).  
-- **Stable**: Yes.
-        """,
-        "code": {
-            "Python": """
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        L = arr[:mid]
-        R = arr[mid:]
-        merge_sort(L)
-        merge_sort(R)
-        i = j = k = 0
-        while i < len(L) and j < len(R):
-            if L[i] <= R[j]:
-                arr[k] = L[i]
-                i += 1
-            else:
-                arr[k] = R[j]
-                j += 1
-            k += 1
-        while i < len(L):
-            arr[k] = L[i]
-            i += 1
-            k += 1
-        while j < len(R):
-            arr[k] = R[j]
-            j += 1
-            k += 1
-
-# Example
-arr = [12, 11, 13, 5, 6, 7]
-merge_sort(arr)
-print(arr)  # [5, 6, 7, 11, 12, 13]
-            """,
-            "Java": """
-// Refer to GFG for full Java implementation.
-            """,
-            "C++": """
-// Refer to GFG for full C++ implementation.
-            """
-        },
-        "problems": [
-            {"title": "Merge k Sorted Lists", "url": "https://leetcode.com/problems/merge-k-sorted-lists/"},
-            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
-        ],
-        "resources": [
-            {"title": "GFG: Merge Sort", "url": "https://www.geeksforgeeks.org/merge-sort/"}
-        ]
-    },
-    "Quick Sort": {
-        "description": """
-- **Quick Sort**: Divide-and-conquer algorithm that picks a pivot and partitions the array around it.
-- **Use Cases**: General-purpose sorting, efficient on average.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n log n) average, O(n²) worst case.  
-- **Space Complexity**: O(log n).  
-- **Stable**: No.
-        """,
-        "code": {
-            "Python": """
-def quick_sort(arr, low, high):
-    if low < high:
-        pi = partition(arr, low, high)
-        quick_sort(arr, low, pi - 1)
-        quick_sort(arr, pi + 1, high)
-
-def partition(arr, low, high):
-    pivot = arr[high]
-    i = low - 1
-    for j in range(low, high):
-        if arr[j] <= pivot:
-            i += 1
-            arr[i], arr[j] = arr[j], arr[i]
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
-
-# Example
-arr = [10, 7, 8, 9, 1, 5]
-quick_sort(arr, 0, len(arr) - 1)
-print(arr)  # [1, 5, 7, 8, 9, 10]
-            """,
-            "Java": """
-// Refer to GFG for full Java implementation.
-            """,
-            "C++": """
-// Refer to GFG for full C++ implementation.
-            """
-        },
-        "problems": [
-            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"},
-            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
-        ],
-        "resources": [
-            {"title": "GFG: Quick Sort", "url": "https://www.geeksforgeeks.org/quick-sort/"}
-        ]
-    },
-    "Heap Sort": {
-        "description": """
-- **Heap Sort**: Builds a max-heap and repeatedly extracts the maximum element.
-- **Use Cases**: When O(n log n) time is needed with O(1) space.
-        """,
-        "complexity": """
-- **Time Complexity**: O(n log n) all cases.  
-- **Space Complexity**: O(1).  
-- **Stable**: No.
-        """,
-        "code": {
-            "Python": """
-def heap_sort(arr):
-    n = len(arr)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
-    for i in range(n - 1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        heapify(arr, i, 0)
-
-def heapify(arr, n, i):
-    largest = i
-    l = 2 * i + 1
-    r = 2 * i + 2
-    if l < n and arr[l] > arr[largest]:
-        largest = l
-    if r < n and arr[r] > arr[largest]:
-        largest = r
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
-
-# Example
-arr = [12, 11, 13, 5, 6, 7]
-heap_sort(arr)
-print(arr)  # [5, 6, 7, 11, 12, 13]
-            """,
-            "Java": """
-// Refer to GFG for full Java implementation.
-            """,
-            "C++": """
-// Refer to GFG for full C++ implementation.
-            """
-        },
-        "problems": [
-            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"},
-            {"title": "Merge k Sorted Lists", "url": "https://leetcode.com/problems/merge-k-sorted-lists/"}
-        ],
-        "resources": [
-            {"title": "GFG: Heap Sort", "url": "https://www.geeksforgeeks.org/heap-sort/"}
-        ]
-    },
-    "Counting Sort": {
-        "description": """
-- **Counting Sort**: Counts occurrences of each value and reconstructs the sorted array. Non-comparison based.
-- **Use Cases**: When values are in a limited range (e.g., integers 0-100).
-        """,
-        "complexity": """
-- **Time Complexity**: O(n + k) where k is the range.  
-- **Space Complexity**: O(k).  
-- **Stable**: Yes.
-        """,
-        "code": {
-            "Python": """
-def counting_sort(arr):
-    max_val = max(arr) if arr else 0
-    count = [0] * (max_val + 1)
-    for num in arr:
-        count[num] += 1
-    output = []
-    for i, c in enumerate(count):
-        output.extend([i] * c)
-    return output
-
-# Example
-arr = [4, 2, 2, 8, 3, 3, 1]
-print(counting_sort(arr))  # [1, 2, 2, 3, 3, 4, 8]
-            """,
-            "Java": """
-// Refer to GFG for full Java implementation.
-            """,
-            "C++": """
-// Refer to GFG for full C++ implementation.
-            """
-        },
-        "problems": [
-            {"title": "Sort Characters By Frequency", "url": "https://leetcode.com/problems/sort-characters-by-frequency/"},
-            {"title": "Sort Array by Increasing Frequency", "url": "https://leetcode.com/problems/sort-array-by-increasing-frequency/"}
-        ],
-        "resources": [
-            {"title": "GFG: Counting Sort", "url": "https://www.geeksforgeeks.org/counting-sort/"}
-        ]
-    },
-    "Radix Sort": {
-        "description": """
-- **Radix Sort**: Sorts integers by grouping by individual digits (using Counting Sort as subroutine).
-- **Use Cases**: Sorting large numbers or strings.
-        """,
-        "complexity": """
-- **Time Complexity**: O(d(n + k)) where d is digits, k is base.  
-- **Space Complexity**: O(n + k).  
-- **Stable**: Yes.
-        """,
-        "code": {
-            "Python": """
-def radix_sort(arr):
-    max_val = max(arr)
-    exp = 1
-    while max_val // exp > 0:
-        counting_sort_exp(arr, exp)
-        exp *= 10
-
-def counting_sort_exp(arr, exp):
-    n = len(arr)
-    output = [0] * n
-    count = [0] * 10
-    for i in range(n):
-        index = (arr[i] // exp) % 10
-        count[index] += 1
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-    i = n - 1
-    while i >= 0:
-        index = (arr[i] // exp) % 10
-        output[count[index] - 1] = arr[i]
-        count[index] -= 1
-        i -= 1
-    for i in range(n):
-        arr[i] = output[i]
-
-# Example
-arr = [170, 45, 75, 90, 802, 24, 2, 66]
-radix_sort(arr)
-print(arr)  # [2, 24, 45, 66, 75, 90, 170, 802]
-            """,
-            "Java": """
-// Refer to GFG for full Java implementation.
-            """,
-            "C++": """
-// Refer to GFG for full C++ implementation.
-            """
-        },
-        "problems": [
-            {"title": "Sort Characters By Frequency", "url": "https://leetcode.com/problems/sort-characters-by-frequency/"},
-            {"title": "Maximum Gap", "url": "https://leetcode.com/problems/maximum-gap/"}
-        ],
-        "resources": [
-            {"title": "GFG: Radix Sort", "url": "https://www.geeksforgeeks.org/radix-sort/"}
-        ]
-    }
-}
-
-# ------------------------------------------------------
-# Helper: Create frames for visualization
-# ------------------------------------------------------
-def _yield_array(step, array, desc, variables=None, stats=None, highlights=None):
-    return Frame(
-        step=step,
-        view=array[:],
-        narration=desc,
-        data=variables or {},
-        metrics=stats or {},
-        highlights=highlights or {},
-    )
-
-# ------------------------------------------------------
-# Insertion Sort
-# ------------------------------------------------------
-def insertion_sort_frames(arr):
-    a = arr[:]
-    step = 0
-    n = len(a)
-    for i in range(1, n):
-        key = a[i]
-        j = i - 1
-        yield _yield_array(step, a, f"Consider element {key} at index {i}",
-                           {"i": i, "j": j}, {}, {"compare": [i]})
-        step += 1
-        while j >= 0 and a[j] > key:
-            a[j + 1] = a[j]
-            yield _yield_array(step, a, f"Shift {a[j]} to the right",
-                               {"i": i, "j": j}, {"comparisons": 1, "swaps": 1},
-                               {"swap": [j, j+1]})
-            step += 1
-            j -= 1
-        a[j + 1] = key
-        yield _yield_array(step, a, f"Insert {key} at position {j+1}",
-                           {"i": i, "j": j}, {"swaps": 1}, {"swap": [j+1]})
-        step += 1
-
-# ------------------------------------------------------
-# Bubble Sort
-# ------------------------------------------------------
-def bubble_sort_frames(arr):
-    a = arr[:]
-    step = 0
-    n = len(a)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            yield _yield_array(step, a, f"Compare {a[j]} and {a[j+1]}",
-                               {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [j, j+1]})
-            step += 1
-            if a[j] > a[j + 1]:
-                a[j], a[j + 1] = a[j + 1], a[j]
-                yield _yield_array(step, a, f"Swap {a[j]} and {a[j+1]}",
-                                   {"i": i, "j": j}, {"swaps": 1},
-                                   {"swap": [j, j+1]})
-                step += 1
-
-# ------------------------------------------------------
-# Selection Sort
-# ------------------------------------------------------
-def selection_sort_frames(arr):
-    a = arr[:]
-    step = 0
-    n = len(a)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            yield _yield_array(step, a, f"Compare {a[min_idx]} and {a[j]}",
-                               {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [min_idx, j]})
-            step += 1
-            if a[j] < a[min_idx]:
-                min_idx = j
-        a[i], a[min_idx] = a[min_idx], a[i]
-        yield _yield_array(step, a, f"Swap {a[i]} and {a[min_idx]}",
-                           {"i": i, "min_idx": min_idx}, {"swaps": 1},
-                           {"swap": [i, min_idx]})
-        step += 1
-
-# ------------------------------------------------------
-# Merge Sort
-# ------------------------------------------------------
-def merge_sort_frames(arr):
-    a = arr[:]
-    step = 0
-
-    def merge_sort(l, r):
-        nonlocal step
-        if l < r:
-            m = (l + r) // 2
-            yield from merge_sort(l, m)
-            yield from merge_sort(m + 1, r)
-            yield from merge(l, m, r)
-
-    def merge(l, m, r):
-        nonlocal step
-        left = a[l:m+1]
-        right = a[m+1:r+1]
-        i = j = 0
-        k = l
-        while i < len(left) and j < len(right):
-            yield _yield_array(step, a, f"Compare {left[i]} and {right[j]}",
-                               {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [l+i, m+1+j]})
-            step += 1
-            if left[i] <= right[j]:
-                a[k] = left[i]
-                i += 1
-            else:
-                a[k] = right[j]
-                j += 1
-            yield _yield_array(step, a, f"Insert {a[k]} at index {k}",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
-            step += 1
-            k += 1
-        while i < len(left):
-            a[k] = left[i]
-            yield _yield_array(step, a, f"Insert {a[k]} from left",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
-            step += 1
-            i += 1
-            k += 1
-        while j < len(right):
-            a[k] = right[j]
-            yield _yield_array(step, a, f"Insert {a[k]} from right",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
-            step += 1
-            j += 1
-            k += 1
-
-    yield from merge_sort(0, len(a) - 1)
-
-# ------------------------------------------------------
-# Quick Sort
-# ------------------------------------------------------
-def quick_sort_frames(arr, pivot_strategy="last"):
-    a = arr[:]
-    step = 0
-
-    def quick_sort(low, high):
-        nonlocal step
-        if low < high:
-            pi = partition(low, high)
-            yield from quick_sort(low, pi - 1)
-            yield from quick_sort(pi + 1, high)
-
-    def choose_pivot(low, high):
-        if pivot_strategy == "first":
-            return low
-        elif pivot_strategy == "median3":
-            mid = (low + high) // 2
-            trio = [(a[low], low), (a[mid], mid), (a[high], high)]
-            trio.sort(key=lambda x: x[0])
-            return trio[1][1]
-        elif pivot_strategy == "random":
-            return random.randint(low, high)
-        else:
-            return high
-
-    def partition(low, high):
-        nonlocal step
-        pivot_idx = choose_pivot(low, high)
-        a[pivot_idx], a[high] = a[high], a[pivot_idx]
-        pivot = a[high]
-        i = low - 1
-        for j in range(low, high):
-            yield _yield_array(step, a, f"Compare {a[j]} with pivot {pivot}",
-                               {"j": j, "pivot": pivot}, {"comparisons": 1},
-                               {"compare": [j], "pivot": [high]})
-            step += 1
-            if a[j] <= pivot:
-                i += 1
-                a[i], a[j] = a[j], a[i]
-                yield _yield_array(step, a, f"Swap {a[i]} and {a[j]}",
-                                   {"i": i, "j": j}, {"swaps": 1},
-                                   {"swap": [i, j], "pivot": [high]})
-                step += 1
-        a[i + 1], a[high] = a[high], a[i + 1]
-        yield _yield_array(step, a, f"Place pivot {pivot} at position {i+1}",
-                           {"pivot": pivot}, {"swaps": 1},
-                           {"swap": [i+1], "pivot": [i+1]})
-        step += 1
-        return i + 1
-
-    yield from quick_sort(0, len(a) - 1)
-
-# ------------------------------------------------------
-# Heap Sort
-# ------------------------------------------------------
-def heap_sort_frames(arr):
-    a = arr[:]
-    step = 0
-    n = len(a)
-
-    def heapify(n, i):
-        nonlocal step
-        largest = i
-        l = 2 * i + 1
-        r = 2 * i + 2
-        if l < n and a[l] > a[largest]:
-            largest = l
-        if r < n and a[r] > a[largest]:
-            largest = r
-        if largest != i:
-            a[i], a[largest] = a[largest], a[i]
-            yield _yield_array(step, a, f"Swap {a[i]} and {a[largest]}",
-                               {"i": i, "largest": largest}, {"swaps": 1},
-                               {"swap": [i, largest]})
-            step += 1
-            yield from heapify(n, largest)
-
-    for i in range(n // 2 - 1, -1, -1):
-        yield from heapify(n, i)
-    for i in range(n - 1, 0, -1):
-        a[i], a[0] = a[0], a[i]
-        yield _yield_array(step, a, f"Swap root {a[i]} with {a[0]}",
-                           {"i": i}, {"swaps": 1}, {"swap": [0, i]})
-        step += 1
-        yield from heapify(i, 0)
-
-# ------------------------------------------------------
-# Counting Sort
-# ------------------------------------------------------
-def counting_sort_frames(arr):
-    a = arr[:]
-    step = 0
-    max_val = max(a) if a else 0
-    count = [0] * (max_val + 1)
-    for num in a:
-        count[num] += 1
-        yield _yield_array(step, a, f"Count occurrence of {num}",
-                           {"num": num}, {"updates": 1}, {"compare": [a.index(num)]})
-        step += 1
-    output = []
-    for i, c in enumerate(count):
-        for _ in range(c):
-            output.append(i)
-            yield _yield_array(step, output + a[len(output):],
-                               f"Place {i} into output", {"i": i}, {"writes": 1},
-                               {"swap": [len(output)-1]})
-            step += 1
-    a[:] = output
-    yield _yield_array(step, a, "Final sorted array", {}, {}, {})
-
-# ------------------------------------------------------
-# Radix Sort
-# ------------------------------------------------------
-def radix_sort_frames(arr):
-    a = arr[:]
-    step = 0
-
-    def counting_sort_exp(exp):
-        nonlocal step
-        n = len(a)
-        output = [0] * n
-        count = [0] * 10
-        for i in range(n):
-            index = (a[i] // exp) % 10
-            count[index] += 1
-        for i in range(1, 10):
-            count[i] += count[i - 1]
-        i = n - 1
-        while i >= 0:
-            index = (a[i] // exp) % 10
-            output[count[index] - 1] = a[i]
-            count[index] -= 1
-            yield _yield_array(step, output + a[len(output):],
-                               f"Place {a[i]} at position {count[index]}",
-                               {"exp": exp}, {}, {"swap": [count[index]]})
-            step += 1
-            i -= 1
-        for i in range(n):
-            a[i] = output[i]
-            yield _yield_array(step, a, f"Write back {a[i]}",
-                               {"exp": exp}, {}, {"swap": [i]})
-            step += 1
-
-    max_val = max(a) if a else 0
-    exp = 1
-    while max_val // exp > 0:
-        yield from counting_sort_exp(exp)
-        exp *= 10
 
 # Render array function (matching searching style)
 def render_array(array, title="Array", highlights=None):
     colors = ["#222428"] * len(array)  # Default dark color
     if highlights:
+        # Partition regions (<, =, > the pivot) as muted backgrounds
+        for name, region_color in (("less", "#2E4A62"), ("equal", "#5B4A1F"), ("greater", "#4A2E55")):
+            for idx in highlights.get(name, []):
+                if 0 <= idx < len(colors):
+                    colors[idx] = region_color
         # Color for swap (teal)
         for idx in highlights.get("swap", []):
             if 0 <= idx < len(colors):
                 colors[idx] = "#00BFAE"
         # Color for compare (yellow, if not swap)
         for idx in highlights.get("compare", []):
-            if 0 <= idx < len(colors) and colors[idx] == "#222428":
+            if 0 <= idx < len(colors) and colors[idx] != "#00BFAE":
                 colors[idx] = "#FFD600"
         # Color for pivot (red)
         for idx in highlights.get("pivot", []):
@@ -778,17 +55,34 @@ def render_array(array, title="Array", highlights=None):
     st.subheader(title)
     st.markdown(html, unsafe_allow_html=True)
 
+# Parallel sorts: one row per worker lane, highlights shifted to lane-local indices
+def render_lanes(frame):
+    from core.algorithms.parallel_sort import lane_bounds
+    values = frame.view["values"]
+    st.caption(f"Step {frame.step} — lane {frame.data['lane']} moved")
+    for lane, (lo, hi) in enumerate(lane_bounds(len(values), st.session_state.get("generated_lanes", 1))):
+        highlights = {name: [i - lo for i in idx if lo <= i < hi] for name, idx in frame.view["highlights"].items()}
+        render_array(values[lo:hi], title=f"Lane {lane}", highlights=highlights)
+
 # ===== DYNAMIC INFO BAR (Updates based on selected algorithm) =====
-selected_algo = st.selectbox("Algorithm", list(sorting_algorithms.keys()), index=0)
+selected_algo = st.selectbox("Algorithm", list(SORTING), index=0)
+spec = SORTING[selected_algo]
 
 with st.expander(f"ℹ️ {selected_algo}: Overview, Code, Complexity, and Top LeetCode Problems", expanded=False):
-    algo_data = sorting_algorithms[selected_algo]
+    algo_data = info(selected_algo)
     
     st.markdown("### Overview")
     st.markdown(algo_data["description"])
     
     st.markdown("### Complexity")
-    st.markdown(algo_data["complexity"])
+    st.markdown(
+        f"- **Time Complexity**: {spec['time']['best']} best, {spec['time']['average']} average, "
+        f"{spec['time']['worst']} worst.  \n"
+        f"- **Space Complexity**: {spec['space']}.  \n"
+        f"- **Stable**: {'Yes' if spec['stable'] else 'No'}.  \n"
+        f"- **In-place**: {'Yes' if spec['in_place'] else 'No'}.  \n"
+        f"- **Inputs**: {', '.join(spec['inputs'])}."
+    )
     
     st.markdown("### Code Snippet")
     language = st.selectbox("Language", ["Python", "Java", "C++"], key="code_lang")
@@ -809,51 +103,67 @@ if "idx" not in st.session_state:
     st.session_state.idx = 0
 if "playing" not in st.session_state:
     st.session_state.playing = False
+if "heatmap" not in st.session_state:
+    st.session_state.heatmap = None
+if "pivot_study" not in st.session_state:
+    st.session_state.pivot_study = None
 
 # Inputs
 st.title("Sorting Forest")
 st.caption("Experiment with arrays and watch sorting algorithms step by step.")
 
-array_input = st.text_input("Array (comma-separated integers)", value="5,3,4,1,2,7,8,9")
+def parse_value(token):
+    try:
+        return int(token)
+    except ValueError:
+        value = float(token)
+        if not math.isfinite(value):
+            raise ValueError(token)
+        return value
+
+array_input = st.text_input("Array (comma-separated numbers)", value="5,3,4,1,2,7,8,9")
 try:
-    input_arr = [int(x.strip()) for x in array_input.split(",") if x.strip()]
+    input_arr = [parse_value(x.strip()) for x in array_input.split(",") if x.strip()]
 except ValueError:
-    st.error("Invalid array input. Use comma-separated integers.")
+    st.error("Invalid array input. Use comma-separated numbers.")
+    st.stop()
+if not supports(selected_algo, input_arr):
+    st.error(f"{selected_algo} sorts {' or '.join(spec['inputs'])} values; this array is {input_type(input_arr)}.")
     st.stop()
 
 speed = st.slider("Speed (steps/sec)", 1, 10, 5)
+budget = render_budget_picker("budget")
+# Per-algorithm options, as declared in the registry
+options = {}
+for param, option in spec["options"].items():
+    if "choices" in option:
+        values = list(choices(option))
+        options[param] = st.selectbox(option["label"], values, index=values.index(option["default"]),
+                                      key=f"opt_{param}")
+    else:
+        options[param] = st.slider(option["label"], option["min"], option["max"], option["default"],
+                                   key=f"opt_{param}")
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 generate_clicked = c1.button("Generate", key="btn_generate")
 play_clicked = c2.button("Play", key="btn_play")
 pause_clicked = c3.button("Pause", key="btn_pause")
 step_clicked = c4.button("Step", key="btn_step")
 reset_clicked = c5.button("Reset", key="btn_reset")
+back_clicked = c6.button("Back", key="btn_back")
 
-# Function to generate frames based on selected algo
-def generate_frames(arr, algo):
-    if algo == "Insertion Sort":
-        return list(insertion_sort_frames(arr))
-    elif algo == "Bubble Sort":
-        return list(bubble_sort_frames(arr))
-    elif algo == "Selection Sort":
-        return list(selection_sort_frames(arr))
-    elif algo == "Merge Sort":
-        return list(merge_sort_frames(arr))
-    elif algo == "Quick Sort":
-        return list(quick_sort_frames(arr))
-    elif algo == "Heap Sort":
-        return list(heap_sort_frames(arr))
-    elif algo == "Counting Sort":
-        return list(counting_sort_frames(arr))
-    elif algo == "Radix Sort":
-        return list(radix_sort_frames(arr))
-    return []
+# Frames come from the registry's generator, imported on first use
+def generate_frames(arr, algo, budget=None, options=None):
+    frames = load(algo)(arr, **(options or {}), budget=budget)
+    # Frames are pulled lazily as playback reaches them
+    return FrameBuffer(frames)
 
 # Generate button logic
 if generate_clicked:
-    st.session_state.frames = generate_frames(input_arr, selected_algo)
+    st.session_state.frames = generate_frames(input_arr, selected_algo, budget, options)
+    st.session_state.generated_lanes = options.get("lanes", 1)
+    st.session_state.heatmap = None
     st.session_state.idx = 0
     st.session_state.playing = False
     st.success("Frames generated!")
@@ -866,7 +176,7 @@ if pause_clicked:
     st.session_state.playing = False
 
 if step_clicked:
-    if st.session_state.frames and st.session_state.idx < len(st.session_state.frames) - 1:
+    if st.session_state.frames and st.session_state.frames.has(st.session_state.idx + 1):
         st.session_state.idx += 1
     st.rerun()
 
@@ -875,6 +185,13 @@ if reset_clicked:
     st.session_state.playing = False
     st.rerun()
 
+if back_clicked:
+    st.session_state.idx = max(st.session_state.idx - 1, 0)
+    st.session_state.playing = False
+    st.rerun()
+
+render_scrubber(st.session_state.frames, "idx", "playing")
+
 # Display
 left, right = st.columns([3, 2])
 
@@ -882,21 +199,35 @@ def render_current():
     if not st.session_state.frames:
         st.info("Enter an array, choose an algorithm, and click Generate to create frames.")
         return
-    frame = st.session_state.frames[st.session_state.idx]
+    frame = st.session_state.frames.seek(st.session_state.idx)
     with left:
-        render_array(frame.view, title=f"Array — Step {frame.step}", highlights=frame.highlights)
+        if frame.data.get("phase") == "sort":
+            render_lanes(frame)
+        else:
+            render_array(frame.view["values"], title=f"Array — Step {frame.step}", highlights=frame.view["highlights"])
     with right:
         st.subheader("Narration")
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
+        render_metrics(st.session_state.frames.totals_at(st.session_state.idx))
         
-    st.caption(f"Frame {st.session_state.idx + 1} / {len(st.session_state.frames)}")
+    st.caption(f"Frame {st.session_state.idx + 1} / {len(st.session_state.frames)}{'' if st.session_state.frames.exhausted else '+'}")
+    if st.checkbox("Show evolution heatmap", key="show_heatmap"):
+        render_heatmap()
+
+# Whole run at a glance: the buffer's stored deltas, replayed into a frames x index matrix
+def render_heatmap():
+    from core.views.heatmap_view import render_evolution_heatmap
+    if st.session_state.heatmap is None:
+        trace = st.session_state.frames.to_frame_trace()
+        st.session_state.heatmap = trace.snapshot_matrix(rows=400, cols=200)
+    render_evolution_heatmap(*st.session_state.heatmap)
 
 # Animation loop
 if st.session_state.playing and st.session_state.frames:
     render_current()
-    if st.session_state.idx < len(st.session_state.frames) - 1:
+    if st.session_state.frames.has(st.session_state.idx + 1):
         st.session_state.idx += 1
         time.sleep(1.0 / max(1, speed))
         st.rerun()
@@ -906,5 +237,29 @@ if st.session_state.playing and st.session_state.frames:
 else:
     render_current()
 
+# Quick sort pivot strategies over many seeded inputs, run in a process pool
+with st.expander("Compare quick sort pivot strategies"):
+    p1, p2, p3, p4 = st.columns(4)
+    study_n = p1.number_input("Array length", 10, 20_000, 300, key="study_n")
+    study_seeds = p2.slider("Seeds per distribution", 2, 100, 10, key="study_seeds")
+    study_partition = p3.selectbox("Partition scheme", choices(SORTING["Quick Sort"]["options"]["partition"]),
+                                   key="study_partition")
+    # First/last pivots on sorted input are quadratic; runs past the limit are dropped
+    study_limit = p4.number_input("Time limit (s)", 1, 600, 30, key="study_limit")
+    study_distributions = st.multiselect("Distributions", DISTRIBUTIONS, ["random", "sorted", "few_unique"],
+                                         key="study_distributions")
+    if st.button("Run comparison", key="btn_study") and study_distributions:
+        from core.algorithms.pivot_study import compare_pivots
+        with st.spinner("Sorting..."):
+            st.session_state.pivot_study = compare_pivots(study_distributions, int(study_n), study_seeds,
+                                                          partition=study_partition, time_limit=study_limit)
+    if st.session_state.pivot_study:
+        from core.algorithms.pivot_study import STUDY_METRICS
+        from core.views.pivot_study_view import render_pivot_study
+        metric = st.selectbox("Metric", STUDY_METRICS, key="study_metric")
+        render_pivot_study(st.session_state.pivot_study, metric)
+
 st.markdown("---")
 st.caption("Tip: Experiment with different arrays and algorithms to see the steps.")
+st.session_state.run_ms = (time.perf_counter() - run_started) * 1000
+st.caption(f"Script run: {st.session_state.run_ms:.1f} ms")
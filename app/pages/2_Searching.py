@@ -6,7 +6,10 @@ if PROJECT_ROOT not in sys.path:
 import time
 import streamlit as st
 from core.models.frame import Frame
+from core.models.buffer import FrameBuffer
 from core.views.array_view import render_array
+from core.views.playback import render_scrubber
+from core.views.metrics_panel import render_metrics
 from core.algorithms.searching import (
     linear_search_frames,
     binary_search_frames,
@@ -244,15 +247,15 @@ elif selected_algo == "Rotated Binary Search":
 speed = st.slider("Speed (steps/sec)", 1, 10, 5)
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 if c1.button("Generate"):
     try:
         if selected_algo == "Linear Search":
-            st.session_state.frames_s = list(linear_search_frames(arr, int(target)))
+            st.session_state.frames_s = FrameBuffer(linear_search_frames(arr, int(target)), keep_errors=True)
         elif selected_algo == "Binary Search (sorted)":
-            st.session_state.frames_s = list(binary_search_frames(arr, int(target)))
+            st.session_state.frames_s = FrameBuffer(binary_search_frames(arr, int(target)), keep_errors=True)
         elif selected_algo == "Rotated Binary Search":
-            st.session_state.frames_s = list(rotated_binary_search_frames(arr, int(target)))
+            st.session_state.frames_s = FrameBuffer(rotated_binary_search_frames(arr, int(target)), keep_errors=True)
         st.session_state.idx_s = 0
         st.session_state.playing_s = False
     except Exception as e:
@@ -266,20 +269,29 @@ if c3.button("Pause"):
 
 if c4.button("Step"):
     if st.session_state.frames_s:
-        st.session_state.idx_s = min(st.session_state.idx_s + 1, len(st.session_state.frames_s) - 1)
+        if st.session_state.frames_s.has(st.session_state.idx_s + 1):
+            st.session_state.idx_s += 1
 
 if c5.button("Restart"):
     st.session_state.idx_s = 0
     st.session_state.playing_s = False
+if c6.button("Back"):
+    st.session_state.idx_s = max(st.session_state.idx_s - 1, 0)
+    st.session_state.playing_s = False
+
+render_scrubber(st.session_state.frames_s, "idx_s", "playing_s")
 
 # Display
 left, right = st.columns([3, 2])
 
 def render_current():
+    # Errors raised while frames are pulled end the run; show what was generated
+    if getattr(st.session_state.frames_s, "error", None) is not None:
+        st.error(f"Error generating frames: {st.session_state.frames_s.error}")
     if not st.session_state.frames_s:
         st.info("Enter the array/target, choose an algorithm, then click Generate.")
         return
-    frame: Frame = st.session_state.frames_s[st.session_state.idx_s]
+    frame: Frame = st.session_state.frames_s.seek(st.session_state.idx_s)
     with left:
         render_array(frame.view, title=f"Array — Step {frame.step}")
         # Highlight legend
@@ -289,14 +301,15 @@ def render_current():
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
+        render_metrics(st.session_state.frames_s.totals_at(st.session_state.idx_s))
         
-    st.caption(f"Frame {st.session_state.idx_s + 1} / {len(st.session_state.frames_s)}")
+    st.caption(f"Frame {st.session_state.idx_s + 1} / {len(st.session_state.frames_s)}{'' if st.session_state.frames_s.exhausted else '+'}")
 
 # Animation loop with progress bar
 progress_bar = st.progress(0)
 if st.session_state.playing_s and st.session_state.frames_s:
     render_current()
-    if st.session_state.idx_s < len(st.session_state.frames_s) - 1:
+    if st.session_state.frames_s.has(st.session_state.idx_s + 1):
         st.session_state.idx_s += 1
         progress_bar.progress((st.session_state.idx_s + 1) / len(st.session_state.frames_s))
         time.sleep(1.0 / max(1, speed))
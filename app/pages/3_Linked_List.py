@@ -6,7 +6,10 @@ if PROJECT_ROOT not in sys.path:
 import time
 import streamlit as st
 from core.models.frame import Frame
+from core.models.buffer import FrameBuffer
 from core.views.list_view import render_linked_list
+from core.views.playback import render_scrubber
+from core.views.metrics_panel import render_metrics
 from core.algorithms.linked_list import SinglyLinkedList, DoublyLinkedList, CircularLinkedList
 
 st.set_page_config(page_title="Linked List ", layout="wide")
@@ -247,7 +250,7 @@ except ValueError:
 speed = st.slider("Speed (steps/sec)", 1, 10, 5)
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 if c1.button("Generate"):
     if selected_list_type == "Singly Linked List":
         ll = SinglyLinkedList()
@@ -265,13 +268,13 @@ if c1.button("Generate"):
             pass  # Consume generator to execute insertion
 
     if op == "Insert Head":
-        st.session_state.ll_frames = list(ll.insert_head_frames(val))
+        st.session_state.ll_frames = FrameBuffer(ll.insert_head_frames(val))
     elif op == "Insert Tail":
-        st.session_state.ll_frames = list(ll.insert_tail_frames(val))
+        st.session_state.ll_frames = FrameBuffer(ll.insert_tail_frames(val))
     elif op == "Search":
-        st.session_state.ll_frames = list(ll.search_frames(val))
+        st.session_state.ll_frames = FrameBuffer(ll.search_frames(val))
     elif op == "Delete Value":
-        st.session_state.ll_frames = list(ll.delete_value_frames(val))
+        st.session_state.ll_frames = FrameBuffer(ll.delete_value_frames(val))
     st.session_state.ll_idx = 0
     st.session_state.ll_playing = False
 
@@ -281,10 +284,16 @@ if c3.button("Pause"):
     st.session_state.ll_playing = False
 if c4.button("Step"):
     if st.session_state.ll_frames:
-        st.session_state.ll_idx = min(st.session_state.ll_idx + 1, len(st.session_state.ll_frames) - 1)
+        if st.session_state.ll_frames.has(st.session_state.ll_idx + 1):
+            st.session_state.ll_idx += 1
 if c5.button("Restart"):
     st.session_state.ll_idx = 0
     st.session_state.ll_playing = False
+if c6.button("Back"):
+    st.session_state.ll_idx = max(st.session_state.ll_idx - 1, 0)
+    st.session_state.ll_playing = False
+
+render_scrubber(st.session_state.ll_frames, "ll_idx", "ll_playing")
 
 # Display
 left, right = st.columns([3, 2])
@@ -293,7 +302,7 @@ def render_current():
     if not st.session_state.ll_frames:
         st.info("Enter values, choose an operation, then click Generate.")
         return
-    frame: Frame = st.session_state.ll_frames[st.session_state.ll_idx]
+    frame: Frame = st.session_state.ll_frames.seek(st.session_state.ll_idx)
     with left:
         render_linked_list(frame.view, title=f"Linked List — Step {frame.step}")
     with right:
@@ -301,13 +310,14 @@ def render_current():
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
+        render_metrics(st.session_state.ll_frames.totals_at(st.session_state.ll_idx))
         
-    st.caption(f"Frame {st.session_state.ll_idx + 1} / {len(st.session_state.ll_frames)}")
+    st.caption(f"Frame {st.session_state.ll_idx + 1} / {len(st.session_state.ll_frames)}{'' if st.session_state.ll_frames.exhausted else '+'}")
 
 # Animation loop
 if st.session_state.ll_playing and st.session_state.ll_frames:
     render_current()
-    if st.session_state.ll_idx < len(st.session_state.ll_frames) - 1:
+    if st.session_state.ll_frames.has(st.session_state.ll_idx + 1):
         st.session_state.ll_idx += 1
         time.sleep(1.0 / max(1, speed))
         st.rerun()
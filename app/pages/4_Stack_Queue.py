@@ -7,7 +7,10 @@ if PROJECT_ROOT not in sys.path:
 import time
 import streamlit as st
 from core.models.frame import Frame
+from core.models.buffer import FrameBuffer
 from core.views.stack_queue_view import render_stack, render_queue
+from core.views.playback import render_scrubber
+from core.views.metrics_panel import render_metrics
 from core.algorithms.stack_queue import (
     stack_push_frames,
     stack_pop_frames,
@@ -196,18 +199,18 @@ speed = st.slider("Speed (steps/sec)", 1, 10, 5)
 
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 if c1.button("Generate"):
     if selected_structure == "Stack":
         if op == "Push":
-            st.session_state.sq_frames = list(stack_push_frames(values, val))
+            st.session_state.sq_frames = FrameBuffer(stack_push_frames(values, val))
         else:
-            st.session_state.sq_frames = list(stack_pop_frames(values))
+            st.session_state.sq_frames = FrameBuffer(stack_pop_frames(values))
     else:
         if op == "Enqueue":
-            st.session_state.sq_frames = list(queue_enqueue_frames(values, val))
+            st.session_state.sq_frames = FrameBuffer(queue_enqueue_frames(values, val))
         else:
-            st.session_state.sq_frames = list(queue_dequeue_frames(values))
+            st.session_state.sq_frames = FrameBuffer(queue_dequeue_frames(values))
     st.session_state.sq_idx = 0
     st.session_state.sq_playing = False
 
@@ -218,10 +221,16 @@ if c3.button("Pause"):
     st.session_state.sq_playing = False
 if c4.button("Step"):
     if st.session_state.sq_frames:
-        st.session_state.sq_idx = min(st.session_state.sq_idx + 1, len(st.session_state.sq_frames) - 1)
+        if st.session_state.sq_frames.has(st.session_state.sq_idx + 1):
+            st.session_state.sq_idx += 1
 if c5.button("Restart"):
     st.session_state.sq_idx = 0
     st.session_state.sq_playing = False
+if c6.button("Back"):
+    st.session_state.sq_idx = max(st.session_state.sq_idx - 1, 0)
+    st.session_state.sq_playing = False
+
+render_scrubber(st.session_state.sq_frames, "sq_idx", "sq_playing")
 
 
 # Display
@@ -232,7 +241,7 @@ def render_current():
     if not st.session_state.sq_frames:
         st.info("Enter values, choose an operation, then click Generate.")
         return
-    frame: Frame = st.session_state.sq_frames[st.session_state.sq_idx]
+    frame: Frame = st.session_state.sq_frames.seek(st.session_state.sq_idx)
     with left:
         if selected_structure == "Stack":
             render_stack(frame.view, title=f"Stack — Step {frame.step}")
@@ -243,13 +252,14 @@ def render_current():
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
-    st.caption(f"Frame {st.session_state.sq_idx + 1} / {len(st.session_state.sq_frames)}")
+        render_metrics(st.session_state.sq_frames.totals_at(st.session_state.sq_idx))
+    st.caption(f"Frame {st.session_state.sq_idx + 1} / {len(st.session_state.sq_frames)}{'' if st.session_state.sq_frames.exhausted else '+'}")
 
 
 # Animation loop
 if st.session_state.sq_playing and st.session_state.sq_frames:
     render_current()
-    if st.session_state.sq_idx < len(st.session_state.sq_frames) - 1:
+    if st.session_state.sq_frames.has(st.session_state.sq_idx + 1):
         st.session_state.sq_idx += 1
         time.sleep(1.0 / max(1, speed))
         st.rerun()
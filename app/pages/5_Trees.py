@@ -10,7 +10,10 @@ if PROJECT_ROOT not in sys.path:
 
 
 from core.algorithms.trees import BST, AVL, MinHeap, MaxHeap
+from core.models.buffer import FrameBuffer
 from core.views.tree_view import render_tree_array
+from core.views.playback import render_scrubber
+from core.views.metrics_panel import render_metrics
 
 
 st.set_page_config(page_title="Trees ", layout="wide")
@@ -357,7 +360,7 @@ class TreeGardener:
 
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 if c1.button("Generate"):
     gardener = TreeGardener(selected_tree_type)
     st.session_state.frames_t = []  # Reset frames
@@ -379,6 +382,7 @@ if c1.button("Generate"):
             st.error("Please provide an extra value for Delete.")
 
 
+    st.session_state.frames_t = FrameBuffer(st.session_state.frames_t)
     st.session_state.idx_t = 0
     st.session_state.playing_t = False
 
@@ -393,7 +397,8 @@ if c3.button("Pause"):
 
 if c4.button("Step"):
     if st.session_state.frames_t:
-        st.session_state.idx_t = min(st.session_state.idx_t + 1, len(st.session_state.frames_t) - 1)
+        if st.session_state.frames_t.has(st.session_state.idx_t + 1):
+            st.session_state.idx_t += 1
 
 
 if c5.button("Restart"):
@@ -401,6 +406,14 @@ if c5.button("Restart"):
     st.session_state.playing_t = False
 
 
+if c6.button("Back"):
+    st.session_state.idx_t = max(st.session_state.idx_t - 1, 0)
+    st.session_state.playing_t = False
+
+
+render_scrubber(st.session_state.frames_t, "idx_t", "playing_t")
+
+
 # Display
 left, right = st.columns([3, 2])
 
@@ -409,7 +422,7 @@ def render_current():
     if not st.session_state.frames_t:
         st.info("Enter values, choose tree type and operation, then click Generate.")
         return
-    frame = st.session_state.frames_t[st.session_state.idx_t]
+    frame = st.session_state.frames_t.seek(st.session_state.idx_t)
     with left:
         # Fixed access: Use frame.view (assuming it's a list or dict for tree rendering)
         render_tree_array(frame.view, title=f"Tree View — Step {frame.step}")
@@ -418,16 +431,15 @@ def render_current():
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
-        st.subheader("Metrics")
-        st.json(frame.metrics)
+        render_metrics(st.session_state.frames_t.totals_at(st.session_state.idx_t))
     
-    st.caption(f"Frame {st.session_state.idx_t + 1} / {len(st.session_state.frames_t)}")
+    st.caption(f"Frame {st.session_state.idx_t + 1} / {len(st.session_state.frames_t)}{'' if st.session_state.frames_t.exhausted else '+'}")
 
 
 # Animation loop
 if st.session_state.playing_t and st.session_state.frames_t:
     render_current()
-    if st.session_state.idx_t < len(st.session_state.frames_t) - 1:
+    if st.session_state.frames_t.has(st.session_state.idx_t + 1):
         st.session_state.idx_t += 1
         time.sleep(1.0 / max(1, speed))
         st.rerun()
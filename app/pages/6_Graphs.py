@@ -10,7 +10,10 @@ if PROJECT_ROOT not in sys.path:
 
 
 from core.algorithms.graphs import Graph
+from core.models.buffer import FrameBuffer
 from core.views.graph_view import render_graph
+from core.views.playback import render_scrubber, render_budget_picker
+from core.views.metrics_panel import render_metrics
 
 
 st.set_page_config(page_title="Graph ", layout="wide")
@@ -210,6 +213,7 @@ start_node = st.number_input("Start Node", value=0, step=1)
 
 
 speed = st.slider("Speed (steps/sec)", 1, 10, 5)
+budget = render_budget_picker("budget_g")
 
 
 # Build graph
@@ -221,15 +225,15 @@ def build_graph(edges):
 
 
 # Controls
-c1, c2, c3, c4, c5 = st.columns(5)
+c1, c2, c3, c4, c5, c6 = st.columns(6)
 if c1.button("Generate"):
     graph = build_graph(edges)
     if selected_algo == "BFS":
-        st.session_state.frames_g = list(graph.bfs_frames(start_node))
+        st.session_state.frames_g = FrameBuffer(graph.bfs_frames(start_node, budget=budget))
     elif selected_algo == "DFS":
-        st.session_state.frames_g = list(graph.dfs_frames(start_node))
+        st.session_state.frames_g = FrameBuffer(graph.dfs_frames(start_node, budget=budget))
     elif selected_algo == "Dijkstra":
-        st.session_state.frames_g = list(graph.dijkstra_frames(start_node))
+        st.session_state.frames_g = FrameBuffer(graph.dijkstra_frames(start_node, budget=budget))
     st.session_state.idx_g = 0
     st.session_state.playing_g = False
 
@@ -244,7 +248,8 @@ if c3.button("Pause"):
 
 if c4.button("Step"):
     if st.session_state.frames_g:
-        st.session_state.idx_g = min(st.session_state.idx_g + 1, len(st.session_state.frames_g) - 1)
+        if st.session_state.frames_g.has(st.session_state.idx_g + 1):
+            st.session_state.idx_g += 1
 
 
 if c5.button("Restart"):
@@ -252,6 +257,14 @@ if c5.button("Restart"):
     st.session_state.playing_g = False
 
 
+if c6.button("Back"):
+    st.session_state.idx_g = max(st.session_state.idx_g - 1, 0)
+    st.session_state.playing_g = False
+
+
+render_scrubber(st.session_state.frames_g, "idx_g", "playing_g")
+
+
 # Display
 left, right = st.columns([3, 2])
 
@@ -260,7 +273,7 @@ def render_current():
     if not st.session_state.frames_g:
         st.info("Enter edges/start node, choose an algorithm, then click Generate.")
         return
-    frame = st.session_state.frames_g[st.session_state.idx_g]
+    frame = st.session_state.frames_g.seek(st.session_state.idx_g)
     with left:
         # Fixed: Extract highlights from frame.view (not frame.highlights)
         highlights = frame.view.get("highlights", {})
@@ -270,16 +283,15 @@ def render_current():
         st.write(frame.narration)
         st.subheader("Data / Vars")
         st.json(frame.data)
-        st.subheader("Metrics")
-        st.json(frame.metrics)
+        render_metrics(st.session_state.frames_g.totals_at(st.session_state.idx_g))
     
-    st.caption(f"Frame {st.session_state.idx_g + 1} / {len(st.session_state.frames_g)}")
+    st.caption(f"Frame {st.session_state.idx_g + 1} / {len(st.session_state.frames_g)}{'' if st.session_state.frames_g.exhausted else '+'}")
 
 
 # Animation loop
 if st.session_state.playing_g and st.session_state.frames_g:
     render_current()
-    if st.session_state.idx_g < len(st.session_state.frames_g) - 1:
+    if st.session_state.frames_g.has(st.session_state.idx_g + 1):
         st.session_state.idx_g += 1
         time.sleep(1.0 / max(1, speed))
         st.rerun()
@@ -0,0 +1,60 @@
+"""
+Per-frame memory and construction cost of the compact Frame versus the
+previous four-dict Frame.
+
+Run from the project root:  python benchmarks/bench_frames.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models.frame import Frame, OP_COMPARE
+
+
+class LegacyFrame:
+    # The Frame as it was before __slots__: view/highlights/data/metrics dicts per step
+    def __init__(self, step, view, narration="", data=None, metrics=None, highlights=None):
+        self.step = step
+        self.view = {
+            "values": list(view),
+            "highlights": highlights or {}
+        }
+        self.narration = narration
+        self.data = data or {}
+        self.metrics = metrics or {}
+
+
+def build(cls, count, values, **extra):
+    frames = []
+    for k in range(count):
+        frames.append(cls(k, values, "Compare", {"i": k, "j": k + 1},
+                          {"comparisons": 1}, {"compare": [k, k + 1]}, **extra))
+    return frames
+
+
+def measure(cls, count, values, **extra):
+    tracemalloc.start()
+    frames = build(cls, count, values, **extra)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del frames
+    start = time.perf_counter()
+    build(cls, count, values, **extra)
+    elapsed = time.perf_counter() - start
+    return used / count, elapsed / count * 1e9
+
+
+def main(count=50_000):
+    for n in (0, 8, 64):
+        values = list(range(n))
+        before = measure(LegacyFrame, count, values)
+        after = measure(Frame, count, values, op=OP_COMPARE)
+        print(f"n={n:>3}  bytes/frame {before[0]:7.0f} -> {after[0]:7.0f}   "
+              f"ns/frame {before[1]:6.0f} -> {after[1]:6.0f}")
+
+
+if __name__ == "__main__":
+    main()
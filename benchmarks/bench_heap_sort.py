@@ -0,0 +1,34 @@
+"""
+Comparisons of heap sort with Floyd's bottom-up sift-down against the
+classic two-comparison sift, across input distributions.
+
+Run from the project root:  python benchmarks/bench_heap_sort.py [n]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.utils.inputs import make_input
+from core.algorithms.sorting import HEAP_SIFTS, count_only, heap_sort_frames
+
+
+def main(n=100_000, distributions=("random", "sorted", "reversed", "few_unique")):
+    rows = []
+    for distribution in distributions:
+        arr = make_input(distribution, n)
+        counts = {}
+        for sift in HEAP_SIFTS:
+            values, counts[sift] = count_only(heap_sort_frames, arr, sift=sift)
+            assert values == sorted(arr)
+        rows.append((distribution, counts))
+        floyd, classic = counts["floyd"], counts["classic"]
+        print(f"{distribution:>11}  floyd cmp={floyd['comparisons']:<10} wr={floyd['writes']:<10} "
+              f"{floyd['wall_seconds']:6.2f}s   classic cmp={classic['comparisons']:<10} "
+              f"swp={classic['swaps']:<10} {classic['wall_seconds']:6.2f}s   "
+              f"ratio {floyd['comparisons'] / max(classic['comparisons'], 1):.2f}")
+    return rows
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,45 @@
+"""
+Script time of the Sorting page per Streamlit rerun, as the page itself
+measures it (st.session_state.run_ms): the first run, idle reruns, and
+the reruns triggered by stepping through frames. Also reports the time
+to compile the page source, which Streamlit pays again whenever its
+bytecode cache is cold (and on every AppTest run).
+
+Run from the project root:  python benchmarks/bench_page_rerun.py [reruns]
+"""
+import os
+import statistics
+import sys
+import timeit
+
+from streamlit.testing.v1 import AppTest
+
+PAGE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "pages", "1_Sorting.py"))
+
+
+def _click(at, label):
+    next(b for b in at.button if b.label == label).click().run()
+
+
+def main(reruns=30):
+    with open(PAGE, encoding="utf-8") as f:
+        source = f.read()
+    compile_ms = min(timeit.repeat(lambda: compile(source, PAGE, "exec"), number=10, repeat=5)) / 10 * 1000
+    at = AppTest.from_file(PAGE, default_timeout=60).run()
+    first = at.session_state["run_ms"]
+    idle = []
+    for _ in range(reruns):
+        at.run()
+        idle.append(at.session_state["run_ms"])
+    _click(at, "Generate")
+    stepping = []
+    for _ in range(reruns):
+        _click(at, "Step")
+        stepping.append(at.session_state["run_ms"])
+    print(f"compile {compile_ms:6.2f} ms   first run {first:8.1f} ms   idle rerun p50 {statistics.median(idle):6.2f} ms   "
+          f"step rerun p50 {statistics.median(stepping):6.2f} ms")
+    return {"compile": compile_ms, "first": first, "idle": idle, "step": stepping}
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
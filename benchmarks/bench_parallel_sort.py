@@ -0,0 +1,29 @@
+"""
+Throughput of the headless parallel merge sort across worker counts.
+
+Run from the project root:  python benchmarks/bench_parallel_sort.py [n]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.algorithms.parallel_sort import parallel_merge_sort
+
+
+def main(n=1_000_000):
+    values = [random.random() for _ in range(n)]
+    expected = sorted(values)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        out, stats = parallel_merge_sort(values, workers=workers)
+        assert out == expected
+        print(f"workers={workers:>2}  {n / stats['wall_seconds']:>12,.0f} elems/s   "
+              f"sort {stats['sort_seconds']:6.2f}s  merge {stats['merge_seconds']:6.2f}s  "
+              f"slowest lane {max(stats['chunk_seconds']):6.2f}s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,51 @@
+"""
+Selection at scale: comparisons of quickselect, introselect and
+median-of-medians across input distributions, NumPy's introselect on the
+same inputs, and streaming top-k over a generator of millions of values.
+
+Run from the project root:  python benchmarks/bench_selection.py [n] [stream]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.utils.inputs import make_input
+from core.algorithms.selection import SELECT_METHODS, nth_element, nth_element_numpy, top_k
+
+
+def main(n=100_000, stream=5_000_000, k=100, distributions=("random", "sorted", "reversed", "few_unique")):
+    rows = []
+    for distribution in distributions:
+        arr = make_input(distribution, n)
+        rank = n // 2
+        expected = sorted(arr)[rank]
+        counts = {}
+        for method in SELECT_METHODS:
+            values, counts[method] = nth_element(arr, rank, method=method)
+            assert values[rank] == expected
+        start = time.perf_counter()
+        assert nth_element_numpy(arr, rank)[rank] == expected
+        numpy_seconds = time.perf_counter() - start
+        rows.append((distribution, counts, numpy_seconds))
+        print(f"{distribution:>11}  " + "  ".join(
+            f"{method} cmp={c['comparisons']:<9} {c['wall_seconds']:6.2f}s" for method, c in counts.items())
+            + f"  numpy {numpy_seconds * 1000:7.2f}ms")
+
+    rng = random.Random(0)
+    top, stats = top_k((rng.random() for _ in range(stream)), k)
+    print(f"top-{k} of {stats['seen']:,} streamed values: {stats['pushed']} heap entries, "
+          f"{stats['wall_seconds']:.2f}s ({stats['seen'] / stats['wall_seconds']:,.0f} values/s)")
+    sample = np.random.default_rng(0).random(stream)
+    start = time.perf_counter()
+    nth_element_numpy(sample, stream - k)
+    print(f"numpy partition of {stream:,} values: {time.perf_counter() - start:.3f}s")
+    return rows, stats
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
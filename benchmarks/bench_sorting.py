@@ -0,0 +1,217 @@
+"""
+Benchmark every sorting generator across input sizes and distributions.
+
+For each (algorithm, distribution, n) it records comparisons, swaps,
+writes and wall time from a count-only run, frames/sec from a traced run
+(up to --trace-limit elements) and peak memory under tracemalloc. Every
+result is checked against sorted(). A case that runs past --time-limit
+is recorded as an error and the larger sizes of that algorithm and
+distribution are skipped. Results go to a JSON file; with
+--baseline, any result that regresses by more than --threshold fails the
+run (exit code 1), as does any incorrect output.
+
+Run from the project root:
+    python benchmarks/bench_sorting.py --sizes 10 100 1000 --output bench.json
+    python benchmarks/bench_sorting.py --baseline bench.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.algorithms.sorting import (
+    CaseTimeout,
+    _time_limited,
+    count_only,
+    insertion_sort_frames,
+    bubble_sort_frames,
+    selection_sort_frames,
+    merge_sort_frames,
+    quick_sort_frames,
+    heap_sort_frames,
+    counting_sort_frames,
+    radix_sort_frames,
+    shell_sort_frames,
+    intro_sort_frames,
+    tim_sort_frames,
+    pdq_sort_frames,
+)
+from core.algorithms.parallel_sort import parallel_merge_sort_frames
+from core.algorithms.sorting_network import sorting_network_frames
+from core.utils.inputs import DISTRIBUTIONS, make_input
+
+# name -> (generator, quadratic); quadratic sorts stop at --quadratic-limit
+ALGORITHMS = {
+    "insertion": (insertion_sort_frames, True),
+    "bubble": (bubble_sort_frames, True),
+    "selection": (selection_sort_frames, True),
+    "merge": (merge_sort_frames, False),
+    # End pivots are quadratic on sorted input; with median-of-three the
+    # quick sort rows compare partition schemes rather than pivot luck
+    "quick": (partial(quick_sort_frames, pivot_strategy="median3"), False),
+    "quick_3way": (partial(quick_sort_frames, pivot_strategy="median3", partition="three_way"), False),
+    "quick_dual": (partial(quick_sort_frames, pivot_strategy="median3", partition="dual_pivot"), False),
+    "heap": (heap_sort_frames, False),
+    "heap_classic": (partial(heap_sort_frames, sift="classic"), False),
+    "counting": (counting_sort_frames, False),
+    "radix": (radix_sort_frames, False),
+    "shell": (shell_sort_frames, False),
+    "intro": (intro_sort_frames, False),
+    "tim": (tim_sort_frames, False),
+    "pdq": (pdq_sort_frames, False),
+    # Each run starts its own process pool, and peak_bytes only sees this
+    # process, not the lane workers
+    "parallel": (partial(parallel_merge_sort_frames, lanes=4), False),
+    # O(n log^2 n) comparators, whatever the input order
+    "bitonic": (partial(sorting_network_frames, network="bitonic"), False),
+    "odd_even": (partial(sorting_network_frames, network="odd_even_merge"), False),
+}
+
+# Largest n traced for frames/sec per algorithm, below --trace-limit: the
+# parallel lanes ship their whole frame lists back from the workers
+TRACE_LIMITS = {"parallel": 1_000}
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+# Deterministic counts regress on any change beyond the threshold; timings
+# and memory below these floors are too noisy to compare
+CHECKED = {"comparisons": 0, "swaps": 0, "writes": 0, "wall_seconds": 0.05, "peak_bytes": 1 << 20}
+
+
+def measure(sort, arr, trace_limit, memory, time_limit=None):
+    row = {}
+    sort = _time_limited(sort, None if time_limit is None else time.perf_counter() + time_limit)
+    values, counts = count_only(sort, arr)
+    row["correct"] = values == sorted(arr)
+    row.update(counts)
+    if memory:
+        tracemalloc.start()
+        count_only(sort, arr)
+        row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if len(arr) <= trace_limit:
+        start = time.perf_counter()
+        frames = sum(1 for _ in sort(arr))
+        elapsed = time.perf_counter() - start
+        row["frames"] = frames
+        row["frames_per_sec"] = frames / elapsed if elapsed else None
+    return row
+
+
+def run_suite(algorithms=None, distributions=DISTRIBUTIONS, sizes=SIZES, seed=0, swaps=10,
+              trace_limit=10_000, quadratic_limit=3_000, memory=True, time_limit=60.0, log=print):
+    results = []
+    for name in algorithms or ALGORITHMS:
+        sort, quadratic = ALGORITHMS[name]
+        traced = min(trace_limit, TRACE_LIMITS.get(name, trace_limit))
+        for distribution in distributions:
+            timed_out = None
+            for n in sorted(sizes):
+                if quadratic and n > quadratic_limit:
+                    continue
+                row = {"algorithm": name, "distribution": distribution, "n": n}
+                if timed_out is not None:
+                    row["error"] = f"skipped: n={timed_out} ran past {time_limit:g}s"
+                else:
+                    arr = make_input(distribution, n, seed, swaps)
+                    try:
+                        row.update(measure(sort, arr, traced, memory, time_limit))
+                    except CaseTimeout:
+                        timed_out = n
+                        row["error"] = f"CaseTimeout: ran past {time_limit:g}s"
+                    except RecursionError as exc:
+                        row["error"] = f"{type(exc).__name__}: {exc}"
+                results.append(row)
+                if log:
+                    log(format_row(row))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "swaps": swaps,
+            "time_limit": time_limit,
+        },
+        "results": results,
+    }
+
+
+def format_row(row):
+    head = f"{row['algorithm']:>10} {row['distribution']:>13} n={row['n']:<8}"
+    if "error" in row:
+        return f"{head} ERROR {row['error']}"
+    fps = row.get("frames_per_sec")
+    return (f"{head} {row['wall_seconds']:9.4f}s  cmp={row['comparisons']:<11} "
+            f"swp={row['swaps']:<10} wr={row['writes']:<10} "
+            f"peak={row.get('peak_bytes', 0) / 1024:9.1f}KiB  "
+            f"fps={'-' if fps is None else f'{fps:,.0f}'}"
+            f"{'' if row['correct'] else '  WRONG'}")
+
+
+def compare(report, baseline, threshold):
+    """Return human-readable failures: wrong output, new errors, and regressions beyond threshold."""
+    failures = []
+    before = {(r["algorithm"], r["distribution"], r["n"]): r for r in baseline["results"]}
+    for row in report["results"]:
+        key = (row["algorithm"], row["distribution"], row["n"])
+        label = "{} {} n={}".format(*key)
+        if "error" in row:
+            if key in before and "error" not in before[key]:
+                failures.append(f"{label}: {row['error']}")
+            continue
+        if not row["correct"]:
+            failures.append(f"{label}: output differs from sorted()")
+        old = before.get(key)
+        if old is None or "error" in old:
+            continue
+        for metric, floor in CHECKED.items():
+            if metric not in row or metric not in old:
+                continue
+            if max(row[metric], old[metric]) < floor:
+                continue
+            if row[metric] > old[metric] * (1 + threshold):
+                failures.append(f"{label}: {metric} {old[metric]} -> {row[metric]}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--swaps", type=int, default=10, help="swaps applied to nearly_sorted inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-limit", type=int, default=10_000, help="largest n traced for frames/sec")
+    parser.add_argument("--quadratic-limit", type=int, default=3_000, help="largest n for O(n^2) sorts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--time-limit", type=float, default=60.0,
+                        help="seconds per case before it is abandoned (larger n are then skipped)")
+    parser.add_argument("--output", default="bench_sorting.json")
+    parser.add_argument("--baseline", help="earlier --output file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.algorithms, args.distributions, args.sizes, args.seed, args.swaps,
+                       args.trace_limit, args.quadratic_limit, not args.no_memory, args.time_limit)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+
+    failures = [f"{r['algorithm']} {r['distribution']} n={r['n']}: output differs from sorted()"
+                for r in report["results"] if "error" not in r and not r["correct"]]
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(report, json.load(f), args.threshold)
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
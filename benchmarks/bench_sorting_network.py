@@ -0,0 +1,44 @@
+"""
+Batch sorting of many small arrays: the layer-at-a-time NumPy sorting
+networks against np.sort along rows and a Python sorted() per row.
+
+Run from the project root:  python benchmarks/bench_sorting_network.py [rows]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.algorithms.sorting_network import NETWORKS, network_layers, network_sort_numpy
+
+
+def main(rows=100_000, widths=(8, 16, 32, 64)):
+    rng = np.random.default_rng(0)
+    results = []
+    for n in widths:
+        batch = rng.random((rows, n))
+        expected = np.sort(batch, axis=1)
+        timings = {}
+        for network in NETWORKS:
+            start = time.perf_counter()
+            out = network_sort_numpy(batch, network)
+            timings[network] = time.perf_counter() - start
+            assert (out == expected).all()
+        start = time.perf_counter()
+        np.sort(batch, axis=1)
+        timings["np.sort"] = time.perf_counter() - start
+        start = time.perf_counter()
+        [sorted(row) for row in batch.tolist()]
+        timings["sorted"] = time.perf_counter() - start
+        results.append((n, timings))
+        layers = "/".join(str(len(network_layers(n, network))) for network in NETWORKS)
+        print(f"n={n:<3} layers={layers:<6} " + "  ".join(
+            f"{name} {seconds * 1000:8.1f}ms" for name, seconds in timings.items()))
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
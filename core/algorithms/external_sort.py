@@ -0,0 +1,136 @@
+import heapq
+import os
+import shutil
+import tempfile
+from itertools import islice
+
+from core.models.frame import Frame, OP_INFO, OP_WRITE
+from core.models.budget import budgeted
+from core.algorithms.sorting import Counted
+
+
+# ------------------------------------------------------
+# Run files: one integer per line, ASCII
+# ------------------------------------------------------
+def write_ints(path, values):
+    """Write integers one per line; returns the number of bytes written."""
+    written = 0
+    with open(path, "w") as f:
+        for value in values:
+            line = f"{value}\n"
+            f.write(line)
+            written += len(line)
+    return written
+
+
+def _read_ints(path, io):
+    # io["read"] counts bytes as lines are consumed
+    with open(path) as f:
+        for line in f:
+            io["read"] += len(line)
+            yield int(line)
+
+
+def _write_run(path, values, io):
+    io["written"] += write_ints(path, values)
+
+
+# ------------------------------------------------------
+# External Merge Sort
+# Pass 0 reads chunk_size integers at a time, sorts each chunk in memory
+# and writes it as a run file. Every later pass k-way merges groups of
+# fan_in runs with a heap, until a single run is left. Memory stays at
+# one chunk (pass 0) or fan_in read buffers (merge passes).
+#
+# Frames are per run and per pass, never per element: the view is the
+# length of each run on disk, and metrics carry the comparisons, element
+# writes and bytes moved by that step.
+# ------------------------------------------------------
+@budgeted("pass")
+def external_sort_frames(path, out_path, chunk_size=100_000, fan_in=8,
+                         count_comparisons=True, tmp_dir=None):
+    if chunk_size < 1 or fan_in < 2:
+        raise ValueError("chunk_size must be >= 1 and fan_in >= 2")
+    work = tempfile.mkdtemp(prefix="extsort-", dir=tmp_dir)
+    step = 0
+    try:
+        runs = []      # (path, length) of the runs of the current pass
+        io = {"read": 0, "written": 0}
+        with open(path) as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                read = sum(len(line) for line in lines)
+                comparisons = [0]
+                if count_comparisons:
+                    chunk = [Counted(int(line), comparisons) for line in lines]
+                    chunk.sort()
+                    chunk = [item.value for item in chunk]
+                else:
+                    chunk = sorted(int(line) for line in lines)
+                del lines
+                run = os.path.join(work, f"p0-r{len(runs)}")
+                before = io["written"]
+                _write_run(run, chunk, io)
+                runs.append((run, len(chunk)))
+                io["read"] += read
+                yield Frame(step, [length for _, length in runs],
+                            ("Pass 0: sorted chunk {} into a run of {}", len(runs) - 1, len(chunk)),
+                            {"pass": 0, "run": len(runs) - 1, "runs": len(runs)},
+                            {"comparisons": comparisons[0], "writes": len(chunk),
+                             "bytes_read": read, "bytes_written": io["written"] - before},
+                            {"swap": [len(runs) - 1]}, OP_WRITE)
+                step += 1
+        yield Frame(step, [length for _, length in runs],
+                    ("Pass 0 done: {} runs, {} bytes read, {} bytes written", len(runs), io["read"], io["written"]),
+                    {"pass": 0, "runs": len(runs), "bytes_read": io["read"], "bytes_written": io["written"]},
+                    {}, {}, OP_INFO)
+        step += 1
+
+        p = 0
+        while len(runs) > 1:
+            p += 1
+            io = {"read": 0, "written": 0}
+            merged = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                comparisons = [0]
+                read_before, written_before = io["read"], io["written"]
+                streams = [_read_ints(run, io) for run, _ in group]
+                if count_comparisons:
+                    streams = [(Counted(v, comparisons) for v in stream) for stream in streams]
+                    values = (item.value for item in heapq.merge(*streams))
+                else:
+                    values = heapq.merge(*streams)
+                run = os.path.join(work, f"p{p}-r{len(merged)}")
+                _write_run(run, values, io)
+                for old, _ in group:
+                    os.remove(old)
+                length = sum(n for _, n in group)
+                merged.append((run, length))
+                lengths = [n for _, n in merged] + [n for _, n in runs[g + fan_in:]]
+                yield Frame(step, lengths,
+                            ("Pass {}: merged {} runs into one of {}", p, len(group), length),
+                            {"pass": p, "run": len(merged) - 1, "runs": len(lengths)},
+                            {"comparisons": comparisons[0], "writes": length,
+                             "bytes_read": io["read"] - read_before,
+                             "bytes_written": io["written"] - written_before},
+                            {"swap": [len(merged) - 1]}, OP_WRITE)
+                step += 1
+            runs = merged
+            yield Frame(step, [n for _, n in runs],
+                        ("Pass {} done: {} runs, {} bytes read, {} bytes written", p, len(runs), io["read"], io["written"]),
+                        {"pass": p, "runs": len(runs), "bytes_read": io["read"], "bytes_written": io["written"]},
+                        {}, {}, OP_INFO)
+            step += 1
+
+        if runs:
+            shutil.move(runs[0][0], out_path)
+        else:
+            open(out_path, "w").close()
+        total = runs[0][1] if runs else 0
+        yield Frame(step, [total], ("Sorted {} integers into {}", total, out_path),
+                    {"pass": "done", "passes": p + 1}, {}, {}, OP_INFO)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
@@ -1,7 +1,8 @@
 from typing import Generator, Dict, Any, List, Tuple
 from collections import deque, defaultdict
 import heapq
-from core.models.frame import Frame
+from core.models.frame import Frame, OP_VISIT
+from core.models.budget import budgeted
 
 # Helper to build highlights dict (from your searching.py)
 def HL(**kwargs) -> Dict[str, Any]:
@@ -19,6 +20,7 @@ class Graph:
     def get_nodes(self):
         return list(self.graph.keys())
 
+    @budgeted("current")
     def bfs_frames(self, start) -> Generator[Frame, None, None]:
         visited = set()
         queue = deque([start])
@@ -28,9 +30,9 @@ class Graph:
         yield Frame(
             step=step,
             view=self.graph,
-            narration=f"Start BFS from node {start}.",
+            narration=("Start BFS from node {}.", start),
             data={"queue": list(queue)},
-            metrics={"visited": len(visited)},
+            metrics={"visited": 1},
             highlights={start: "yellow"},  # Current
         )
         step += 1
@@ -40,10 +42,10 @@ class Graph:
             yield Frame(
                 step=step,
                 view=self.graph,
-                narration=f"Visit node {current}.",
+                narration=("Visit node {}.", current),
                 data={"queue": list(queue), "current": current},
-                metrics={"visited": len(visited)},
                 highlights={current: "green"},  # Visited
+                op=OP_VISIT,
             )
             step += 1
 
@@ -54,9 +56,9 @@ class Graph:
                     yield Frame(
                         step=step,
                         view=self.graph,
-                        narration=f"Enqueue neighbor {neighbor}.",
+                        narration=("Enqueue neighbor {}.", neighbor),
                         data={"queue": list(queue)},
-                        metrics={"visited": len(visited)},
+                        metrics={"visited": 1},
                         highlights={neighbor: "yellow"},
                     )
                     step += 1
@@ -66,10 +68,10 @@ class Graph:
             view=self.graph,
             narration="BFS complete.",
             data={},
-            metrics={"visited": len(visited)},
             highlights={},
         )
 
+    @budgeted("current")
     def dfs_frames(self, start) -> Generator[Frame, None, None]:
         visited = set()
         stack = [start]
@@ -78,9 +80,8 @@ class Graph:
         yield Frame(
             step=step,
             view=self.graph,
-            narration=f"Start DFS from node {start}.",
+            narration=("Start DFS from node {}.", start),
             data={"stack": stack},
-            metrics={"visited": 0},
             highlights={start: "yellow"},
         )
         step += 1
@@ -92,10 +93,11 @@ class Graph:
                 yield Frame(
                     step=step,
                     view=self.graph,
-                    narration=f"Visit node {current}.",
+                    narration=("Visit node {}.", current),
                     data={"stack": stack, "current": current},
-                    metrics={"visited": len(visited)},
+                    metrics={"visited": 1},
                     highlights={current: "green"},
+                    op=OP_VISIT,
                 )
                 step += 1
 
@@ -106,9 +108,8 @@ class Graph:
                     yield Frame(
                         step=step,
                         view=self.graph,
-                        narration=f"Push neighbor {neighbor}.",
+                        narration=("Push neighbor {}.", neighbor),
                         data={"stack": stack},
-                        metrics={"visited": len(visited)},
                         highlights={neighbor: "yellow"},
                     )
                     step += 1
@@ -123,10 +124,10 @@ class Graph:
             view=self.graph,
             narration="DFS complete.",
             data={},
-            metrics={"visited": len(visited)},
             highlights={},
         )
 
+    @budgeted("current")
     def dijkstra_frames(self, start) -> Generator[Frame, None, None]:
         distances = {node: float('inf') for node in self.graph}
         distances[start] = 0
@@ -136,9 +137,8 @@ class Graph:
         yield Frame(
             step=step,
             view=self.graph,
-            narration=f"Start Dijkstra from node {start}.",
+            narration=("Start Dijkstra from node {}.", start),
             data={"distances": distances},
-            metrics={"updated": 0},
             highlights={start: "yellow"},
         )
         step += 1
@@ -151,10 +151,10 @@ class Graph:
             yield Frame(
                 step=step,
                 view=self.graph,
-                narration=f"Process node {current} with dist {dist}.",
+                narration=("Process node {} with dist {}.", current, dist),
                 data={"current": current, "dist": dist},
-                metrics={"updated": len(distances)},
                 highlights={current: "green"},
+                op=OP_VISIT,
             )
             step += 1
 
@@ -166,9 +166,9 @@ class Graph:
                     yield Frame(
                         step=step,
                         view=self.graph,
-                        narration=f"Update dist to {neighbor} as {new_dist}.",
+                        narration=("Update dist to {} as {}.", neighbor, new_dist),
                         data={"updated": neighbor, "new_dist": new_dist},
-                        metrics={"updated": len(distances)},
+                        metrics={"updated": 1},
                         highlights={neighbor: "yellow"},
                     )
                     step += 1
@@ -178,7 +178,6 @@ class Graph:
             view=self.graph,
             narration="Dijkstra complete.",
             data={"final_distances": distances},
-            metrics={},
             highlights={},
         )
 
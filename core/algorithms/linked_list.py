@@ -1,5 +1,6 @@
 from typing import Generator, List, Any, Optional
 from core.models.frame import Frame
+from core.models.budget import budgeted
 
 
 def _f(step, values, desc, hl=None, vars=None, stats=None):
@@ -13,6 +14,18 @@ def _f(step, values, desc, hl=None, vars=None, stats=None):
     )
 
 
+class _Tally:
+    """Turns a generator's running counters into per-frame metric deltas."""
+
+    def __init__(self):
+        self.last = {}
+
+    def __call__(self, **totals):
+        delta = {k: v - self.last.get(k, 0) for k, v in totals.items() if v != self.last.get(k, 0)}
+        self.last.update(totals)
+        return delta
+
+
 class Node:
     def __init__(self, value: Any):
         self.value = value
@@ -35,8 +48,10 @@ class SinglyLinkedList:
         return result
 
     # Insert at head
+    @budgeted()
     def insert_head_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
 
         current_list = self.to_list()
@@ -46,7 +61,7 @@ class SinglyLinkedList:
             step, current_list, "Start: insert at head (singly linked)",
             hl={"head": 0 if current_list else None},
             vars={"new_value": x, "old_head": 0 if current_list else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         # New head and link
@@ -58,17 +73,19 @@ class SinglyLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"New head {x} points to old head",
+            step, new_list, ("New head {} points to old head", x),
             hl={"head": 0},
             vars={"new_head": 0, "next_of_head": 1 if len(new_list) > 1 else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Insert at tail
+    @budgeted()
     def insert_tail_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
         current_list = self.to_list()
         tail_idx = len(current_list) - 1 if current_list else None
@@ -77,7 +94,7 @@ class SinglyLinkedList:
             step, current_list, "Start: insert at tail (singly linked)",
             hl={"tail": tail_idx},
             vars={"new_value": x, "tail": tail_idx},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         new_node = Node(x)
@@ -89,25 +106,27 @@ class SinglyLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"Append {x} at tail",
+            step, new_list, ("Append {} at tail", x),
             hl={"tail": len(new_list) - 1},
             vars={"old_tail": tail_idx, "new_tail": len(new_list) - 1},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Search first occurrence
+    @budgeted("i")
     def search_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         current_list = self.to_list()
 
         yield _f(
-            step, current_list, f"Start: search for {x} (singly linked)",
+            step, current_list, ("Start: search for {} (singly linked)", x),
             hl={"head": 0 if current_list else None},
             vars={"target": x, "i": None, "val": None},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
         current = self.head
@@ -115,32 +134,34 @@ class SinglyLinkedList:
         while current:
             comps += 1
             yield _f(
-                step, current_list, f"Check node {i}",
+                step, current_list, ("Check node {}", i),
                 hl={"current": i},
                 vars={"target": x, "i": i, "val": current.value},
-                stats={"comparisons": comps}
+                stats=tally(comparisons=comps)
             ); step += 1
 
             if current.value == x:
                 yield _f(
-                    step, current_list, f"Found {x} at index {i}",
+                    step, current_list, ("Found {} at index {}", x, i),
                     hl={"found": i},
                     vars={"target": x, "i": i},
-                    stats={"comparisons": comps}
+                    stats=tally(comparisons=comps)
                 ); step += 1
                 return
             current = current.next
             i += 1
 
         yield _f(
-            step, current_list, f"{x} not found",
+            step, current_list, ("{} not found", x),
             vars={"target": x},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
     # Delete first occurrence by value
+    @budgeted("curr")
     def delete_value_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         deletes = 0
         links_changed = 0
@@ -150,15 +171,15 @@ class SinglyLinkedList:
             yield _f(
                 step, current_list, "List empty; nothing to delete (singly linked)",
                 vars={"target": x},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
         yield _f(
-            step, current_list, f"Start: delete value {x} (singly linked)",
+            step, current_list, ("Start: delete value {} (singly linked)", x),
             hl={"head": 0, "tail": len(current_list) - 1},
             vars={"target": x, "prev": None, "curr": 0},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
         # Compare head
@@ -171,20 +192,20 @@ class SinglyLinkedList:
                 self.tail = None
             new_list = self.to_list()
             yield _f(
-                step, current_list, f"Compare head with {x}",
+                step, current_list, ("Compare head with {}", x),
                 hl={"current": 0, "head": 0},
                 vars={"target": x, "prev": None, "curr": 0, "val": current_list[0]},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
-                step, new_list, f"Delete head {x}",
+                step, new_list, ("Delete head {}", x),
                 hl={"head": 0 if new_list else None},
                 vars={"new_head": 0 if new_list else None},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
                 step, new_list, "Done.",
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
@@ -198,7 +219,7 @@ class SinglyLinkedList:
                 step, current_list, "Traverse: move prev/curr forward",
                 hl={"prev": i-1, "current": i},
                 vars={"target": x, "prev": i-1, "curr": i, "val": current.value},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
 
             if current.value == x:
@@ -209,20 +230,20 @@ class SinglyLinkedList:
                     self.tail = prev
                 new_list = self.to_list()
                 yield _f(
-                    step, current_list, f"Found {x} at {i}; unlink it",
+                    step, current_list, ("Found {} at {}; unlink it", x, i),
                     hl={"prev": i-1, "current": i},
                     vars={"target": x, "prev": i-1, "curr": i},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Node removed; prev.next skips current",
                     hl={"prev": i-1 if i-1 < len(new_list) else None, "tail": len(new_list) - 1 if new_list else None},
                     vars={"new_length": len(new_list)},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Done.",
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 return
 
@@ -231,9 +252,9 @@ class SinglyLinkedList:
             i += 1
 
         yield _f(
-            step, current_list, f"{x} not found; no deletion",
+            step, current_list, ("{} not found; no deletion", x),
             vars={"target": x},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
 
@@ -252,8 +273,10 @@ class DoublyLinkedList:
         return result
 
     # Insert at head
+    @budgeted()
     def insert_head_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
 
         current_list = self.to_list()
@@ -263,7 +286,7 @@ class DoublyLinkedList:
             step, current_list, "Start: insert at head (doubly linked)",
             hl={"head": 0 if current_list else None},
             vars={"new_value": x, "old_head": 0 if current_list else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         new_node = Node(x)
@@ -276,17 +299,19 @@ class DoublyLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"New head {x} points to old head; old head.prev to new",
+            step, new_list, ("New head {} points to old head; old head.prev to new", x),
             hl={"head": 0},
             vars={"new_head": 0, "next_of_head": 1 if len(new_list) > 1 else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Insert at tail
+    @budgeted()
     def insert_tail_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
         current_list = self.to_list()
         tail_idx = len(current_list) - 1 if current_list else None
@@ -295,7 +320,7 @@ class DoublyLinkedList:
             step, current_list, "Start: insert at tail (doubly linked)",
             hl={"tail": tail_idx},
             vars={"new_value": x, "tail": tail_idx},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         new_node = Node(x)
@@ -308,25 +333,27 @@ class DoublyLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"Append {x} at tail; new.prev to old tail; old.next to new",
+            step, new_list, ("Append {} at tail; new.prev to old tail; old.next to new", x),
             hl={"tail": len(new_list) - 1},
             vars={"old_tail": tail_idx, "new_tail": len(new_list) - 1},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Search first occurrence
+    @budgeted("i")
     def search_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         current_list = self.to_list()
 
         yield _f(
-            step, current_list, f"Start: search for {x} (doubly linked)",
+            step, current_list, ("Start: search for {} (doubly linked)", x),
             hl={"head": 0 if current_list else None},
             vars={"target": x, "i": None, "val": None},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
         current = self.head
@@ -334,32 +361,34 @@ class DoublyLinkedList:
         while current:
             comps += 1
             yield _f(
-                step, current_list, f"Check node {i}",
+                step, current_list, ("Check node {}", i),
                 hl={"current": i},
                 vars={"target": x, "i": i, "val": current.value},
-                stats={"comparisons": comps}
+                stats=tally(comparisons=comps)
             ); step += 1
 
             if current.value == x:
                 yield _f(
-                    step, current_list, f"Found {x} at index {i}",
+                    step, current_list, ("Found {} at index {}", x, i),
                     hl={"found": i},
                     vars={"target": x, "i": i},
-                    stats={"comparisons": comps}
+                    stats=tally(comparisons=comps)
                 ); step += 1
                 return
             current = current.next
             i += 1
 
         yield _f(
-            step, current_list, f"{x} not found",
+            step, current_list, ("{} not found", x),
             vars={"target": x},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
     # Delete first occurrence by value
+    @budgeted("curr")
     def delete_value_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         deletes = 0
         links_changed = 0
@@ -369,15 +398,15 @@ class DoublyLinkedList:
             yield _f(
                 step, current_list, "List empty; nothing to delete (doubly linked)",
                 vars={"target": x},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
         yield _f(
-            step, current_list, f"Start: delete value {x} (doubly linked)",
+            step, current_list, ("Start: delete value {} (doubly linked)", x),
             hl={"head": 0, "tail": len(current_list) - 1},
             vars={"target": x, "prev": None, "curr": 0},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
         # Compare head
@@ -392,20 +421,20 @@ class DoublyLinkedList:
                 self.tail = None
             new_list = self.to_list()
             yield _f(
-                step, current_list, f"Compare head with {x}",
+                step, current_list, ("Compare head with {}", x),
                 hl={"current": 0, "head": 0},
                 vars={"target": x, "prev": None, "curr": 0, "val": current_list[0]},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
-                step, new_list, f"Delete head {x}; update new head.prev to None",
+                step, new_list, ("Delete head {}; update new head.prev to None", x),
                 hl={"head": 0 if new_list else None},
                 vars={"new_head": 0 if new_list else None},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
                 step, new_list, "Done.",
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
@@ -418,7 +447,7 @@ class DoublyLinkedList:
                 step, current_list, "Traverse: check current",
                 hl={"current": i},
                 vars={"target": x, "curr": i, "val": current.value},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
 
             if current.value == x:
@@ -432,20 +461,20 @@ class DoublyLinkedList:
                     self.tail = current.prev
                 new_list = self.to_list()
                 yield _f(
-                    step, current_list, f"Found {x} at {i}; unlink it (update prev.next and next.prev)",
+                    step, current_list, ("Found {} at {}; unlink it (update prev.next and next.prev)", x, i),
                     hl={"current": i},
                     vars={"target": x, "curr": i},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Node removed; links updated",
                     hl={"tail": len(new_list) - 1 if new_list else None},
                     vars={"new_length": len(new_list)},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Done.",
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 return
 
@@ -453,9 +482,9 @@ class DoublyLinkedList:
             i += 1
 
         yield _f(
-            step, current_list, f"{x} not found; no deletion",
+            step, current_list, ("{} not found; no deletion", x),
             vars={"target": x},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
 
@@ -478,8 +507,10 @@ class CircularLinkedList:
         return result
 
     # Insert at head
+    @budgeted()
     def insert_head_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
 
         current_list = self.to_list()
@@ -489,7 +520,7 @@ class CircularLinkedList:
             step, current_list, "Start: insert at head (circular linked)",
             hl={"head": 0 if current_list else None, "circular": len(current_list) - 1 if current_list else None},
             vars={"new_value": x, "old_head": 0 if current_list else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         new_node = Node(x)
@@ -504,17 +535,19 @@ class CircularLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"New head {x} points to old head; tail points to new head",
+            step, new_list, ("New head {} points to old head; tail points to new head", x),
             hl={"head": 0, "circular": len(new_list) - 1},
             vars={"new_head": 0, "next_of_head": 1 if len(new_list) > 1 else None},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Insert at tail
+    @budgeted()
     def insert_tail_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         inserts = 0
         current_list = self.to_list()
         tail_idx = len(current_list) - 1 if current_list else None
@@ -523,7 +556,7 @@ class CircularLinkedList:
             step, current_list, "Start: insert at tail (circular linked)",
             hl={"tail": tail_idx, "circular": tail_idx if current_list else None},
             vars={"new_value": x, "tail": tail_idx},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
         new_node = Node(x)
@@ -538,32 +571,34 @@ class CircularLinkedList:
         inserts += 1
         new_list = self.to_list()
         yield _f(
-            step, new_list, f"Append {x} at tail; new tail points to head",
+            step, new_list, ("Append {} at tail; new tail points to head", x),
             hl={"tail": len(new_list) - 1, "circular": len(new_list) - 1},
             vars={"old_tail": tail_idx, "new_tail": len(new_list) - 1},
-            stats={"insertions": inserts}
+            stats=tally(insertions=inserts)
         ); step += 1
 
-        yield _f(step, new_list, "Done.", stats={"insertions": inserts}); step += 1
+        yield _f(step, new_list, "Done.", stats=tally(insertions=inserts)); step += 1
 
     # Search first occurrence
+    @budgeted("i")
     def search_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         current_list = self.to_list()
 
         yield _f(
-            step, current_list, f"Start: search for {x} (circular linked)",
+            step, current_list, ("Start: search for {} (circular linked)", x),
             hl={"head": 0 if current_list else None},
             vars={"target": x, "i": None, "val": None},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
         if not self.head:
             yield _f(
-                step, current_list, f"{x} not found (empty list)",
+                step, current_list, ("{} not found (empty list)", x),
                 vars={"target": x},
-                stats={"comparisons": comps}
+                stats=tally(comparisons=comps)
             ); step += 1
             return
 
@@ -572,18 +607,18 @@ class CircularLinkedList:
         while True:
             comps += 1
             yield _f(
-                step, current_list, f"Check node {i}",
+                step, current_list, ("Check node {}", i),
                 hl={"current": i},
                 vars={"target": x, "i": i, "val": current.value},
-                stats={"comparisons": comps}
+                stats=tally(comparisons=comps)
             ); step += 1
 
             if current.value == x:
                 yield _f(
-                    step, current_list, f"Found {x} at index {i}",
+                    step, current_list, ("Found {} at index {}", x, i),
                     hl={"found": i},
                     vars={"target": x, "i": i},
-                    stats={"comparisons": comps}
+                    stats=tally(comparisons=comps)
                 ); step += 1
                 return
             current = current.next
@@ -592,14 +627,16 @@ class CircularLinkedList:
                 break
 
         yield _f(
-            step, current_list, f"{x} not found",
+            step, current_list, ("{} not found", x),
             vars={"target": x},
-            stats={"comparisons": comps}
+            stats=tally(comparisons=comps)
         ); step += 1
 
     # Delete first occurrence by value
+    @budgeted("curr")
     def delete_value_frames(self, x: Any) -> Generator[Frame, None, None]:
         step = 0
+        tally = _Tally()
         comps = 0
         deletes = 0
         links_changed = 0
@@ -609,15 +646,15 @@ class CircularLinkedList:
             yield _f(
                 step, current_list, "List empty; nothing to delete (circular linked)",
                 vars={"target": x},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
         yield _f(
-            step, current_list, f"Start: delete value {x} (circular linked)",
+            step, current_list, ("Start: delete value {} (circular linked)", x),
             hl={"head": 0, "tail": len(current_list) - 1},
             vars={"target": x, "prev": None, "curr": 0},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
         # Compare head
@@ -632,20 +669,20 @@ class CircularLinkedList:
                 self.tail.next = self.head
             new_list = self.to_list()
             yield _f(
-                step, current_list, f"Compare head with {x}",
+                step, current_list, ("Compare head with {}", x),
                 hl={"current": 0, "head": 0},
                 vars={"target": x, "prev": None, "curr": 0, "val": current_list[0]},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
-                step, new_list, f"Delete head {x}; tail points to new head",
+                step, new_list, ("Delete head {}; tail points to new head", x),
                 hl={"head": 0 if new_list else None},
                 vars={"new_head": 0 if new_list else None},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             yield _f(
                 step, new_list, "Done.",
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
             return
 
@@ -659,7 +696,7 @@ class CircularLinkedList:
                 step, current_list, "Traverse: check current",
                 hl={"prev": i-1, "current": i},
                 vars={"target": x, "prev": i-1, "curr": i, "val": current.value},
-                stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
             ); step += 1
 
             if current.value == x:
@@ -670,20 +707,20 @@ class CircularLinkedList:
                     self.tail = prev
                 new_list = self.to_list()
                 yield _f(
-                    step, current_list, f"Found {x} at {i}; unlink it (prev.next to current.next)",
+                    step, current_list, ("Found {} at {}; unlink it (prev.next to current.next)", x, i),
                     hl={"prev": i-1, "current": i},
                     vars={"target": x, "prev": i-1, "curr": i},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Node removed; links updated",
                     hl={"tail": len(new_list) - 1 if new_list else None},
                     vars={"new_length": len(new_list)},
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 yield _f(
                     step, new_list, "Done.",
-                    stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+                    stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
                 ); step += 1
                 return
 
@@ -692,9 +729,9 @@ class CircularLinkedList:
             i += 1
 
         yield _f(
-            step, current_list, f"{x} not found; no deletion",
+            step, current_list, ("{} not found; no deletion", x),
             vars={"target": x},
-            stats={"comparisons": comps, "deletions": deletes, "links_changed": links_changed}
+            stats=tally(comparisons=comps, deletions=deletes, links_changed=links_changed)
         ); step += 1
 
 
@@ -0,0 +1,167 @@
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.models.frame import OP_INFO, OP_WRITE
+from core.models.budget import budgeted
+from core.algorithms.sorting import Counted, _mode, _yield_array, count_only, merge_sort_frames
+
+
+# ------------------------------------------------------
+# Lanes: the input is cut into contiguous chunks, one per worker
+# ------------------------------------------------------
+def lane_bounds(n, lanes):
+    """[lo, hi) of each lane; the first n % lanes lanes get one extra element."""
+    lanes = max(1, min(lanes, n)) if n else 1
+    size, extra = divmod(n, lanes)
+    bounds = []
+    lo = 0
+    for lane in range(lanes):
+        hi = lo + size + (lane < extra)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+def _merge_sort_list(values):
+    # Plain top-down merge sort: the per-chunk work of the headless mode
+    if len(values) <= 1:
+        return list(values)
+    mid = len(values) // 2
+    left = _merge_sort_list(values[:mid])
+    right = _merge_sort_list(values[mid:])
+    out = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            out.append(right[j])
+            j += 1
+        else:
+            out.append(left[i])
+            i += 1
+    out.extend(left[i:])
+    out.extend(right[j:])
+    return out
+
+
+def _sort_chunk(chunk):
+    start = time.perf_counter()
+    out = _merge_sort_list(chunk)
+    return out, time.perf_counter() - start
+
+
+def _trace_chunk(chunk):
+    # Frames pickle fine (slots only), so workers ship them back whole
+    return list(merge_sort_frames(chunk))
+
+
+def _count_chunk(chunk):
+    values, counts = count_only(merge_sort_frames, chunk)
+    del counts["wall_seconds"]
+    return values, counts
+
+
+def _kway_merge(runs):
+    """Heap merge of sorted runs; yields (value, run index). Ties go to the lower run, so it is stable."""
+    heap = [(run[0], r, 0) for r, run in enumerate(runs) if run]
+    heapq.heapify(heap)
+    while heap:
+        value, r, i = heap[0]
+        yield value, r
+        if i + 1 < len(runs[r]):
+            heapq.heapreplace(heap, (runs[r][i + 1], r, i + 1))
+        else:
+            heapq.heappop(heap)
+
+
+# ------------------------------------------------------
+# Headless: throughput on large arrays
+# ------------------------------------------------------
+def parallel_merge_sort(values, workers=None, executor=None):
+    """
+    Sort ``values`` by merge-sorting one chunk per worker process, then
+    k-way merging the sorted chunks with a heap.
+
+    Returns (sorted list, stats) where stats has the lane count, the wall
+    time of each chunk sort, the merge time and the total wall time.
+    """
+    workers = workers or os.cpu_count() or 1
+    values = list(values)
+    chunks = [values[lo:hi] for lo, hi in lane_bounds(len(values), workers)]
+    start = time.perf_counter()
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = list(pool.map(_sort_chunk, chunks))
+    else:
+        results = list(executor.map(_sort_chunk, chunks))
+    sorted_at = time.perf_counter()
+    runs = [run for run, _ in results]
+    out = [value for value, _ in _kway_merge(runs)]
+    done = time.perf_counter()
+    return out, {
+        "lanes": len(chunks),
+        "chunk_seconds": [seconds for _, seconds in results],
+        "sort_seconds": sorted_at - start,
+        "merge_seconds": done - sorted_at,
+        "wall_seconds": done - start,
+    }
+
+
+# ------------------------------------------------------
+# Visual: lane-tagged trace
+# Lane frames are interleaved round-robin, as the lanes run side by side;
+# every frame carries its worker lane in data["lane"].
+# ------------------------------------------------------
+@budgeted("phase")
+def parallel_merge_sort_frames(arr, lanes=4, executor=None):
+    a = arr[:]
+    step = 0
+    bounds = lane_bounds(len(a), lanes)
+    chunks = [a[lo:hi] for lo, hi in bounds]
+    # Under count_only the workers count too, and each lane yields its totals once
+    counting = getattr(_mode, "counting", False)
+    work = _count_chunk if counting else _trace_chunk
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            traces = list(pool.map(work, chunks))
+    else:
+        traces = list(executor.map(work, chunks))
+
+    yield _yield_array(step, a, ("Split {} values into {} lanes", len(a), len(bounds)),
+                       {"phase": "split", "lanes": [list(b) for b in bounds]}, {}, {}, OP_INFO)
+    step += 1
+
+    if counting:
+        for (lo, hi), (values, counts) in zip(bounds, traces):
+            a[lo:hi] = values
+            yield _yield_array(step, a, None, None, counts)
+            step += 1
+    else:
+        for k in range(max((len(t) for t in traces), default=0)):
+            for lane, ((lo, hi), trace) in enumerate(zip(bounds, traces)):
+                if k >= len(trace):
+                    continue
+                frame = trace[k]
+                a[lo:hi] = frame.values
+                data = frame.data
+                data["phase"] = "sort"
+                data["lane"] = lane
+                highlights = {name: [lo + i for i in idx] for name, idx in frame.highlights.items()}
+                yield _yield_array(step, a, ("Lane {}: {}", lane, frame.narration), data,
+                                   frame.metrics, highlights, frame.op)
+                step += 1
+
+    runs = [a[lo:hi] for lo, hi in bounds]
+    comparisons = [0]
+    counted = [[Counted(v, comparisons) for v in run] for run in runs]
+    for k, (item, lane) in enumerate(_kway_merge(counted)):
+        a[k] = item.value
+        used, comparisons[0] = comparisons[0], 0
+        yield _yield_array(step, a, ("Heap merge: take {} from lane {}", item.value, lane),
+                           {"phase": "merge", "lane": lane, "k": k},
+                           {"comparisons": used, "writes": 1}, {"swap": [k]}, OP_WRITE)
+        step += 1
+    # The heap's last pop happens after the last element was taken
+    yield _yield_array(step, a, "Final sorted array", {"phase": "done"},
+                       {"comparisons": comparisons[0]} if comparisons[0] else {}, {}, OP_INFO)
@@ -0,0 +1,75 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.algorithms.sorting import PIVOT_STRATEGIES, CaseTimeout, _time_limited, count_only, quick_sort_frames
+from core.utils.inputs import make_input
+
+STUDY_METRICS = ("comparisons", "swaps", "max_depth")
+
+
+def _sort_one(job):
+    # One seeded run, count-only; runs in a worker process. None once past
+    # the deadline (wall clock, so it means the same in every process)
+    strategy, partition, distribution, n, seed, deadline = job
+    if deadline is not None and time.time() > deadline:
+        return None
+    arr = make_input(distribution, n, seed)
+    sort = _time_limited(quick_sort_frames, deadline, clock=time.time)
+    # A private RNG per run, so "random" pivots repeat even when runs share a process
+    try:
+        values, counts = count_only(sort, arr, pivot_strategy=strategy, partition=partition,
+                                    rng=random.Random(seed))
+    except CaseTimeout:
+        return None
+    if values != sorted(arr):
+        raise AssertionError(f"{strategy} pivot mis-sorted {distribution} seed={seed}")
+    return counts
+
+
+def summarize(samples):
+    """mean, p50, p99 and max of a list of numbers."""
+    x = np.asarray(samples, dtype=np.float64)
+    return {"mean": float(x.mean()), "p50": float(np.percentile(x, 50)),
+            "p99": float(np.percentile(x, 99)), "max": float(x.max())}
+
+
+def compare_pivots(distributions=("random", "sorted", "few_unique"), n=1_000, seeds=20,
+                   strategies=PIVOT_STRATEGIES, partition="lomuto", workers=None, executor=None,
+                   time_limit=None):
+    """
+    Run quick sort with every pivot strategy over ``seeds`` seeded inputs
+    per distribution, spread over a process pool.
+
+    Returns one row per (distribution, strategy) with the distribution of
+    comparisons, swaps and maximum recursion depth across seeds (each a
+    dict of mean/p50/p99/max) and the summed wall time of the runs.
+
+    ``time_limit`` bounds the whole comparison in seconds: runs still going
+    or not yet started when it expires are dropped, counted in the row's
+    ``timed_out``, and a row with no finished runs has None for its metrics.
+    """
+    if seeds < 1:
+        raise ValueError("seeds must be >= 1")
+    deadline = None if time_limit is None else time.time() + time_limit
+    jobs = [(strategy, partition, distribution, n, seed, deadline)
+            for distribution in distributions for strategy in strategies for seed in range(seeds)]
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            results = list(pool.map(_sort_one, jobs, chunksize=max(1, seeds // 4)))
+    else:
+        results = list(executor.map(_sort_one, jobs))
+    rows = []
+    for k in range(0, len(jobs), seeds):
+        strategy, _, distribution, _, _, _ = jobs[k]
+        runs = [counts for counts in results[k:k + seeds] if counts is not None]
+        row = {"distribution": distribution, "strategy": strategy, "n": n, "seeds": seeds,
+               "timed_out": seeds - len(runs)}
+        for metric in STUDY_METRICS:
+            row[metric] = summarize([counts.get(metric, 0) for counts in runs]) if runs else None
+        row["wall_seconds"] = sum(counts["wall_seconds"] for counts in runs)
+        rows.append(row)
+    return rows
@@ -0,0 +1,171 @@
+import importlib
+
+# ------------------------------------------------------
+# Sorting algorithm registry
+# Every entry declares its properties up front; the frame generator, any
+# option choices and the page's write-up are "module:attribute"
+# references, imported the first time they are needed. Listing
+# algorithms or showing their properties imports nothing.
+#
+# Entry fields:
+#   frames    generator reference; called as frames(values, **options, budget=...)
+#   stable    equal keys keep their input order
+#   in_place  O(1) or O(log n) extra space beyond the array
+#   time      {"best", "average", "worst"} complexity strings
+#   space     extra space complexity
+#   inputs    value types the generator accepts ("int", "float")
+#   options   keyword -> widget spec: {"label", "choices", "default"} for a
+#             choice (choices may be a reference), {"label", "min", "max",
+#             "default"} for an integer slider
+# ------------------------------------------------------
+_COMPARISON = ("int", "float")
+
+SORTING = {
+    "Insertion Sort": {
+        "frames": "core.algorithms.sorting:insertion_sort_frames",
+        "stable": True, "in_place": True,
+        "time": {"best": "O(n)", "average": "O(n²)", "worst": "O(n²)"}, "space": "O(1)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Bubble Sort": {
+        "frames": "core.algorithms.sorting:bubble_sort_frames",
+        "stable": True, "in_place": True,
+        "time": {"best": "O(n²)", "average": "O(n²)", "worst": "O(n²)"}, "space": "O(1)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Selection Sort": {
+        "frames": "core.algorithms.sorting:selection_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n²)", "average": "O(n²)", "worst": "O(n²)"}, "space": "O(1)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Merge Sort": {
+        "frames": "core.algorithms.sorting:merge_sort_frames",
+        "stable": True, "in_place": False,
+        "time": {"best": "O(n log n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(n)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Quick Sort": {
+        "frames": "core.algorithms.sorting:quick_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n log n)", "average": "O(n log n)", "worst": "O(n²)"}, "space": "O(log n)",
+        "inputs": _COMPARISON,
+        "options": {
+            "pivot_strategy": {"label": "Pivot", "choices": "core.algorithms.sorting:PIVOT_STRATEGIES",
+                               "default": "last"},
+            "partition": {"label": "Partition scheme", "choices": "core.algorithms.sorting:QUICK_PARTITIONS",
+                          "default": "lomuto"},
+        },
+    },
+    "Heap Sort": {
+        "frames": "core.algorithms.sorting:heap_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n log n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(1)",
+        "inputs": _COMPARISON,
+        "options": {
+            "sift": {"label": "Sift-down", "choices": "core.algorithms.sorting:HEAP_SIFTS", "default": "floyd"},
+        },
+    },
+    "Counting Sort": {
+        "frames": "core.algorithms.sorting:counting_sort_frames",
+        "stable": False, "in_place": False,
+        "time": {"best": "O(n + k)", "average": "O(n + k)", "worst": "O(n + k)"}, "space": "O(k)",
+        "inputs": ("int",), "options": {},
+    },
+    "Radix Sort": {
+        "frames": "core.algorithms.sorting:radix_sort_frames",
+        "stable": True, "in_place": False,
+        "time": {"best": "O(d·(n + b))", "average": "O(d·(n + b))", "worst": "O(d·(n + b))"}, "space": "O(n + b)",
+        "inputs": ("int",),
+        "options": {
+            "base": {"label": "Radix base", "choices": "core.algorithms.sorting:RADIX_BASES", "default": 10},
+        },
+    },
+    "Shell Sort": {
+        "frames": "core.algorithms.sorting:shell_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n log n)", "average": "≈O(n^1.3)", "worst": "O(n^(4/3))"}, "space": "O(1)",
+        "inputs": _COMPARISON,
+        "options": {
+            "gaps": {"label": "Gap sequence", "choices": "core.algorithms.sorting:SHELL_GAP_SEQUENCES",
+                     "default": "ciura"},
+        },
+    },
+    "Introsort": {
+        "frames": "core.algorithms.sorting:intro_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n log n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(log n)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Timsort": {
+        "frames": "core.algorithms.sorting:tim_sort_frames",
+        "stable": True, "in_place": False,
+        "time": {"best": "O(n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(n)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Pdqsort": {
+        "frames": "core.algorithms.sorting:pdq_sort_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(log n)",
+        "inputs": _COMPARISON, "options": {},
+    },
+    "Parallel Merge Sort": {
+        "frames": "core.algorithms.parallel_sort:parallel_merge_sort_frames",
+        "stable": True, "in_place": False,
+        "time": {"best": "O(n log n)", "average": "O(n log n)", "worst": "O(n log n)"}, "space": "O(n)",
+        "inputs": _COMPARISON,
+        "options": {
+            "lanes": {"label": "Worker lanes", "min": 2, "max": 8, "default": 4},
+        },
+    },
+    "Sorting Network": {
+        "frames": "core.algorithms.sorting_network:sorting_network_frames",
+        "stable": False, "in_place": True,
+        "time": {"best": "O(n log² n)", "average": "O(n log² n)", "worst": "O(n log² n)"}, "space": "O(1)",
+        "inputs": _COMPARISON,
+        "options": {
+            "network": {"label": "Network", "choices": "core.algorithms.sorting_network:NETWORKS",
+                        "default": "bitonic"},
+        },
+    },
+}
+
+_resolved = {}
+
+
+def resolve(ref):
+    """Import and return the object named by a "module:attribute" reference (cached)."""
+    if ref not in _resolved:
+        module, _, attr = ref.partition(":")
+        _resolved[ref] = getattr(importlib.import_module(module), attr)
+    return _resolved[ref]
+
+
+def load(name):
+    """The frame generator of a registered algorithm, imported on first use."""
+    return resolve(SORTING[name]["frames"])
+
+
+def info(name):
+    """Overview, code snippets and links for the Sorting page (core.algorithms.sorting_info)."""
+    return resolve("core.algorithms.sorting_info:SORTING_INFO")[name]
+
+
+def choices(option):
+    """Choices of a choice option, resolving a reference if needed."""
+    values = option["choices"]
+    return resolve(values) if isinstance(values, str) else values
+
+
+def input_type(values):
+    """"int" when every value is an int, "float" when some are floats, else None."""
+    if all(type(v) is int for v in values):
+        return "int"
+    if all(type(v) in (int, float) for v in values):
+        return "float"
+    return None
+
+
+def supports(name, values):
+    """Whether the algorithm accepts this input."""
+    return input_type(values) in SORTING[name]["inputs"]
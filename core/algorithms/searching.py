@@ -1,5 +1,6 @@
 from typing import Generator, List, Dict, Any
-from core.models.frame import Frame
+from core.models.frame import Frame, OP_COMPARE
+from core.models.budget import budgeted
 
 # Helper to build highlights dict
 def HL(**kwargs) -> Dict[str, Any]:
@@ -7,10 +8,10 @@ def HL(**kwargs) -> Dict[str, Any]:
     return {k: v for k, v in kwargs.items() if v is not None}
 
 # -------- Linear Search --------
+@budgeted("i")
 def linear_search_frames(arr: List[int], target: int) -> Generator[Frame, None, None]:
     a = arr[:]
     step = 0
-    comps = 0
 
     # Initial
     yield Frame(
@@ -18,21 +19,20 @@ def linear_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
         view=a,
         narration="Start Linear Search from the beginning.",
         data={"target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[0, len(a)-1] if a else [0, -1]),
     )
     step += 1
 
     for i, v in enumerate(a):
-        comps += 1
         # Compare current index
         yield Frame(
             step=step,
             view=a,
-            narration=f"Compare index {i} with target.",
+            narration=("Compare index {} with target.", i),
             data={"i": i, "value": v, "target": target},
-            metrics={"comparisons": comps},
+            metrics={"comparisons": 1},
             highlights=HL(compare=[i], range=[0, len(a)-1]),
+            op=OP_COMPARE,
         )
         step += 1
 
@@ -42,7 +42,6 @@ def linear_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
                 view=a,
                 narration="Found target at this index.",
                 data={"i": i, "value": v, "target": target},
-                metrics={"comparisons": comps},
                 highlights=HL(insertAt=i, range=[0, len(a)-1]),
             )
             step += 1
@@ -53,38 +52,36 @@ def linear_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
         view=a,
         narration="Target not found after scanning all elements.",
         data={"target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[0, len(a)-1] if a else [0, -1]),
     )
 
 # -------- Binary Search (sorted array) --------
+@budgeted("mid")
 def binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None, None]:
     a = arr[:]  # expect sorted
     l, r = 0, len(a) - 1
     step = 0
-    comps = 0
 
     yield Frame(
         step=step,
         view=a,
         narration="Start Binary Search on the sorted array.",
         data={"l": l, "r": r, "target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[l, r] if a else [0, -1]),
     )
     step += 1
 
     while l <= r:
         mid = (l + r) // 2
-        comps += 1
         # Check mid
         yield Frame(
             step=step,
             view=a,
-            narration=f"Check middle index {mid}.",
+            narration=("Check middle index {}.", mid),
             data={"l": l, "r": r, "mid": mid, "target": target},
-            metrics={"comparisons": comps},
+            metrics={"comparisons": 1},
             highlights=HL(range=[l, r], pivot=mid),
+            op=OP_COMPARE,
         )
         step += 1
 
@@ -94,7 +91,6 @@ def binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
                 view=a,
                 narration="Found target at mid.",
                 data={"l": l, "r": r, "mid": mid, "target": target},
-                metrics={"comparisons": comps},
                 highlights=HL(insertAt=mid, range=[l, r]),
             )
             step += 1
@@ -106,7 +102,6 @@ def binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
                 view=a,
                 narration="Target is bigger—discard left half including mid.",
                 data={"l": l, "r": r, "prev_mid": mid, "target": target},
-                metrics={"comparisons": comps},
                 highlights=HL(range=[l, r]),
             )
             step += 1
@@ -117,7 +112,6 @@ def binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
                 view=a,
                 narration="Target is smaller—discard right half excluding mid.",
                 data={"l": l, "r": r, "prev_mid": mid, "target": target},
-                metrics={"comparisons": comps},
                 highlights=HL(range=[l, r]),
             )
             step += 1
@@ -127,11 +121,11 @@ def binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None,
         view=a,
         narration="Target not found.",
         data={"target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[0, len(a)-1] if a else [0, -1]),
     )
 
 # -------- Binary Search in Rotated Sorted Array --------
+@budgeted("mid")
 def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame, None, None]:
     """
     Array was sorted then rotated (assume no duplicates for clarity).
@@ -140,28 +134,26 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
     a = arr[:]
     l, r = 0, len(a) - 1
     step = 0
-    comps = 0
 
     yield Frame(
         step=step,
         view=a,
         narration="Start search on rotated sorted array.",
         data={"l": l, "r": r, "target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[l, r] if a else [0, -1]),
     )
     step += 1
 
     while l <= r:
         mid = (l + r) // 2
-        comps += 1
         yield Frame(
             step=step,
             view=a,
-            narration=f"Check middle index {mid}.",
+            narration=("Check middle index {}.", mid),
             data={"l": l, "r": r, "mid": mid, "target": target},
-            metrics={"comparisons": comps},
+            metrics={"comparisons": 1},
             highlights=HL(range=[l, r], pivot=mid),
+            op=OP_COMPARE,
         )
         step += 1
 
@@ -171,7 +163,6 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
                 view=a,
                 narration="Found target at mid.",
                 data={"l": l, "r": r, "mid": mid, "target": target},
-                metrics={"comparisons": comps},
                 highlights=HL(insertAt=mid, range=[l, r]),
             )
             step += 1
@@ -185,7 +176,6 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
                 view=a,
                 narration="Left half is sorted.",
                 data={"l": l, "mid": mid, "r": r, "target": target, "sorted_half": "left"},
-                metrics={"comparisons": comps},
                 highlights=HL(range=[l, mid]),
             )
             step += 1
@@ -203,7 +193,6 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
                 view=a,
                 narration="Right half is sorted.",
                 data={"l": l, "mid": mid, "r": r, "target": target, "sorted_half": "right"},
-                metrics={"comparisons": comps},
                 highlights=HL(range=[mid, r]),
             )
             step += 1
@@ -221,7 +210,6 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
             view=a,
             narration=note,
             data={"l": l, "r": r, "target": target},
-            metrics={"comparisons": comps},
             highlights=HL(range=[l, r]),
         )
         step += 1
@@ -231,6 +219,5 @@ def rotated_binary_search_frames(arr: List[int], target: int) -> Generator[Frame
         view=a,
         narration="Target not found.",
         data={"target": target},
-        metrics={"comparisons": comps},
         highlights=HL(range=[0, len(a)-1] if a else [0, -1]),
     )
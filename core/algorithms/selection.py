@@ -0,0 +1,234 @@
+import heapq
+import random
+import time
+
+import numpy as np
+
+from core.models.frame import OP_INFO, OP_COMPARE, OP_WRITE
+from core.models.budget import budgeted
+from core.algorithms.sorting import (
+    _yield_array, _compare, _swap, _regions, _insertion_range, _choose_pivot, _three_way_range, count_only,
+)
+
+SELECT_METHODS = ("introselect", "quickselect", "median_of_medians")
+
+
+# ------------------------------------------------------
+# Quickselect / Introselect (nth_element)
+# Three-way partitions around a pivot and keeps only the side holding
+# rank k, so the final array is in nth_element order: a[k] is the key of
+# rank k, everything left of it is <= a[k] and everything right is >= a[k].
+#
+# Methods:
+#   quickselect        pivot_strategy pivots throughout; O(n) on average,
+#                      O(n²) on inputs that defeat the pivot rule
+#   introselect        like quickselect, but after 2·log2(n) partitions
+#                      (NumPy's depth limit) it switches to
+#                      median-of-medians pivots, bounding the worst case
+#                      at O(n)
+#   median_of_medians  median-of-medians pivots from the start
+#
+# A median-of-medians pivot insertion-sorts groups of five, gathers the
+# group medians at the front of the range and selects their median
+# recursively. Other pivots and the partition itself are quick sort's;
+# the "random" pivot draws from ``rng`` as it does there.
+# ------------------------------------------------------
+@budgeted("range")
+def quickselect_frames(arr, k, method="introselect", pivot_strategy="median3", rng=None):
+    if method not in SELECT_METHODS:
+        raise ValueError(f"unknown selection method {method!r}")
+    n = len(arr)
+    if not 0 <= k < n:
+        raise ValueError(f"k must be in [0, {n}), got {k}")
+    rng = rng or random
+    a = arr[:]
+    step = 0
+    partitions = 0
+    limit = 2 * max(n.bit_length() - 1, 1)
+    fallback = method == "median_of_medians"
+
+    def median_of_medians(low, high):
+        # Returns the index of the pivot; its value is the median of the group medians
+        nonlocal step
+        data = {"range": [low, high], "k": k, "mode": "median_of_medians"}
+        groups = 0
+        for g in range(low, high + 1, 5):
+            end = min(g + 4, high)
+            step = yield from _insertion_range(a, g, end, step, data)
+            median = (g + end) // 2
+            if median != low + groups:
+                yield _swap(a, step, low + groups, median, data)
+                step += 1
+            groups += 1
+        mid = low + (groups - 1) // 2
+        if groups > 1:
+            yield from select(low, low + groups - 1, mid, True)
+        return mid
+
+    def select(low, high, target, mom):
+        # Narrow a[low..high] until a[target] holds its rank
+        nonlocal step, partitions, fallback
+        while low < high:
+            if mom:
+                pivot = a[(yield from median_of_medians(low, high))]
+            else:
+                pivot = a[_choose_pivot(a, low, high, pivot_strategy, rng)]
+            step, lt, gt = yield from _three_way_range(a, low, high, pivot, step, {"k": k})
+            regions = _regions((low, lt), (lt, gt + 1), (gt + 1, high + 1))
+            if target < lt:
+                side, low, high = "left", low, lt - 1
+            elif target > gt:
+                side, low, high = "right", gt + 1, high
+            else:
+                side, low, high = None, target, target
+            yield _yield_array(step, a,
+                               ("Keys equal to {} settled at positions {}-{}; rank {} is in them", pivot, lt, gt, target)
+                               if side is None else
+                               ("Keys equal to {} settled at positions {}-{}; keep the {} side", pivot, lt, gt, side),
+                               {"pivot": pivot, "range": [low, high], "k": target,
+                                "mode": "median_of_medians" if mom else "quickselect"}, {},
+                               regions, OP_INFO)
+            step += 1
+            if mom:
+                continue
+            partitions += 1
+            if method == "introselect" and partitions >= limit and low < high:
+                mom = fallback = True
+                yield _yield_array(step, a,
+                                   ("{} partitions without converging: switch to median-of-medians pivots",
+                                    partitions),
+                                   {"range": [low, high], "k": target, "mode": "median_of_medians"}, {}, {}, OP_INFO)
+                step += 1
+
+    yield _yield_array(step, a, ("Find the key of rank {} among {}", k, n),
+                       {"range": [0, n - 1], "k": k}, {}, {})
+    step += 1
+    yield from select(0, n - 1, k, fallback)
+    yield _yield_array(step, a, ("{} has rank {}: smaller keys to its left, larger to its right", a[k], k),
+                       {"k": k, "value": a[k], "fallback": fallback}, {},
+                       {**_regions((0, k), (k, k + 1), (k + 1, n)), "pivot": [k]})
+
+
+def nth_element(values, k, method="introselect", pivot_strategy="median3", rng=None):
+    """
+    Headless introselect: the frames of ``quickselect_frames`` run in
+    count-only mode.
+
+    Returns (values in nth_element order, counts).
+    """
+    return count_only(quickselect_frames, list(values), k=k, method=method, pivot_strategy=pivot_strategy, rng=rng)
+
+
+def nth_element_numpy(values, k):
+    """
+    Headless selection for large numeric arrays.
+
+    ``np.partition`` is NumPy's own introselect, so this is the same
+    algorithm run in C: the result is in nth_element order around index k.
+    """
+    a = np.asarray(values)
+    if not 0 <= k < a.size:
+        raise ValueError(f"k must be in [0, {a.size}), got {k}")
+    return np.partition(a, k)
+
+
+# ------------------------------------------------------
+# Streaming Top-k
+# Keeps the k largest values seen so far in a min-heap, so the smallest
+# of them sits at the root: a new value either loses to the root (one
+# comparison, discarded) or replaces it and sifts down. Memory is O(k)
+# however long the stream, and the input is consumed lazily.
+#
+# The view is the heap array, which grows to k and then stays that size;
+# the last frame shows the top k in descending order.
+# ------------------------------------------------------
+@budgeted("seen")
+def top_k_frames(stream, k):
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    heap = []
+    step = 0
+    seen = 0
+
+    def sift_up(i):
+        nonlocal step
+        while i > 0:
+            parent = (i - 1) // 2
+            yield _compare(heap, step, parent, i, {"seen": seen, "size": len(heap)})
+            step += 1
+            if not heap[i] < heap[parent]:
+                return
+            yield _swap(heap, step, parent, i, {"seen": seen, "size": len(heap)})
+            step += 1
+            i = parent
+
+    def sift_down(i):
+        nonlocal step
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                return
+            if child + 1 < size:
+                yield _compare(heap, step, child, child + 1, {"seen": seen, "size": size})
+                step += 1
+                if heap[child + 1] < heap[child]:
+                    child += 1
+            yield _compare(heap, step, i, child, {"seen": seen, "size": size})
+            step += 1
+            if not heap[child] < heap[i]:
+                return
+            yield _swap(heap, step, i, child, {"seen": seen, "size": size})
+            step += 1
+            i = child
+
+    for value in stream:
+        seen += 1
+        if len(heap) < k:
+            heap.append(value)
+            yield _yield_array(step, heap, ("Heap not full: push {}", value),
+                               {"seen": seen, "value": value, "size": len(heap)}, {"writes": 1},
+                               {"swap": [len(heap) - 1]}, OP_WRITE)
+            step += 1
+            yield from sift_up(len(heap) - 1)
+            continue
+        yield _yield_array(step, heap, ("Compare {} with the smallest kept value {}", value, heap[0]),
+                           {"seen": seen, "value": value, "size": k}, {"comparisons": 1},
+                           {"compare": [0]}, OP_COMPARE)
+        step += 1
+        if heap[0] < value:
+            heap[0] = value
+            yield _yield_array(step, heap, ("Replace the root with {}", value),
+                               {"seen": seen, "value": value, "size": k}, {"writes": 1},
+                               {"swap": [0]}, OP_WRITE)
+            step += 1
+            yield from sift_down(0)
+
+    top = sorted(heap, reverse=True)
+    yield _yield_array(step, top, ("Top {} of {} values", len(top), seen),
+                       {"seen": seen, "size": len(top)}, {}, {})
+
+
+def top_k(stream, k):
+    """
+    Headless streaming top-k with ``heapq``: the k largest values of any
+    iterable, in descending order, holding at most k of them at a time.
+
+    Returns (top values, stats) where stats has the values seen, how many
+    entered the heap and the wall time.
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    start = time.perf_counter()
+    heap = []
+    seen = pushed = 0
+    for value in stream:
+        seen += 1
+        if len(heap) < k:
+            heapq.heappush(heap, value)
+            pushed += 1
+        elif heap[0] < value:
+            heapq.heapreplace(heap, value)
+            pushed += 1
+    heap.sort(reverse=True)
+    return heap, {"seen": seen, "pushed": pushed, "wall_seconds": time.perf_counter() - start}
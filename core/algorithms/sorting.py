@@ -1,22 +1,94 @@
-from core.models.frame import Frame
+from core.models.frame import Frame, OP_INFO, OP_COMPARE, OP_SWAP, OP_WRITE, OP_VISIT
+from core.models.budget import budgeted
 import random
+import threading
+import time
+
+import numpy as np
+
+# Set per thread by count_only(); generators then skip building frames
+_mode = threading.local()
 
 # ------------------------------------------------------
 # Helper: Create frames for visualization
 # ------------------------------------------------------
-def _yield_array(step, array, desc, variables=None, stats=None, highlights=None):
-    return Frame(
-        step=step,
-        view=array[:],
-        narration=desc,
-        data=variables or {},
-        metrics=stats or {},
-        highlights=highlights or {},
-    )
+def _yield_array(step, array, desc, variables=None, stats=None, highlights=None, op=OP_INFO):
+    if getattr(_mode, "counting", False):
+        # Count-only: hand back the live array and the metric deltas, no copy
+        return array, stats
+    return Frame(step, array, desc, variables, stats, highlights, op)
+
+
+def count_only(sort, arr, **kwargs):
+    """
+    Run a sorting generator without building frames.
+
+    The generator executes exactly the same steps as when traced; each
+    step yields its metric deltas instead of a Frame, so the totals are
+    identical to summing the traced frames. Returns (sorted values,
+    counts) where counts holds comparisons, swaps, writes (plus any other
+    metric the algorithm reports) and wall_seconds. A ``budget`` keyword
+    is dropped: it only thins frames, and the totals never depend on it.
+    """
+    kwargs.pop("budget", None)
+    counts = {"comparisons": 0, "swaps": 0, "writes": 0}
+    values = arr
+    previous = getattr(_mode, "counting", False)
+    _mode.counting = True
+    start = time.perf_counter()
+    try:
+        for item in sort(arr, **kwargs):
+            if isinstance(item, Frame):
+                raise TypeError(f"{getattr(sort, '__name__', sort)!r} builds Frame objects directly; "
+                                "count_only needs a generator whose frames come from _yield_array")
+            values, stats = item
+            if stats:
+                for name, value in stats.items():
+                    counts[name] = counts.get(name, 0) + value
+    finally:
+        _mode.counting = previous
+    counts["wall_seconds"] = time.perf_counter() - start
+    return list(values), counts
+
+
+class CaseTimeout(Exception):
+    """A sort ran past its time limit."""
+
+
+def _time_limited(sort, deadline, clock=time.perf_counter):
+    # Checks clock() every 1024 steps; raises CaseTimeout once past the deadline
+    if deadline is None:
+        return sort
+
+    def run(arr, **kwargs):
+        for k, item in enumerate(sort(arr, **kwargs)):
+            if not k & 0x3FF and clock() > deadline:
+                raise CaseTimeout("time limit exceeded")
+            yield item
+    return run
+
+
+class Counted:
+    """Wraps a value so every ``<`` between two of them adds 1 to ``counter[0]``."""
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __eq__(self, other):
+        # Tuple/list ordering checks equality first; that is bookkeeping, not a comparison
+        return self.value == other.value
+
 
 # ------------------------------------------------------
 # Insertion Sort
 # ------------------------------------------------------
+@budgeted("i")
 def insertion_sort_frames(arr):
     a = arr[:]
     step = 0
@@ -24,44 +96,46 @@ def insertion_sort_frames(arr):
     for i in range(1, n):
         key = a[i]
         j = i - 1
-        yield _yield_array(step, a, f"Consider element {key} at index {i}",
+        yield _yield_array(step, a, ("Consider element {} at index {}", key, i),
                            {"i": i, "j": j}, {}, {"compare": [i]})
         step += 1
         while j >= 0 and a[j] > key:
             a[j + 1] = a[j]
-            yield _yield_array(step, a, f"Shift {a[j]} to the right",
-                               {"i": i, "j": j}, {"comparisons": 1, "swaps": 1},
-                               {"swap": [j, j+1]})
+            yield _yield_array(step, a, ("Shift {} to the right", a[j]),
+                               {"i": i, "j": j}, {"comparisons": 1, "writes": 1},
+                               {"swap": [j, j+1]}, OP_SWAP)
             step += 1
             j -= 1
         a[j + 1] = key
-        yield _yield_array(step, a, f"Insert {key} at position {j+1}",
-                           {"i": i, "j": j}, {"swaps": 1}, {"swap": [j+1]})
+        yield _yield_array(step, a, ("Insert {} at position {}", key, j+1),
+                           {"i": i, "j": j}, {"writes": 1}, {"swap": [j+1]}, OP_WRITE)
         step += 1
 
 # ------------------------------------------------------
 # Bubble Sort
 # ------------------------------------------------------
+@budgeted("i")
 def bubble_sort_frames(arr):
     a = arr[:]
     step = 0
     n = len(a)
     for i in range(n):
         for j in range(0, n - i - 1):
-            yield _yield_array(step, a, f"Compare {a[j]} and {a[j+1]}",
+            yield _yield_array(step, a, ("Compare {} and {}", a[j], a[j+1]),
                                {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [j, j+1]})
+                               {"compare": [j, j+1]}, OP_COMPARE)
             step += 1
             if a[j] > a[j + 1]:
                 a[j], a[j + 1] = a[j + 1], a[j]
-                yield _yield_array(step, a, f"Swap {a[j]} and {a[j+1]}",
+                yield _yield_array(step, a, ("Swap {} and {}", a[j], a[j+1]),
                                    {"i": i, "j": j}, {"swaps": 1},
-                                   {"swap": [j, j+1]})
+                                   {"swap": [j, j+1]}, OP_SWAP)
                 step += 1
 
 # ------------------------------------------------------
 # Selection Sort
 # ------------------------------------------------------
+@budgeted("i")
 def selection_sort_frames(arr):
     a = arr[:]
     step = 0
@@ -69,33 +143,28 @@ def selection_sort_frames(arr):
     for i in range(n):
         min_idx = i
         for j in range(i + 1, n):
-            yield _yield_array(step, a, f"Compare {a[min_idx]} and {a[j]}",
+            yield _yield_array(step, a, ("Compare {} and {}", a[min_idx], a[j]),
                                {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [min_idx, j]})
+                               {"compare": [min_idx, j]}, OP_COMPARE)
             step += 1
             if a[j] < a[min_idx]:
                 min_idx = j
         a[i], a[min_idx] = a[min_idx], a[i]
-        yield _yield_array(step, a, f"Swap {a[i]} and {a[min_idx]}",
+        yield _yield_array(step, a, ("Swap {} and {}", a[i], a[min_idx]),
                            {"i": i, "min_idx": min_idx}, {"swaps": 1},
-                           {"swap": [i, min_idx]})
+                           {"swap": [i, min_idx]}, OP_SWAP)
         step += 1
 
 # ------------------------------------------------------
 # Merge Sort
+# Top-down order driven by an explicit stack, so resuming the generator
+# never walks a chain of nested generators
 # ------------------------------------------------------
+@budgeted("range")
 def merge_sort_frames(arr):
     a = arr[:]
     step = 0
 
-    def merge_sort(l, r):
-        nonlocal step
-        if l < r:
-            m = (l + r) // 2
-            yield from merge_sort(l, m)
-            yield from merge_sort(m + 1, r)
-            yield from merge(l, m, r)
-
     def merge(l, m, r):
         nonlocal step
         left = a[l:m+1]
@@ -103,9 +172,9 @@ def merge_sort_frames(arr):
         i = j = 0
         k = l
         while i < len(left) and j < len(right):
-            yield _yield_array(step, a, f"Compare {left[i]} and {right[j]}",
-                               {"i": i, "j": j}, {"comparisons": 1},
-                               {"compare": [l+i, m+1+j]})
+            yield _yield_array(step, a, ("Compare {} and {}", left[i], right[j]),
+                               {"i": i, "j": j, "range": [l, r]}, {"comparisons": 1},
+                               {"compare": [l+i, m+1+j]}, OP_COMPARE)
             step += 1
             if left[i] <= right[j]:
                 a[k] = left[i]
@@ -113,174 +182,1105 @@ def merge_sort_frames(arr):
             else:
                 a[k] = right[j]
                 j += 1
-            yield _yield_array(step, a, f"Insert {a[k]} at index {k}",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
+            yield _yield_array(step, a, ("Insert {} at index {}", a[k], k),
+                               {"k": k, "range": [l, r]}, {"writes": 1}, {"swap": [k]}, OP_WRITE)
             step += 1
             k += 1
         while i < len(left):
             a[k] = left[i]
-            yield _yield_array(step, a, f"Insert {a[k]} from left",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
+            yield _yield_array(step, a, ("Insert {} from left", a[k]),
+                               {"k": k, "range": [l, r]}, {"writes": 1}, {"swap": [k]}, OP_WRITE)
             step += 1
             i += 1
             k += 1
         while j < len(right):
             a[k] = right[j]
-            yield _yield_array(step, a, f"Insert {a[k]} from right",
-                               {"k": k}, {"swaps": 1}, {"swap": [k]})
+            yield _yield_array(step, a, ("Insert {} from right", a[k]),
+                               {"k": k, "range": [l, r]}, {"writes": 1}, {"swap": [k]}, OP_WRITE)
             step += 1
             j += 1
             k += 1
 
-    yield from merge_sort(0, len(a) - 1)
+    # (l, r, halves_sorted): a range is pushed once to split it, once to merge it
+    stack = [(0, len(a) - 1, False)]
+    while stack:
+        l, r, halves_sorted = stack.pop()
+        if l >= r:
+            continue
+        m = (l + r) // 2
+        if halves_sorted:
+            yield from merge(l, m, r)
+        else:
+            stack.append((l, r, True))
+            stack.append((m + 1, r, False))
+            stack.append((l, m, False))
 
 # ------------------------------------------------------
 # Quick Sort
+# Iterative: all but the smallest side of each partition are pushed on an
+# explicit stack and the smallest side is sorted next, so the stack stays
+# O(log n) deep, even on sorted input with the "last" pivot.
+#
+# Partition schemes:
+#   - lomuto: one pivot, keys <= pivot to the left
+#   - three_way: Dijkstra's <, =, > partition; keys equal to the pivot
+#     are settled in one pass, so few-unique inputs stay O(n log n)
+#   - dual_pivot: Yaroslavskiy's two pivots p <= q split the range into
+#     < p, p..q and > q; keys equal to either pivot are then moved out of
+#     the middle part, as the JDK does. The pivots are the end elements
+#     for "first"/"last", two random keys for "random", and the 2nd and
+#     4th of five samples for "median3".
+# The "random" pivot draws from ``rng`` (a random.Random), or from the
+# module RNG when none is given.
+# Three-way and dual-pivot frames highlight the regions found so far as
+# "less", "equal" and "greater" (for dual pivot, "equal" is p..q).
+#
+# The last frame of each partition carries "depth" (ranges waiting on the
+# stack) and "level" (how deep the recursive version would be). The
+# max_depth metric grows by however much a partition's level exceeds
+# every level before it, so its total is the maximum recursion depth.
 # ------------------------------------------------------
-def quick_sort_frames(arr, pivot_strategy="last"):
+PIVOT_STRATEGIES = ("first", "last", "median3", "random")
+QUICK_PARTITIONS = ("lomuto", "three_way", "dual_pivot")
+
+
+def _regions(less, equal, greater):
+    # Half-open (lo, hi) bounds -> index lists; not built when only counting
+    if getattr(_mode, "counting", False):
+        return {}
+    return {"less": list(range(*less)), "equal": list(range(*equal)), "greater": list(range(*greater))}
+
+
+def _choose_pivot(a, low, high, strategy, rng):
+    # Index of the pivot for a[low..high]; shared with quickselect
+    if strategy == "first":
+        return low
+    elif strategy == "median3":
+        mid = (low + high) // 2
+        trio = [(a[low], low), (a[mid], mid), (a[high], high)]
+        trio.sort(key=lambda x: x[0])
+        return trio[1][1]
+    elif strategy == "random":
+        return rng.randint(low, high)
+    else:
+        return high
+
+
+def _three_way_range(a, low, high, pivot, step, data=None):
+    # Three-way partition of a[low..high] around the value pivot, one frame per
+    # comparison and swap; returns (step, lt, gt) with a[lt..gt] == pivot.
+    # a[low:lt] < pivot, a[lt:i] == pivot, a[gt+1:high+1] > pivot, a[i:gt+1] unseen
+    data = data or {}
+    lt, i, gt = low, low, high
+    while i <= gt:
+        less = a[i] < pivot
+        greater = not less and a[i] > pivot
+        yield _yield_array(step, a, ("Compare {} with pivot {}", a[i], pivot),
+                           {"i": i, "lt": lt, "gt": gt, "pivot": pivot, "range": [low, high], **data},
+                           {"comparisons": 1 if less else 2},
+                           {**_regions((low, lt), (lt, i), (gt + 1, high + 1)), "compare": [i]}, OP_COMPARE)
+        step += 1
+        if less:
+            a[lt], a[i] = a[i], a[lt]
+            yield _yield_array(step, a, ("{} < {}: swap it into the left region", a[lt], pivot),
+                               {"i": i, "lt": lt, "gt": gt, "pivot": pivot, "range": [low, high], **data},
+                               {"swaps": 1},
+                               {**_regions((low, lt + 1), (lt + 1, i + 1), (gt + 1, high + 1)), "swap": [lt, i]},
+                               OP_SWAP)
+            step += 1
+            lt += 1
+            i += 1
+        elif greater:
+            a[i], a[gt] = a[gt], a[i]
+            yield _yield_array(step, a, ("{} > {}: swap it into the right region", a[gt], pivot),
+                               {"i": i, "lt": lt, "gt": gt, "pivot": pivot, "range": [low, high], **data},
+                               {"swaps": 1},
+                               {**_regions((low, lt), (lt, i), (gt, high + 1)), "swap": [i, gt]}, OP_SWAP)
+            step += 1
+            gt -= 1
+        else:
+            i += 1
+    return step, lt, gt
+
+
+@budgeted("range")
+def quick_sort_frames(arr, pivot_strategy="last", partition="lomuto", rng=None):
+    if partition not in QUICK_PARTITIONS:
+        raise ValueError(f"unknown partition scheme {partition!r}")
+    rng = rng or random
     a = arr[:]
     step = 0
+    stack = []
+    level = deepest = 0
 
-    def quick_sort(low, high):
-        nonlocal step
-        if low < high:
-            pi = partition(low, high)
-            yield from quick_sort(low, pi - 1)
-            yield from quick_sort(pi + 1, high)
-
-    def choose_pivot(low, high):
-        if pivot_strategy == "first":
-            return low
-        elif pivot_strategy == "median3":
-            mid = (low + high) // 2
-            trio = [(a[low], low), (a[mid], mid), (a[high], high)]
-            trio.sort(key=lambda x: x[0])
-            return trio[1][1]
-        elif pivot_strategy == "random":
-            return random.randint(low, high)
-        else:
-            return high
+    def deeper():
+        # max_depth delta for the partition now ending
+        nonlocal deepest
+        grow, deepest = max(level - deepest, 0), max(level, deepest)
+        return {"max_depth": grow} if grow else {}
 
-    def partition(low, high):
+    def lomuto(low, high):
         nonlocal step
-        pivot_idx = choose_pivot(low, high)
+        pivot_idx = _choose_pivot(a, low, high, pivot_strategy, rng)
         a[pivot_idx], a[high] = a[high], a[pivot_idx]
         pivot = a[high]
         i = low - 1
         for j in range(low, high):
-            yield _yield_array(step, a, f"Compare {a[j]} with pivot {pivot}",
-                               {"j": j, "pivot": pivot}, {"comparisons": 1},
-                               {"compare": [j], "pivot": [high]})
+            yield _yield_array(step, a, ("Compare {} with pivot {}", a[j], pivot),
+                               {"j": j, "pivot": pivot, "range": [low, high]}, {"comparisons": 1},
+                               {"compare": [j], "pivot": [high]}, OP_COMPARE)
             step += 1
             if a[j] <= pivot:
                 i += 1
                 a[i], a[j] = a[j], a[i]
-                yield _yield_array(step, a, f"Swap {a[i]} and {a[j]}",
-                                   {"i": i, "j": j}, {"swaps": 1},
-                                   {"swap": [i, j], "pivot": [high]})
+                yield _yield_array(step, a, ("Swap {} and {}", a[i], a[j]),
+                                   {"i": i, "j": j, "range": [low, high]}, {"swaps": 1},
+                                   {"swap": [i, j], "pivot": [high]}, OP_SWAP)
                 step += 1
         a[i + 1], a[high] = a[high], a[i + 1]
-        yield _yield_array(step, a, f"Place pivot {pivot} at position {i+1}",
-                           {"pivot": pivot}, {"swaps": 1},
-                           {"swap": [i+1], "pivot": [i+1]})
+        yield _yield_array(step, a, ("Place pivot {} at position {}", pivot, i+1),
+                           {"pivot": pivot, "range": [low, high], "depth": len(stack), "level": level},
+                           {"swaps": 1, **deeper()},
+                           {"swap": [i+1], "pivot": [i+1]}, OP_SWAP)
         step += 1
-        return i + 1
+        return [(low, i), (i + 2, high)]
 
-    yield from quick_sort(0, len(a) - 1)
+    def three_way(low, high):
+        nonlocal step
+        pivot = a[_choose_pivot(a, low, high, pivot_strategy, rng)]
+        step, lt, gt = yield from _three_way_range(a, low, high, pivot, step)
+        yield _yield_array(step, a, ("Keys equal to {} settled at positions {}-{}", pivot, lt, gt),
+                           {"pivot": pivot, "range": [low, high], "depth": len(stack), "level": level}, deeper(),
+                           _regions((low, lt), (lt, gt + 1), (gt + 1, high + 1)), OP_INFO)
+        step += 1
+        return [(low, lt - 1), (gt + 1, high)]
+
+    def dual_pivot(low, high):
+        nonlocal step
+        if pivot_strategy == "random":
+            for end in (low, high):
+                k = rng.randint(low, high)
+                a[k], a[end] = a[end], a[k]
+        elif pivot_strategy == "median3" and high - low >= 4:
+            # Like the JDK: the 2nd and 4th of five evenly spaced samples
+            seventh = (high - low + 1) // 7 or 1
+            mid = (low + high) // 2
+            picks = sorted((mid - 2 * seventh, mid - seventh, mid, mid + seventh, mid + 2 * seventh),
+                           key=lambda k: a[k])
+            p_idx, q_idx = picks[1], picks[3]
+            a[low], a[p_idx] = a[p_idx], a[low]
+            if q_idx == low:
+                q_idx = p_idx
+            a[high], a[q_idx] = a[q_idx], a[high]
+        yield _compare(a, step, low, high, {"range": [low, high]})
+        step += 1
+        if a[low] > a[high]:
+            yield _swap(a, step, low, high, {"range": [low, high]})
+            step += 1
+        p, q = a[low], a[high]
+
+        def classify(k, lt, gt):
+            # One frame per key placed; regions are relative to the pivots at the ends
+            return _yield_array(step, a, ("Compare {} with pivots {} and {}", a[k], p, q),
+                                {"k": k, "lt": lt, "gt": gt, "p": p, "q": q, "range": [low, high]},
+                                {"comparisons": 1 if a[k] < p else 2},
+                                {**_regions((low + 1, lt), (lt, k), (gt + 1, high)),
+                                 "compare": [k], "pivot": [low, high]}, OP_COMPARE)
+
+        def move(i, j, text, bounds=None):
+            # bounds: (less, equal, greater) regions after the swap, if known
+            a[i], a[j] = a[j], a[i]
+            highlights = _regions(*bounds) if bounds else {}
+            highlights.update({"swap": [i, j], "pivot": [low, high]})
+            return _yield_array(step, a, (text, a[i], a[j]),
+                                {"p": p, "q": q, "range": [low, high]}, {"swaps": 1}, highlights, OP_SWAP)
+
+        # a[low+1:lt] < p, a[lt:k] in [p, q], a[gt+1:high] > q
+        lt, k, gt = low + 1, low + 1, high - 1
+        while k <= gt:
+            yield classify(k, lt, gt)
+            step += 1
+            if a[k] < p:
+                if k != lt:
+                    yield move(k, lt, "Swap {} and {} into the < p region",
+                               ((low + 1, lt + 1), (lt + 1, k + 1), (gt + 1, high)))
+                    step += 1
+                lt += 1
+            elif a[k] > q:
+                while k < gt:
+                    yield _yield_array(step, a, ("Compare {} with pivot {}", a[gt], q),
+                                       {"k": k, "lt": lt, "gt": gt, "p": p, "q": q, "range": [low, high]},
+                                       {"comparisons": 1}, {"compare": [gt], "pivot": [low, high]}, OP_COMPARE)
+                    step += 1
+                    if a[gt] <= q:
+                        break
+                    gt -= 1
+                yield move(k, gt, "Swap {} and {} into the > q region",
+                           ((low + 1, lt), (lt, k), (gt, high)))
+                step += 1
+                gt -= 1
+                yield _yield_array(step, a, ("Compare {} with pivot {}", a[k], p),
+                                   {"k": k, "lt": lt, "gt": gt, "p": p, "q": q, "range": [low, high]},
+                                   {"comparisons": 1}, {"compare": [k], "pivot": [low, high]}, OP_COMPARE)
+                step += 1
+                if a[k] < p:
+                    if k != lt:
+                        yield move(k, lt, "Swap {} and {} into the < p region",
+                                   ((low + 1, lt + 1), (lt + 1, k + 1), (gt + 1, high)))
+                        step += 1
+                    lt += 1
+            k += 1
+        lt -= 1
+        gt += 1
+        yield move(low, lt, "Move pivot {} / {} into place")
+        step += 1
+        yield move(high, gt, "Move pivot {} / {} into place")
+        step += 1
+
+        # Middle part: keys equal to p or q are already in their final place
+        lo, hi = lt + 1, gt - 1
+        if p == q:
+            lo, hi = gt, gt - 1
+        else:
+            k = lo
+            while k <= hi:
+                yield _yield_array(step, a, ("Compare {} with pivots {} and {}", a[k], p, q),
+                                   {"k": k, "lt": lo, "gt": hi, "p": p, "q": q, "range": [low, high]},
+                                   {"comparisons": 1 if a[k] == p else 2},
+                                   {"compare": [k], "pivot": [lt, gt]}, OP_COMPARE)
+                step += 1
+                if a[k] == p:
+                    if k != lo:
+                        yield move(k, lo, "Swap {} and {} next to pivot p")
+                        step += 1
+                    lo += 1
+                elif a[k] == q:
+                    while k < hi and a[hi] == q:
+                        yield _yield_array(step, a, ("Compare {} with pivot {}", a[hi], q),
+                                           {"k": k, "lt": lo, "gt": hi, "p": p, "q": q, "range": [low, high]},
+                                           {"comparisons": 1}, {"compare": [hi], "pivot": [lt, gt]}, OP_COMPARE)
+                        step += 1
+                        hi -= 1
+                    if k < hi:
+                        # The scan above stopped on a key != q
+                        yield _yield_array(step, a, ("Compare {} with pivot {}", a[hi], q),
+                                           {"k": k, "lt": lo, "gt": hi, "p": p, "q": q, "range": [low, high]},
+                                           {"comparisons": 1}, {"compare": [hi], "pivot": [lt, gt]}, OP_COMPARE)
+                        step += 1
+                    yield move(k, hi, "Swap {} and {} next to pivot q")
+                    step += 1
+                    hi -= 1
+                    yield _yield_array(step, a, ("Compare {} with pivot {}", a[k], p),
+                                       {"k": k, "lt": lo, "gt": hi, "p": p, "q": q, "range": [low, high]},
+                                       {"comparisons": 1}, {"compare": [k], "pivot": [lt, gt]}, OP_COMPARE)
+                    step += 1
+                    if a[k] == p:
+                        if k != lo:
+                            yield move(k, lo, "Swap {} and {} next to pivot p")
+                            step += 1
+                        lo += 1
+                k += 1
+        yield _yield_array(step, a, ("Pivots {} and {} placed at positions {} and {}", p, q, lt, gt),
+                           {"p": p, "q": q, "range": [low, high], "depth": len(stack), "level": level}, deeper(),
+                           {**_regions((low, lt), (lt, gt + 1), (gt + 1, high + 1)), "pivot": [lt, gt]}, OP_INFO)
+        step += 1
+        return [(low, lt - 1), (lo, hi), (gt + 1, high)]
+
+    partition_range = {"lomuto": lomuto, "three_way": three_way, "dual_pivot": dual_pivot}[partition]
+    stack.append((0, len(a) - 1, 1))
+    while stack:
+        low, high, level = stack.pop()
+        while low < high:
+            parts = yield from partition_range(low, high)
+            parts = sorted((r for r in parts if r[0] < r[1]), key=lambda r: r[1] - r[0])
+            if not parts:
+                break
+            level += 1
+            stack.extend((lo, hi, level) for lo, hi in reversed(parts[1:]))
+            low, high = parts[0]
 
 # ------------------------------------------------------
 # Heap Sort
+# Iterative: a max-heap is built bottom-up, then the root is swapped to
+# the end and the new root sifted down, heap_size shrinking by one.
+#
+# Sift-down strategies:
+#   - floyd: descend along the larger children to a leaf (one comparison
+#     per level), then climb back up to where the sifted key belongs and
+#     rotate the path. The sifted key usually came from the bottom, so
+#     the climb is short and it takes about n log2 n comparisons in all
+#   - classic: compare both children and then the parent at every level,
+#     about 2 n log2 n comparisons
 # ------------------------------------------------------
-def heap_sort_frames(arr):
+HEAP_SIFTS = ("floyd", "classic")
+
+
+@budgeted("heap_size")
+def heap_sort_frames(arr, sift="floyd"):
+    if sift not in HEAP_SIFTS:
+        raise ValueError(f"unknown sift-down {sift!r}")
     a = arr[:]
     step = 0
     n = len(a)
 
-    def heapify(n, i):
+    def classic(root, size, data):
+        nonlocal step
+        while True:
+            child = 2 * root + 1
+            if child >= size:
+                return
+            if child + 1 < size:
+                yield _compare(a, step, child, child + 1, data)
+                step += 1
+                if a[child] < a[child + 1]:
+                    child += 1
+            yield _compare(a, step, root, child, data)
+            step += 1
+            if not a[root] < a[child]:
+                return
+            yield _swap(a, step, root, child, data)
+            step += 1
+            root = child
+
+    def floyd(root, size, data):
         nonlocal step
-        largest = i
-        l = 2 * i + 1
-        r = 2 * i + 2
-        if l < n and a[l] > a[largest]:
-            largest = l
-        if r < n and a[r] > a[largest]:
-            largest = r
-        if largest != i:
-            a[i], a[largest] = a[largest], a[i]
-            yield _yield_array(step, a, f"Swap {a[i]} and {a[largest]}",
-                               {"i": i, "largest": largest}, {"swaps": 1},
-                               {"swap": [i, largest]})
+        # Descend to a leaf along the larger children
+        leaf = root
+        while 2 * leaf + 2 < size:
+            child = 2 * leaf + 1
+            yield _compare(a, step, child, child + 1, data)
             step += 1
-            yield from heapify(n, largest)
-
-    for i in range(n // 2 - 1, -1, -1):
-        yield from heapify(n, i)
-    for i in range(n - 1, 0, -1):
-        a[i], a[0] = a[0], a[i]
-        yield _yield_array(step, a, f"Swap root {a[i]} with {a[0]}",
-                           {"i": i}, {"swaps": 1}, {"swap": [0, i]})
+            leaf = child + 1 if a[child] < a[child + 1] else child
+        if 2 * leaf + 1 < size:
+            leaf = 2 * leaf + 1
+        # Climb back to the first key on the path that is not smaller than a[root]
+        while leaf > root:
+            yield _compare(a, step, leaf, root, data)
+            step += 1
+            if not a[leaf] < a[root]:
+                break
+            leaf = (leaf - 1) // 2
+        if leaf == root:
+            return
+        # Rotate: a[root] goes to leaf, every key above it on the path moves up one level
+        key = a[root]
+        while leaf > root:
+            a[leaf], key = key, a[leaf]
+            yield _yield_array(step, a, ("Write {} at position {}", a[leaf], leaf), data,
+                               {"writes": 1}, {"swap": [leaf]}, OP_WRITE)
+            step += 1
+            leaf = (leaf - 1) // 2
+        a[root] = key
+        yield _yield_array(step, a, ("Write {} at position {}", key, root), data,
+                           {"writes": 1}, {"swap": [root]}, OP_WRITE)
+        step += 1
+
+    sift_down = floyd if sift == "floyd" else classic
+    yield _yield_array(step, a, ("Build a max-heap of {} keys from the bottom up", n),
+                       {"phase": "build", "heap_size": n}, {}, {})
+    step += 1
+    for root in range(n // 2 - 1, -1, -1):
+        yield from sift_down(root, n, {"phase": "build", "root": root, "heap_size": n})
+    yield _yield_array(step, a, ("Max-heap built, largest key {}", a[0] if a else None),
+                       {"phase": "build", "heap_size": n}, {}, {"pivot": [0] if a else []})
+    step += 1
+    for end in range(n - 1, 0, -1):
+        a[0], a[end] = a[end], a[0]
+        yield _yield_array(step, a, ("Swap root {} with {}", a[end], a[0]),
+                           {"phase": "extract", "i": end, "heap_size": end}, {"swaps": 1},
+                           {"swap": [0, end]}, OP_SWAP)
         step += 1
-        yield from heapify(i, 0)
+        yield from sift_down(0, end, {"phase": "extract", "heap_size": end})
 
 # ------------------------------------------------------
 # Counting Sort
+# O(n + k) with counters offset by the minimum (negative keys work).
+# When the key range is over sparse_factor * n, counts go into a dict
+# and only the distinct keys are sorted.
 # ------------------------------------------------------
-def counting_sort_frames(arr):
+@budgeted("value")
+def counting_sort_frames(arr, sparse_factor=4):
     a = arr[:]
     step = 0
-    max_val = max(a) if a else 0
-    count = [0] * (max_val + 1)
-    for num in a:
-        count[num] += 1
-        yield _yield_array(step, a, f"Count occurrence of {num}",
-                           {"num": num}, {"updates": 1}, {"compare": [a.index(num)]})
+    n = len(a)
+    if not a:
+        yield _yield_array(step, a, "Final sorted array", {}, {}, {})
+        return
+    lo, hi = min(a), max(a)
+    sparse = hi - lo + 1 > sparse_factor * n
+    if sparse:
+        count = {}
+        yield _yield_array(step, a, ("Keys span [{}, {}]: counting {} values in a hash table", lo, hi, n),
+                           {"min": lo, "max": hi, "mode": "sparse"}, {}, {})
+    else:
+        count = [0] * (hi - lo + 1)
+        yield _yield_array(step, a, ("Keys span [{}, {}]: one counter per key, offset by {}", lo, hi, lo),
+                           {"min": lo, "max": hi, "mode": "dense"}, {}, {})
+    step += 1
+    for i, num in enumerate(a):
+        if sparse:
+            count[num] = count.get(num, 0) + 1
+        else:
+            count[num - lo] += 1
+        yield _yield_array(step, a, ("Count occurrence of {}", num),
+                           {"num": num}, {"updates": 1}, {"compare": [i]}, OP_VISIT)
         step += 1
-    output = []
-    for i, c in enumerate(count):
+    if sparse:
+        runs = ((key, count[key]) for key in sorted(count))
+    else:
+        runs = ((lo + key, c) for key, c in enumerate(count) if c)
+    # Keys are the values themselves, so the output can overwrite the input
+    pos = 0
+    for value, c in runs:
         for _ in range(c):
-            output.append(i)
-            yield _yield_array(step, output + a[len(output):],
-                               f"Place {i} into output", {"i": i}, {"writes": 1},
-                               {"swap": [len(output)-1]})
+            a[pos] = value
+            yield _yield_array(step, a, ("Place {} into output", value),
+                               {"value": value, "pos": pos}, {"writes": 1},
+                               {"swap": [pos]}, OP_WRITE)
             step += 1
-    a[:] = output
+            pos += 1
     yield _yield_array(step, a, "Final sorted array", {}, {}, {})
 
 # ------------------------------------------------------
 # Radix Sort
+# LSD passes over digits in any base; keys are offset by the minimum so
+# negative values sort too. Power-of-two bases use shifts and masks.
 # ------------------------------------------------------
-def radix_sort_frames(arr):
+RADIX_BASES = (10, 1 << 8, 1 << 11, 1 << 16)
+
+
+def _radix_digit(base):
+    if base & (base - 1) == 0:
+        bits = base.bit_length() - 1
+        mask = base - 1
+        return lambda key, p: (key >> (p * bits)) & mask
+    return lambda key, p: (key // base ** p) % base
+
+
+@budgeted("pass")
+def radix_sort_frames(arr, base=10):
+    if base < 2:
+        raise ValueError("radix base must be >= 2")
     a = arr[:]
     step = 0
+    n = len(a)
+    lo = min(a) if a else 0
+    digit = _radix_digit(base)
 
-    def counting_sort_exp(exp):
+    def counting_pass(p):
         nonlocal step
-        n = len(a)
+        digits = [digit(x - lo, p) for x in a]
+        count = [0] * base
+        for d in digits:
+            count[d] += 1
+        yield _yield_array(step, a, ("Pass {}: histogram of base-{} digits", p + 1, base),
+                           {"pass": p, "histogram": {d: c for d, c in enumerate(count) if c}},
+                           {"updates": n}, {})
+        step += 1
+        for d in range(1, base):
+            count[d] += count[d - 1]
         output = [0] * n
-        count = [0] * 10
-        for i in range(n):
-            index = (a[i] // exp) % 10
-            count[index] += 1
-        for i in range(1, 10):
-            count[i] += count[i - 1]
-        i = n - 1
-        while i >= 0:
-            index = (a[i] // exp) % 10
-            output[count[index] - 1] = a[i]
-            count[index] -= 1
-            yield _yield_array(step, output + a[len(output):],
-                               f"Place {a[i]} at position {count[index]}",
-                               {"exp": exp}, {}, {"swap": [count[index]]})
+        for i in range(n - 1, -1, -1):
+            d = digits[i]
+            count[d] -= 1
+            output[count[d]] = a[i]
+            yield _yield_array(step, output, ("Place {} at position {}", a[i], count[d]),
+                               {"pass": p, "digit": d}, {"writes": 1}, {"swap": [count[d]]}, OP_WRITE)
             step += 1
-            i -= 1
         for i in range(n):
             a[i] = output[i]
-            yield _yield_array(step, a, f"Write back {a[i]}",
-                               {"exp": exp}, {}, {"swap": [i]})
+            yield _yield_array(step, a, ("Write back {}", a[i]),
+                               {"pass": p}, {"writes": 1}, {"swap": [i]}, OP_WRITE)
             step += 1
 
-    max_val = max(a) if a else 0
-    exp = 1
-    while max_val // exp > 0:
-        yield from counting_sort_exp(exp)
-        exp *= 10
+    span = (max(a) - lo) if a else 0
+    p = 0
+    while span:
+        yield from counting_pass(p)
+        span //= base
+        p += 1
+    yield _yield_array(step, a, "Final sorted array", {}, {}, {})
+
+
+def radix_sort_numpy(values, base=1 << 16):
+    """
+    Headless LSD radix sort of an integer array, vectorized per pass.
+
+    Digits are extracted with shifts/masks over the whole array and
+    histogrammed with bincount; passes where every key has the same digit
+    are skipped. The stable argsort over uint8/uint16 digits is NumPy's
+    own counting sort, so each pass is O(n).
+    """
+    if base & (base - 1) or not 2 <= base <= 1 << 16:
+        raise ValueError("base must be a power of two up to 2**16")
+    a = np.asarray(values, dtype=np.int64)
+    if a.size == 0:
+        return a.copy()
+    bits = base.bit_length() - 1
+    mask = np.uint64(base - 1)
+    lo = a.min()
+    # Wrapping int64 subtraction reinterpreted as uint64 is the exact offset
+    keys = (a - lo).view(np.uint64)
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    for shift in range(0, int(keys.max()).bit_length(), bits):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+        if np.bincount(digits, minlength=base).max() == keys.size:
+            continue
+        keys = keys[np.argsort(digits, kind="stable")]
+    return keys.view(np.int64) + lo
+
+# ------------------------------------------------------
+# Shared range helpers for the hybrid sorts below.
+# Each takes the current step and returns the step after its frames.
+# ------------------------------------------------------
+def _compare(a, step, i, j, data=None):
+    return _yield_array(step, a, ("Compare {} and {}", a[i], a[j]),
+                        data or {}, {"comparisons": 1}, {"compare": [i, j]}, OP_COMPARE)
+
+
+def _swap(a, step, i, j, data=None):
+    a[i], a[j] = a[j], a[i]
+    return _yield_array(step, a, ("Swap {} and {}", a[i], a[j]),
+                        data or {}, {"swaps": 1}, {"swap": [i, j]}, OP_SWAP)
+
+
+def _insertion_range(a, lo, hi, step, data=None):
+    # Insertion sort of a[lo..hi], one frame per comparison and write
+    for i in range(lo + 1, hi + 1):
+        key = a[i]
+        j = i
+        while j > lo:
+            yield _yield_array(step, a, ("Compare {} with {}", key, a[j - 1]),
+                               data or {}, {"comparisons": 1}, {"compare": [j - 1, j]}, OP_COMPARE)
+            step += 1
+            if not key < a[j - 1]:
+                break
+            a[j] = a[j - 1]
+            yield _yield_array(step, a, ("Shift {} to the right", a[j]),
+                               data or {}, {"writes": 1}, {"swap": [j - 1, j]}, OP_WRITE)
+            step += 1
+            j -= 1
+        if j != i:
+            a[j] = key
+            yield _yield_array(step, a, ("Insert {} at position {}", key, j),
+                               data or {}, {"writes": 1}, {"swap": [j]}, OP_WRITE)
+            step += 1
+    return step
+
+
+def _heap_sort_range(a, lo, hi, step, data=None):
+    # Max-heap over a[lo..hi], used when a quicksort runs out of depth
+    n = hi - lo + 1
+
+    def sift(root, size):
+        nonlocal step
+        while True:
+            child = 2 * root + 1
+            if child >= size:
+                return
+            if child + 1 < size:
+                yield _compare(a, step, lo + child, lo + child + 1, data)
+                step += 1
+                if a[lo + child] < a[lo + child + 1]:
+                    child += 1
+            yield _compare(a, step, lo + root, lo + child, data)
+            step += 1
+            if not a[lo + root] < a[lo + child]:
+                return
+            yield _swap(a, step, lo + root, lo + child, data)
+            step += 1
+            root = child
+
+    for root in range(n // 2 - 1, -1, -1):
+        yield from sift(root, n)
+    for end in range(n - 1, 0, -1):
+        yield _swap(a, step, lo, lo + end, data)
+        step += 1
+        yield from sift(0, end)
+    return step
+
+# ------------------------------------------------------
+# Shell Sort
+# Gapped insertion sort; the gap sequence decides how fast it converges.
+# ------------------------------------------------------
+def _shell_gaps(n, sequence):
+    if sequence == "shell":
+        gaps = []
+        gap = n // 2
+        while gap > 0:
+            gaps.append(gap)
+            gap //= 2
+        return gaps or [1]
+    if sequence == "knuth":
+        gaps = [1]
+        while 3 * gaps[-1] + 1 < n:
+            gaps.append(3 * gaps[-1] + 1)
+    elif sequence == "sedgewick":
+        # 1, 8, 23, 77, 281, ... (4^k + 3 * 2^(k-1) + 1)
+        gaps = [1]
+        k = 1
+        while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+            gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+            k += 1
+    elif sequence == "ciura":
+        gaps = [1, 4, 10, 23, 57, 132, 301, 701]
+        while gaps[-1] < n:
+            gaps.append(int(gaps[-1] * 2.25))
+        gaps = [g for g in gaps if g < n] or [1]
+    else:
+        raise ValueError(f"unknown gap sequence {sequence!r}")
+    return gaps[::-1]
+
+
+SHELL_GAP_SEQUENCES = ("ciura", "knuth", "sedgewick", "shell")
+
+
+@budgeted("gap")
+def shell_sort_frames(arr, gaps="ciura"):
+    a = arr[:]
+    step = 0
+    n = len(a)
+    for gap in _shell_gaps(n, gaps):
+        yield _yield_array(step, a, ("Insertion sort with gap {}", gap), {"gap": gap}, {}, {})
+        step += 1
+        for i in range(gap, n):
+            key = a[i]
+            j = i
+            while j >= gap:
+                yield _yield_array(step, a, ("Compare {} with {}", key, a[j - gap]),
+                                   {"gap": gap, "i": i}, {"comparisons": 1},
+                                   {"compare": [j - gap, j]}, OP_COMPARE)
+                step += 1
+                if not key < a[j - gap]:
+                    break
+                a[j] = a[j - gap]
+                yield _yield_array(step, a, ("Move {} up by {}", a[j], gap),
+                                   {"gap": gap, "i": i}, {"writes": 1},
+                                   {"swap": [j - gap, j]}, OP_WRITE)
+                step += 1
+                j -= gap
+            if j != i:
+                a[j] = key
+                yield _yield_array(step, a, ("Insert {} at position {}", key, j),
+                                   {"gap": gap, "i": i}, {"writes": 1}, {"swap": [j]}, OP_WRITE)
+                step += 1
+
+# ------------------------------------------------------
+# Introsort
+# Median-of-three quicksort that switches to heap sort once the recursion
+# is 2*log2(n) deep, and to insertion sort for ranges of 16 or fewer.
+# ------------------------------------------------------
+@budgeted("range")
+def intro_sort_frames(arr):
+    a = arr[:]
+    step = 0
+
+    def median_to_end(lo, hi):
+        # Order a[lo], a[mid], a[hi], then park the median at hi as the pivot
+        nonlocal step
+        mid = (lo + hi) // 2
+        for i, j in ((lo, mid), (mid, hi), (lo, mid)):
+            yield _compare(a, step, i, j, {"range": [lo, hi]})
+            step += 1
+            if a[j] < a[i]:
+                yield _swap(a, step, i, j, {"range": [lo, hi]})
+                step += 1
+        yield _swap(a, step, mid, hi, {"range": [lo, hi]})
+        step += 1
+
+    def partition(lo, hi):
+        nonlocal step
+        yield from median_to_end(lo, hi)
+        pivot = a[hi]
+        i = lo - 1
+        for j in range(lo, hi):
+            yield _yield_array(step, a, ("Compare {} with pivot {}", a[j], pivot),
+                               {"j": j, "pivot": pivot, "range": [lo, hi]}, {"comparisons": 1},
+                               {"compare": [j], "pivot": [hi]}, OP_COMPARE)
+            step += 1
+            if a[j] <= pivot:
+                i += 1
+                if i != j:
+                    yield _swap(a, step, i, j, {"range": [lo, hi]})
+                    step += 1
+        if i + 1 != hi:
+            yield _swap(a, step, i + 1, hi, {"range": [lo, hi]})
+            step += 1
+        return i + 1
+
+    def intro(lo, hi, depth):
+        nonlocal step
+        while hi - lo + 1 > 16:
+            if depth == 0:
+                yield _yield_array(step, a, ("Depth limit hit: heap sort {}..{}", lo, hi),
+                                   {"range": [lo, hi]}, {}, {})
+                step += 1
+                step = yield from _heap_sort_range(a, lo, hi, step, {"range": [lo, hi]})
+                return
+            depth -= 1
+            p = yield from partition(lo, hi)
+            # Recurse into the smaller side, loop on the larger one
+            if p - lo < hi - p:
+                yield from intro(lo, p - 1, depth)
+                lo = p + 1
+            else:
+                yield from intro(p + 1, hi, depth)
+                hi = p - 1
+        step = yield from _insertion_range(a, lo, hi, step, {"range": [lo, hi]})
+
+    n = len(a)
+    yield from intro(0, n - 1, 2 * (n.bit_length() - 1) if n else 0)
+    yield _yield_array(step, a, "Final sorted array", {}, {}, {})
+
+# ------------------------------------------------------
+# Timsort
+# Natural runs (descending ones reversed) are extended to minrun with
+# binary insertion sort, kept on a stack whose lengths follow the Timsort
+# invariants, and merged with galloping once one side keeps winning.
+# Merges always buffer the left run (CPython picks the shorter side).
+# ------------------------------------------------------
+MIN_GALLOP = 7
+
+
+def _min_run(n):
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _gallop(key, seq, lo, length, right):
+    """Offset in seq[lo:lo+length] where key goes (after equals if right); returns (offset, comparisons)."""
+    before = (lambda x: not key < x) if right else (lambda x: x < key)
+    comparisons = 0
+    last, ofs = 0, 1
+    hi = length
+    # Probe offsets 0, 1, 3, 7, ... then binary search the last gap
+    while ofs - 1 < length:
+        comparisons += 1
+        if not before(seq[lo + ofs - 1]):
+            hi = ofs - 1
+            break
+        last = ofs
+        ofs = 2 * ofs + 1
+    while last < hi:
+        mid = (last + hi) // 2
+        comparisons += 1
+        if before(seq[lo + mid]):
+            last = mid + 1
+        else:
+            hi = mid
+    return last, comparisons
+
+
+@budgeted("run")
+def tim_sort_frames(arr, min_run=None):
+    a = arr[:]
+    step = 0
+    n = len(a)
+    minrun = min_run or _min_run(n)
+    runs = []  # [base, length] of pending runs, bottom of the stack first
+    min_gallop = MIN_GALLOP
+
+    def count_run(lo):
+        nonlocal step
+        hi = lo + 1
+        if hi == n:
+            return 1
+        yield _compare(a, step, lo, hi, {"run": lo})
+        step += 1
+        descending = a[hi] < a[lo]
+        hi += 1
+        while hi < n:
+            yield _compare(a, step, hi - 1, hi, {"run": lo})
+            step += 1
+            if (a[hi] < a[hi - 1]) != descending:
+                break
+            hi += 1
+        if descending:
+            # Strictly descending, so reversing keeps the sort stable
+            i, j = lo, hi - 1
+            while i < j:
+                yield _swap(a, step, i, j, {"run": lo})
+                step += 1
+                i += 1
+                j -= 1
+        return hi - lo
+
+    def binary_insertion(lo, start, hi):
+        # a[lo:start] is sorted; insert a[start:hi] one at a time
+        nonlocal step
+        for i in range(start, hi):
+            key = a[i]
+            pos, comparisons = _gallop(key, a, lo, i - lo, right=True)
+            pos += lo
+            a[pos + 1:i + 1] = a[pos:i]
+            a[pos] = key
+            yield _yield_array(step, a, ("Binary-insert {} at position {}", key, pos),
+                               {"run": lo}, {"comparisons": comparisons, "writes": i - pos + 1},
+                               {"swap": list(range(pos, i + 1))}, OP_WRITE)
+            step += 1
+
+    def merge_at(k):
+        nonlocal step, min_gallop
+        base1, len1 = runs[k]
+        base2, len2 = runs[k + 1]
+        runs[k] = [base1, len1 + len2]
+        del runs[k + 1]
+        data = {"run": base1, "merge": [base1, base2, base2 + len2 - 1]}
+        # Elements of run 1 already below run 2's head stay where they are
+        skip, comparisons = _gallop(a[base2], a, base1, len1, right=True)
+        # Elements of run 2 above run 1's tail stay where they are
+        keep2, more = _gallop(a[base2 - 1], a, base2, len2, right=False) if skip < len1 else (0, 0)
+        yield _yield_array(step, a, ("Merge runs at {} and {}: {} + {} already in place", base1, base2, skip, len2 - keep2),
+                           data, {"comparisons": comparisons + more}, {"compare": [base1 + skip, base2]}, OP_COMPARE)
+        step += 1
+        base1 += skip
+        len1 -= skip
+        len2 = keep2
+        if len1 == 0 or len2 == 0:
+            return
+        tmp = a[base1:base2]
+        i, j, k, end2 = 0, base2, base1, base2 + len2
+        while i < len1 and j < end2:
+            count1 = count2 = 0
+            # One element at a time until one side wins min_gallop times in a row
+            while i < len1 and j < end2:
+                yield _yield_array(step, a, ("Compare {} and {}", tmp[i], a[j]),
+                                   data, {"comparisons": 1}, {"compare": [k, j]}, OP_COMPARE)
+                step += 1
+                if a[j] < tmp[i]:
+                    a[k] = a[j]
+                    j += 1
+                    count2 += 1
+                    count1 = 0
+                else:
+                    a[k] = tmp[i]
+                    i += 1
+                    count1 += 1
+                    count2 = 0
+                yield _yield_array(step, a, ("Write {} at index {}", a[k], k),
+                                   data, {"writes": 1}, {"swap": [k]}, OP_WRITE)
+                step += 1
+                k += 1
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            # Galloping: copy whole blocks found by exponential search
+            while i < len1 and j < end2:
+                c1, comparisons = _gallop(a[j], tmp, i, len1 - i, right=True)
+                a[k:k + c1] = tmp[i:i + c1]
+                yield _yield_array(step, a, ("Gallop: copy {} from the left run", c1),
+                                   data, {"comparisons": comparisons, "writes": c1},
+                                   {"swap": list(range(k, k + c1))}, OP_WRITE)
+                step += 1
+                i += c1
+                k += c1
+                if i == len1:
+                    break
+                c2, comparisons = _gallop(tmp[i], a, j, end2 - j, right=False)
+                a[k:k + c2] = a[j:j + c2]
+                yield _yield_array(step, a, ("Gallop: copy {} from the right run", c2),
+                                   data, {"comparisons": comparisons, "writes": c2},
+                                   {"swap": list(range(k, k + c2))}, OP_WRITE)
+                step += 1
+                j += c2
+                k += c2
+                if c1 < MIN_GALLOP and c2 < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+        if i < len1:
+            a[k:k + len1 - i] = tmp[i:]
+            yield _yield_array(step, a, ("Copy the last {} from the left run", len1 - i),
+                               data, {"writes": len1 - i},
+                               {"swap": list(range(k, k + len1 - i))}, OP_WRITE)
+            step += 1
+
+    def merge_collapse():
+        while len(runs) > 1:
+            k = len(runs) - 2
+            if (k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1]) or \
+                    (k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]):
+                if runs[k - 1][1] < runs[k + 1][1]:
+                    k -= 1
+            elif runs[k][1] > runs[k + 1][1]:
+                break
+            yield from merge_at(k)
+
+    lo = 0
+    while lo < n:
+        run_len = yield from count_run(lo)
+        yield _yield_array(step, a, ("Run of {} at index {}", run_len, lo),
+                           {"run": lo, "minrun": minrun}, {}, {"swap": list(range(lo, lo + run_len))})
+        step += 1
+        if run_len < minrun:
+            force = min(minrun, n - lo)
+            yield from binary_insertion(lo, lo + run_len, lo + force)
+            run_len = force
+        runs.append([lo, run_len])
+        yield from merge_collapse()
+        lo += run_len
+    while len(runs) > 1:
+        k = len(runs) - 2
+        if k > 0 and runs[k - 1][1] < runs[k + 1][1]:
+            k -= 1
+        yield from merge_at(k)
+    yield _yield_array(step, a, "Final sorted array", {}, {}, {})
+
+# ------------------------------------------------------
+# Pattern-defeating Quicksort (pdqsort)
+# Introsort plus: partitions that needed no swaps get a bounded insertion
+# sort (sorted input finishes in O(n)), runs of equal keys are split off
+# with a left partition, and unbalanced partitions shuffle a few elements
+# before falling back to heap sort.
+# ------------------------------------------------------
+PDQ_INSERTION = 24
+PDQ_NINTHER = 128
+PDQ_PARTIAL_LIMIT = 8
+
+
+@budgeted("range")
+def pdq_sort_frames(arr):
+    a = arr[:]
+    step = 0
+
+    def less(i, j, data):
+        nonlocal step
+        yield _compare(a, step, i, j, data)
+        step += 1
+        return a[i] < a[j]
+
+    def swap(i, j, data):
+        nonlocal step
+        yield _swap(a, step, i, j, data)
+        step += 1
+
+    def sort2(i, j, data):
+        if (yield from less(j, i, data)):
+            yield from swap(i, j, data)
+
+    def sort3(i, j, k, data):
+        yield from sort2(i, j, data)
+        yield from sort2(j, k, data)
+        yield from sort2(i, j, data)
+
+    def partition_right(lo, hi, data):
+        # Pivot at a[lo]; returns (pivot position, whether no swaps were needed)
+        i = lo + 1
+        while i <= hi and (yield from less(i, lo, data)):
+            i += 1
+        j = hi
+        while j > i - 1 and not (yield from less(j, lo, data)):
+            j -= 1
+        already = i > j
+        while i < j:
+            yield from swap(i, j, data)
+            i += 1
+            while (yield from less(i, lo, data)):
+                i += 1
+            j -= 1
+            while not (yield from less(j, lo, data)):
+                j -= 1
+        if i - 1 != lo:
+            yield from swap(lo, i - 1, data)
+        return i - 1, already
+
+    def partition_left(lo, hi, data):
+        # Keys equal to the pivot go left; used when the pivot equals its predecessor
+        j = hi
+        while j > lo and (yield from less(lo, j, data)):
+            j -= 1
+        i = lo + 1
+        while i < j and not (yield from less(lo, i, data)):
+            i += 1
+        while i < j:
+            yield from swap(i, j, data)
+            j -= 1
+            while (yield from less(lo, j, data)):
+                j -= 1
+            i += 1
+            while i < j and not (yield from less(lo, i, data)):
+                i += 1
+        if j != lo:
+            yield from swap(lo, j, data)
+        return j
+
+    def partial_insertion(lo, hi, data):
+        # Insertion sort that gives up after PDQ_PARTIAL_LIMIT moves
+        nonlocal step
+        moved = 0
+        for cur in range(lo + 1, hi + 1):
+            if moved > PDQ_PARTIAL_LIMIT:
+                return False
+            if (yield from less(cur, cur - 1, data)):
+                key = a[cur]
+                j = cur
+                while True:
+                    a[j] = a[j - 1]
+                    j -= 1
+                    if j == lo:
+                        break
+                    yield _yield_array(step, a, ("Compare {} with {}", key, a[j - 1]),
+                                       data, {"comparisons": 1}, {"compare": [j - 1, j]}, OP_COMPARE)
+                    step += 1
+                    if not key < a[j - 1]:
+                        break
+                a[j] = key
+                yield _yield_array(step, a, ("Move {} back to position {}", key, j),
+                                   data, {"writes": cur - j + 1}, {"swap": list(range(j, cur + 1))}, OP_WRITE)
+                step += 1
+                moved += cur - j
+        return True
+
+    def pdq(lo, hi, bad_allowed, leftmost):
+        nonlocal step
+        while True:
+            size = hi - lo + 1
+            data = {"range": [lo, hi]}
+            if size < PDQ_INSERTION:
+                step = yield from _insertion_range(a, lo, hi, step, data)
+                return
+            s2 = size // 2
+            if size > PDQ_NINTHER:
+                yield from sort3(lo, lo + s2, hi, data)
+                yield from sort3(lo + 1, lo + s2 - 1, hi - 1, data)
+                yield from sort3(lo + 2, lo + s2 + 1, hi - 2, data)
+                yield from sort3(lo + s2 - 1, lo + s2, lo + s2 + 1, data)
+                yield from swap(lo, lo + s2, data)
+            else:
+                yield from sort3(lo + s2, lo, hi, data)
+            if not leftmost and not (yield from less(lo - 1, lo, data)):
+                # The pivot equals the element before this range: peel off all equal keys
+                lo = (yield from partition_left(lo, hi, data)) + 1
+                continue
+            p, already = yield from partition_right(lo, hi, data)
+            l_size, r_size = p - lo, hi - p
+            if l_size < size // 8 or r_size < size // 8:
+                bad_allowed -= 1
+                if bad_allowed == 0:
+                    yield _yield_array(step, a, ("Too many bad partitions: heap sort {}..{}", lo, hi), data, {}, {})
+                    step += 1
+                    step = yield from _heap_sort_range(a, lo, hi, step, data)
+                    return
+                yield _yield_array(step, a, ("Unbalanced partition at {}: shuffle to break the pattern", p), data, {}, {})
+                step += 1
+                if l_size >= PDQ_INSERTION:
+                    yield from swap(lo, lo + l_size // 4, data)
+                    yield from swap(p - 1, p - l_size // 4, data)
+                if r_size >= PDQ_INSERTION:
+                    yield from swap(p + 1, p + 1 + r_size // 4, data)
+                    yield from swap(hi, hi - r_size // 4, data)
+            elif already:
+                yield _yield_array(step, a, ("No swaps needed around {}: try insertion sort", a[p]), data, {}, {})
+                step += 1
+                if (yield from partial_insertion(lo, p - 1, data)) and \
+                        (yield from partial_insertion(p + 1, hi, data)):
+                    return
+            yield from pdq(lo, p - 1, bad_allowed, leftmost)
+            lo = p + 1
+            leftmost = False
+
+    n = len(a)
+    yield from pdq(0, n - 1, n.bit_length(), True)
+    yield _yield_array(step, a, "Final sorted array", {}, {}, {})
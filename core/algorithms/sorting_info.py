@@ -0,0 +1,648 @@
+# Overview, code snippets and practice links shown on the Sorting page,
+# keyed by the registry name. Complexity and properties live in the registry.
+SORTING_INFO = {
+    "Insertion Sort": {
+        "description": """
+- **Insertion Sort**: Builds a sorted array one item at a time, like sorting playing cards. Efficient for small or nearly sorted datasets.
+- **Use Cases**: Small lists, online sorting where data arrives incrementally.
+        """,
+        "code": {
+            "Python": """
+def insertion_sort(arr):
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        while j >= 0 and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+    return arr
+
+# Example
+arr = [12, 11, 13, 5, 6]
+print(insertion_sort(arr))  # [5, 6, 11, 12, 13]
+            """,
+            "Java": """
+void insertionSort(int arr[]) {
+    int n = arr.length;
+    for (int i = 1; i < n; ++i) {
+        int key = arr[i];
+        int j = i - 1
+        while (j >= 0 && arr[j] > key) {
+            arr[j + 1] = arr[j];
+            j = j - 1;
+        }
+        arr[j + 1] = key;
+    }
+}
+
+// Example
+int arr[] = {12, 11, 13, 5, 6};
+insertionSort(arr);
+            """,
+            "C++": """
+void insertionSort(int arr[], int n) {
+    for (int i = 1; i < n; i++) {
+        int key = arr[i];
+        int j = i - 1;
+        while (j >= 0 && arr[j] > key) {
+            arr[j + 1] = arr[j];
+            j = j - 1;
+        }
+        arr[j + 1] = key;
+    }
+}
+
+// Example
+int arr[] = {12, 11, 13, 5, 6};
+int n = sizeof(arr)/sizeof(arr[0]);
+insertionSort(arr, n);
+            """
+        },
+        "problems": [
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"},
+            {"title": "Insertion Sort List", "url": "https://leetcode.com/problems/insertion-sort-list/"},
+            {"title": "Sort Array By Parity", "url": "https://leetcode.com/problems/sort-array-by-parity/"}
+        ],
+        "resources": [
+            {"title": "GFG: Insertion Sort", "url": "https://www.geeksforgeeks.org/insertion-sort/"}
+        ]
+    },
+    "Bubble Sort": {
+        "description": """
+- **Bubble Sort**: Repeatedly swaps adjacent elements if they are in the wrong order. Simple but inefficient for large lists.
+- **Use Cases**: Educational purposes, small datasets.
+        """,
+        "code": {
+            "Python": """
+def bubble_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+    return arr
+
+# Example
+arr = [64, 34, 25, 12, 22]
+print(bubble_sort(arr))  # [12, 22, 25, 34, 64]
+            """,
+            "Java": """
+void bubbleSort(int arr[]) {
+    int n = arr.length;
+    for (int i = 0; i < n - 1; i++)
+        for (int j = 0; j < n - i - 1; j++)
+            if (arr[j] > arr[j + 1]) {
+                int temp = arr[j];
+                arr[j] = arr[j + 1];
+                arr[j + 1] = temp;
+            }
+}
+            """,
+            "C++": """
+void bubbleSort(int arr[], int n) {
+    for (int i = 0; i < n - 1; i++)
+        for (int j = 0; j < n - i - 1; j++)
+            if (arr[j] > arr[j + 1])
+                swap(arr[j], arr[j + 1]);
+}
+            """
+        },
+        "problems": [
+            {"title": "Sort Colors", "url": "https://leetcode.com/problems/sort-colors/"},
+            {"title": "Sort List", "url": "https://leetcode.com/problems/sort-list/"}
+        ],
+        "resources": [
+            {"title": "GFG: Bubble Sort", "url": "https://www.geeksforgeeks.org/bubble-sort/"}
+        ]
+    },
+    "Selection Sort": {
+        "description": """
+- **Selection Sort**: Finds the minimum element in the unsorted part and swaps it with the first unsorted element.
+- **Use Cases**: Small lists, when minimizing swaps is important.
+        """,
+        "code": {
+            "Python": """
+def selection_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        min_idx = i
+        for j in range(i + 1, n):
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        arr[i], arr[min_idx] = arr[min_idx], arr[i]
+    return arr
+
+# Example
+arr = [64, 25, 12, 22, 11]
+print(selection_sort(arr))  # [11, 12, 22, 25, 64]
+            """,
+            "Java": """
+void selectionSort(int arr[]) {
+    int n = arr.length;
+    for (int i = 0; i < n - 1; i++) {
+        int min_idx = i;
+        for (int j = i + 1; j < n; j++)
+            if (arr[j] < arr[min_idx])
+                min_idx = j;
+        int temp = arr[min_idx];
+        arr[min_idx] = arr[i];
+        arr[i] = temp;
+    }
+}
+            """,
+            "C++": """
+void selectionSort(int arr[], int n) {
+    for (int i = 0; i < n - 1; i++) {
+        int min_idx = i;
+        for (int j = i + 1; j < n; j++)
+            if (arr[j] < arr[min_idx])
+                min_idx = j;
+        swap(arr[min_idx], arr[i]);
+    }
+}
+            """
+        },
+        "problems": [
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"},
+            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"}
+        ],
+        "resources": [
+            {"title": "GFG: Selection Sort", "url": "https://www.geeksforgeeks.org/selection-sort/"}
+        ]
+    },
+    "Merge Sort": {
+        "description": """
+- **Merge Sort**: Divide-and-conquer algorithm that splits the array, sorts halves, and merges them.
+- **Use Cases**: Large datasets, external sorting.
+        """,
+        "code": {
+            "Python": """
+def merge_sort(arr):
+    if len(arr) > 1:
+        mid = len(arr) // 2
+        L = arr[:mid]
+        R = arr[mid:]
+        merge_sort(L)
+        merge_sort(R)
+        i = j = k = 0
+        while i < len(L) and j < len(R):
+            if L[i] <= R[j]:
+                arr[k] = L[i]
+                i += 1
+            else:
+                arr[k] = R[j]
+                j += 1
+            k += 1
+        while i < len(L):
+            arr[k] = L[i]
+            i += 1
+            k += 1
+        while j < len(R):
+            arr[k] = R[j]
+            j += 1
+            k += 1
+
+# Example
+arr = [12, 11, 13, 5, 6, 7]
+merge_sort(arr)
+print(arr)  # [5, 6, 7, 11, 12, 13]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Merge k Sorted Lists", "url": "https://leetcode.com/problems/merge-k-sorted-lists/"},
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "GFG: Merge Sort", "url": "https://www.geeksforgeeks.org/merge-sort/"}
+        ]
+    },
+    "Quick Sort": {
+        "description": """
+- **Quick Sort**: Divide-and-conquer algorithm that picks a pivot and partitions the array around it.
+- **Use Cases**: General-purpose sorting, efficient on average.
+- **Partition schemes**: Lomuto (one pivot), three-way (Dijkstra: <, =, > regions, so keys equal to the pivot are settled in one pass) and dual-pivot (Yaroslavskiy: two pivots split the range into three parts). Three-way and dual-pivot stay fast on inputs with many duplicate keys.
+        """,
+        "code": {
+            "Python": """
+def quick_sort(arr, low, high):
+    if low < high:
+        pi = partition(arr, low, high)
+        quick_sort(arr, low, pi - 1)
+        quick_sort(arr, pi + 1, high)
+
+def partition(arr, low, high):
+    pivot = arr[high]
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+# Example
+arr = [10, 7, 8, 9, 1, 5]
+quick_sort(arr, 0, len(arr) - 1)
+print(arr)  # [1, 5, 7, 8, 9, 10]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"},
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "GFG: Quick Sort", "url": "https://www.geeksforgeeks.org/quick-sort/"}
+        ]
+    },
+    "Heap Sort": {
+        "description": """
+- **Heap Sort**: Builds a max-heap and repeatedly extracts the maximum element.
+- **Use Cases**: When O(n log n) time is needed with O(1) space.
+- **Floyd's sift-down**: Follows the larger children down to a leaf, then climbs back to where the sifted key belongs. The key moved to the root usually belongs near the bottom, so this takes about half the comparisons of the classic sift.
+        """,
+        "code": {
+            "Python": """
+def heap_sort(arr):
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        heapify(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[i], arr[0] = arr[0], arr[i]
+        heapify(arr, i, 0)
+
+def heapify(arr, n, i):
+    largest = i
+    l = 2 * i + 1
+    r = 2 * i + 2
+    if l < n and arr[l] > arr[largest]:
+        largest = l
+    if r < n and arr[r] > arr[largest]:
+        largest = r
+    if largest != i:
+        arr[i], arr[largest] = arr[largest], arr[i]
+        heapify(arr, n, largest)
+
+# Example
+arr = [12, 11, 13, 5, 6, 7]
+heap_sort(arr)
+print(arr)  # [5, 6, 7, 11, 12, 13]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Kth Largest Element in an Array", "url": "https://leetcode.com/problems/kth-largest-element-in-an-array/"},
+            {"title": "Merge k Sorted Lists", "url": "https://leetcode.com/problems/merge-k-sorted-lists/"}
+        ],
+        "resources": [
+            {"title": "GFG: Heap Sort", "url": "https://www.geeksforgeeks.org/heap-sort/"}
+        ]
+    },
+    "Counting Sort": {
+        "description": """
+- **Counting Sort**: Counts occurrences of each value and reconstructs the sorted array. Non-comparison based.
+- **Use Cases**: When values are in a limited range (e.g., integers 0-100). Sparse ranges fall back to counting in a hash table.
+        """,
+        "code": {
+            "Python": """
+def counting_sort(arr):
+    if not arr:
+        return []
+    lo, hi = min(arr), max(arr)
+    count = [0] * (hi - lo + 1)  # offset by lo, so negatives work
+    for num in arr:
+        count[num - lo] += 1
+    output = []
+    for i, c in enumerate(count):
+        output.extend([lo + i] * c)
+    return output
+
+# Example
+arr = [4, 2, 2, 8, 3, 3, 1]
+print(counting_sort(arr))  # [1, 2, 2, 3, 3, 4, 8]
+print(counting_sort([3, -1, 0]))  # [-1, 0, 3]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Sort Characters By Frequency", "url": "https://leetcode.com/problems/sort-characters-by-frequency/"},
+            {"title": "Sort Array by Increasing Frequency", "url": "https://leetcode.com/problems/sort-array-by-increasing-frequency/"}
+        ],
+        "resources": [
+            {"title": "GFG: Counting Sort", "url": "https://www.geeksforgeeks.org/counting-sort/"}
+        ]
+    },
+    "Radix Sort": {
+        "description": """
+- **Radix Sort**: Sorts integers by grouping by individual digits (using Counting Sort as subroutine).
+- **Use Cases**: Sorting large numbers or strings. Larger bases (2^8, 2^11, 2^16) mean fewer passes; negative keys are offset by the minimum.
+        """,
+        "code": {
+            "Python": """
+def radix_sort(arr):
+    max_val = max(arr)
+    exp = 1
+    while max_val // exp > 0:
+        counting_sort_exp(arr, exp)
+        exp *= 10
+
+def counting_sort_exp(arr, exp):
+    n = len(arr)
+    output = [0] * n
+    count = [0] * 10
+    for i in range(n):
+        index = (arr[i] // exp) % 10
+        count[index] += 1
+    for i in range(1, 10):
+        count[i] += count[i - 1]
+    i = n - 1
+    while i >= 0:
+        index = (arr[i] // exp) % 10
+        output[count[index] - 1] = arr[i]
+        count[index] -= 1
+        i -= 1
+    for i in range(n):
+        arr[i] = output[i]
+
+# Example
+arr = [170, 45, 75, 90, 802, 24, 2, 66]
+radix_sort(arr)
+print(arr)  # [2, 24, 45, 66, 75, 90, 170, 802]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Sort Characters By Frequency", "url": "https://leetcode.com/problems/sort-characters-by-frequency/"},
+            {"title": "Maximum Gap", "url": "https://leetcode.com/problems/maximum-gap/"}
+        ],
+        "resources": [
+            {"title": "GFG: Radix Sort", "url": "https://www.geeksforgeeks.org/radix-sort/"}
+        ]
+    },
+    "Shell Sort": {
+        "description": """
+- **Shell Sort**: Insertion sort over elements a gap apart, with the gap shrinking to 1. Far-apart inversions are fixed early, so the final pass is cheap.
+- **Use Cases**: Embedded/low-memory sorting; the gap sequence (Ciura, Knuth, Sedgewick, Shell) decides the running time.
+        """,
+        "code": {
+            "Python": """
+def shell_sort(arr, gaps=(701, 301, 132, 57, 23, 10, 4, 1)):
+    n = len(arr)
+    for gap in (g for g in gaps if g < n):
+        for i in range(gap, n):
+            key = arr[i]
+            j = i
+            while j >= gap and key < arr[j - gap]:
+                arr[j] = arr[j - gap]
+                j -= gap
+            arr[j] = key
+    return arr
+
+# Example
+print(shell_sort([23, 12, 1, 8, 34, 54, 2, 3]))  # [1, 2, 3, 8, 12, 23, 34, 54]
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+// Refer to GFG for full C++ implementation.
+            """
+        },
+        "problems": [
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "GFG: Shell Sort", "url": "https://www.geeksforgeeks.org/shellsort/"}
+        ]
+    },
+    "Introsort": {
+        "description": """
+- **Introsort**: Quick sort with a median-of-three pivot that switches to heap sort once recursion gets 2·log₂(n) deep, and to insertion sort on small ranges.
+- **Use Cases**: C++ `std::sort` and .NET `Array.Sort`; quick sort speed without its O(n²) worst case.
+        """,
+        "code": {
+            "Python": """
+import heapq, math
+
+def introsort(arr):
+    def sort(lo, hi, depth):
+        while hi - lo > 16:
+            if depth == 0:
+                arr[lo:hi] = heapq.nsmallest(hi - lo, arr[lo:hi])  # heap sort fallback
+                return
+            depth -= 1
+            pivot = sorted([arr[lo], arr[(lo + hi) // 2], arr[hi - 1]])[1]
+            i, j = lo, hi - 1
+            while i <= j:
+                while arr[i] < pivot: i += 1
+                while arr[j] > pivot: j -= 1
+                if i <= j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    i, j = i + 1, j - 1
+            sort(lo, j + 1, depth)
+            lo = i
+        arr[lo:hi] = sorted(arr[lo:hi])  # insertion sort in practice
+    sort(0, len(arr), 2 * int(math.log2(max(len(arr), 1))))
+    return arr
+            """,
+            "Java": """
+// Refer to GFG for full Java implementation.
+            """,
+            "C++": """
+std::sort(arr.begin(), arr.end());  // introsort in libstdc++ and libc++
+            """
+        },
+        "problems": [
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "GFG: Introsort", "url": "https://www.geeksforgeeks.org/introsort-or-introspective-sort/"}
+        ]
+    },
+    "Timsort": {
+        "description": """
+- **Timsort**: Finds natural runs (reversing descending ones), extends short runs to *minrun* with binary insertion sort, and merges runs under stack-size invariants. Merges switch to *galloping* when one run keeps winning.
+- **Use Cases**: Python's `sorted`/`list.sort`, Java object sorting; excellent on partially ordered data.
+        """,
+        "code": {
+            "Python": """
+def min_run(n):
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+# Python's built-in sort is Timsort
+arr = [5, 6, 7, 1, 2, 3, 9, 8]
+print(sorted(arr))  # [1, 2, 3, 5, 6, 7, 8, 9]
+            """,
+            "Java": """
+Arrays.sort(objects);  // Timsort for object arrays
+            """,
+            "C++": """
+// Refer to the CPython listsort.txt notes for the full algorithm.
+            """
+        },
+        "problems": [
+            {"title": "Merge Intervals", "url": "https://leetcode.com/problems/merge-intervals/"},
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "CPython: listsort.txt", "url": "https://github.com/python/cpython/blob/main/Objects/listsort.txt"},
+            {"title": "GFG: TimSort", "url": "https://www.geeksforgeeks.org/timsort/"}
+        ]
+    },
+    "Pdqsort": {
+        "description": """
+- **Pattern-defeating Quicksort**: Introsort that detects patterns. A partition that needed no swaps gets a bounded insertion sort (sorted input runs in O(n)), keys equal to the previous pivot are split off in one pass, and unbalanced partitions shuffle a few elements before falling back to heap sort.
+- **Use Cases**: Rust's `sort_unstable`, Go's `sort.Sort`, Boost.
+        """,
+        "code": {
+            "Python": """
+# See core/algorithms/sorting.py (pdq_sort_frames) for the full traced version.
+# The key ideas on top of introsort:
+#  - partition_right reports whether it swapped anything; if not, try a
+#    partial insertion sort that gives up after 8 moves
+#  - if the pivot equals the element before the range, partition_left
+#    puts all equal keys left and skips them
+#  - a partition smaller than n/8 on one side shuffles a few elements
+            """,
+            "Java": """
+// Refer to the pdqsort paper for details.
+            """,
+            "C++": """
+pdqsort(arr.begin(), arr.end());  // github.com/orlp/pdqsort
+            """
+        },
+        "problems": [
+            {"title": "Sort Colors", "url": "https://leetcode.com/problems/sort-colors/"},
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "pdqsort (Orson Peters)", "url": "https://github.com/orlp/pdqsort"},
+            {"title": "Paper: Pattern-defeating Quicksort", "url": "https://arxiv.org/abs/2106.05123"}
+        ]
+    },
+    "Parallel Merge Sort": {
+        "description": """
+- **Parallel Merge Sort**: Cuts the array into one chunk per worker process, merge-sorts the chunks concurrently, then does a k-way merge of the sorted chunks with a min-heap. Each lane below is one worker.
+- **Use Cases**: Large in-memory arrays on multi-core machines; the same split/merge shape as distributed sorts.
+        """,
+        "code": {
+            "Python": """
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+def parallel_sort(arr, workers=4):
+    size = -(-len(arr) // workers)
+    chunks = [arr[i:i + size] for i in range(0, len(arr), size)]
+    with ProcessPoolExecutor(workers) as pool:
+        runs = list(pool.map(sorted, chunks))
+    return list(heapq.merge(*runs))
+
+if __name__ == "__main__":
+    print(parallel_sort([9, 4, 7, 1, 8, 2, 6, 3]))  # [1, 2, 3, 4, 6, 7, 8, 9]
+            """,
+            "Java": """
+Arrays.parallelSort(arr);  // fork/join merge sort
+            """,
+            "C++": """
+std::sort(std::execution::par, arr.begin(), arr.end());
+            """
+        },
+        "problems": [
+            {"title": "Merge k Sorted Lists", "url": "https://leetcode.com/problems/merge-k-sorted-lists/"},
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "Python: concurrent.futures", "url": "https://docs.python.org/3/library/concurrent.futures.html"}
+        ]
+    },
+    "Sorting Network": {
+        "description": """
+- **Sorting Network**: A fixed sequence of compare-exchange layers that sorts any input of a given size. Every comparator in a layer touches different positions, so a whole layer runs at once; each step below is one layer. Bitonic sort merges pairs of sorted halves by comparing mirrored positions and then halving the distance; Batcher's odd-even merge sort uses slightly fewer comparators in the same number of layers.
+- **Use Cases**: GPUs and SIMD units, sorting many small fixed-size arrays at once, hardware sorters and constant-time code where the comparisons must not depend on the data.
+        """,
+        "code": {
+            "Python": """
+def bitonic_sort(arr):
+    a = arr[:]
+    n = len(a)  # a power of two
+    k = 2
+    while k <= n:
+        j = k // 2
+        while j:
+            for i in range(n):
+                l = i ^ j
+                if l > i and (a[i] > a[l]) == (i & k == 0):
+                    a[i], a[l] = a[l], a[i]
+            j //= 2
+        k *= 2
+    return a
+
+if __name__ == "__main__":
+    print(bitonic_sort([9, 4, 7, 1, 8, 2, 6, 3]))  # [1, 2, 3, 4, 6, 7, 8, 9]
+            """,
+            "Java": """
+static void bitonicSort(int[] a) {  // a.length is a power of two
+    int n = a.length;
+    for (int k = 2; k <= n; k <<= 1)
+        for (int j = k >> 1; j > 0; j >>= 1)
+            for (int i = 0; i < n; i++) {
+                int l = i ^ j;
+                if (l > i && (a[i] > a[l]) == ((i & k) == 0)) {
+                    int t = a[i]; a[i] = a[l]; a[l] = t;
+                }
+            }
+}
+            """,
+            "C++": """
+void bitonicSort(std::vector<int>& a) {  // a.size() is a power of two
+    size_t n = a.size();
+    for (size_t k = 2; k <= n; k <<= 1)
+        for (size_t j = k >> 1; j > 0; j >>= 1)
+            for (size_t i = 0; i < n; i++) {
+                size_t l = i ^ j;
+                if (l > i && (a[i] > a[l]) == ((i & k) == 0))
+                    std::swap(a[i], a[l]);
+            }
+}
+            """
+        },
+        "problems": [
+            {"title": "Sort an Array", "url": "https://leetcode.com/problems/sort-an-array/"}
+        ],
+        "resources": [
+            {"title": "Wikipedia: Bitonic sorter", "url": "https://en.wikipedia.org/wiki/Bitonic_sorter"},
+            {"title": "Wikipedia: Batcher odd-even mergesort", "url": "https://en.wikipedia.org/wiki/Batcher_odd%E2%80%93even_mergesort"}
+        ]
+    }
+}
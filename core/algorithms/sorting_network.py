@@ -0,0 +1,154 @@
+from functools import lru_cache
+
+import numpy as np
+
+from core.models.frame import OP_COMPARE, OP_SWAP
+from core.models.budget import budgeted
+from core.algorithms.sorting import _yield_array
+
+NETWORKS = ("bitonic", "odd_even_merge")
+
+
+# ------------------------------------------------------
+# Comparator layers
+# A network is a fixed list of layers; a layer is a list of (i, j)
+# comparators with i < j and no index used twice, so every
+# compare-exchange in it can run at once. Each comparator leaves the
+# smaller key at i. Both networks are built for the next power of two
+# and comparators reaching past n are dropped, which is the same as
+# padding the input with +inf keys that never move.
+# ------------------------------------------------------
+def _bitonic_layers(n):
+    size = 1 << max(n - 1, 0).bit_length()
+    layers = []
+    k = 2
+    while k <= size:
+        # Merging two sorted halves of each k-block: compare mirrored
+        # positions first, then half-cleaners at distance k/4, k/8, ..., 1
+        layers.append([(i, i ^ (k - 1)) for i in range(size) if not i & k // 2 and i ^ (k - 1) < n])
+        j = k // 4
+        while j:
+            layers.append([(i, i ^ j) for i in range(size) if not i & j and i ^ j < n])
+            j //= 2
+        k *= 2
+    return layers
+
+
+def _odd_even_merge_layers(n):
+    # Batcher's odd-even merge sort, one layer per (p, k)
+    layers = []
+    p = 1
+    while p < n:
+        k = p
+        while k:
+            layers.append([(i + j, i + j + k)
+                           for j in range(k % p, n - k, 2 * k)
+                           for i in range(min(k, n - j - k))
+                           if (i + j) // (2 * p) == (i + j + k) // (2 * p)])
+            k //= 2
+        p *= 2
+    return layers
+
+
+@lru_cache(maxsize=None)
+def network_layers(n, network="bitonic"):
+    """The comparator layers of a sorting network for n keys (cached), as tuples of (i, j) pairs."""
+    if network not in NETWORKS:
+        raise ValueError(f"unknown sorting network {network!r}")
+    build = _bitonic_layers if network == "bitonic" else _odd_even_merge_layers
+    return tuple(tuple(layer) for layer in build(n) if layer)
+
+
+# ------------------------------------------------------
+# Sorting Network
+# One frame per layer: every compare-exchange of the layer is applied,
+# then the frame shows the comparators that ran and the pairs that swapped.
+# ------------------------------------------------------
+@budgeted("layer")
+def sorting_network_frames(arr, network="bitonic"):
+    a = arr[:]
+    step = 0
+    layers = network_layers(len(a), network)
+    yield _yield_array(step, a, ("{} network for {} keys: {} layers, {} comparators",
+                                 network.replace("_", "-").capitalize(), len(a), len(layers),
+                                 sum(len(layer) for layer in layers)),
+                       {"network": network, "layers": len(layers)}, {}, {})
+    step += 1
+    for number, layer in enumerate(layers, 1):
+        swapped = []
+        for i, j in layer:
+            if a[j] < a[i]:
+                a[i], a[j] = a[j], a[i]
+                swapped += [i, j]
+        yield _yield_array(step, a, ("Layer {}: {} compare-exchanges, {} swapped",
+                                     number, len(layer), len(swapped) // 2),
+                           {"layer": number, "comparators": [list(pair) for pair in layer]},
+                           {"comparisons": len(layer), "swaps": len(swapped) // 2} if swapped
+                           else {"comparisons": len(layer)},
+                           {"compare": [k for pair in layer for k in pair], "swap": swapped},
+                           OP_SWAP if swapped else OP_COMPARE)
+        step += 1
+    yield _yield_array(step, a, "Final sorted array", {"layer": "done"}, {}, {})
+
+
+# ------------------------------------------------------
+# Headless: many small arrays at once
+# ------------------------------------------------------
+def _exchange(lo, hi):
+    # Compare-exchange two equally shaped views of the same array in place
+    low = np.minimum(lo, hi)
+    np.maximum(lo, hi, out=hi)
+    lo[...] = low
+
+
+@lru_cache(maxsize=None)
+def _layer_indices(n, network):
+    return [(np.array([i for i, _ in layer]), np.array([j for _, j in layer]))
+            for layer in network_layers(n, network)]
+
+
+def network_sort_numpy(batch, network="bitonic"):
+    """
+    Sort every row of a 2-D numeric array (or a single 1-D array) with a
+    sorting network, one whole layer per NumPy call.
+
+    The batch is transposed so each key position is a contiguous run over
+    all rows. For bitonic, each layer is then a pair of strided views of
+    the padded keys (reshaped into blocks, with the mirrored half
+    reversed), exchanged with ``np.minimum``/``np.maximum``. Odd-even
+    merge layers are not regular enough for views, so they gather and
+    scatter through cached index arrays instead. Rows that are not a power
+    of two long are padded with the dtype's largest value.
+    """
+    a = np.asarray(batch)
+    if network not in NETWORKS:
+        raise ValueError(f"unknown sorting network {network!r}")
+    if a.ndim not in (1, 2):
+        raise ValueError("batch must be a 1-D or 2-D array")
+    rows = a.reshape(1, -1) if a.ndim == 1 else a
+    m, n = rows.shape
+    if n < 2:
+        return a.copy()
+    if network == "odd_even_merge":
+        keys = np.array(rows.T, order="C")
+        for i, j in _layer_indices(n, network):
+            lo, hi = keys[i], keys[j]
+            keys[i] = np.minimum(lo, hi)
+            keys[j] = np.maximum(lo, hi)
+    else:
+        size = 1 << (n - 1).bit_length()
+        fill = np.inf if a.dtype.kind == "f" else np.iinfo(a.dtype).max
+        keys = np.full((size, m), fill, dtype=a.dtype)
+        keys[:n] = rows.T
+        k = 2
+        while k <= size:
+            blocks = keys.reshape(size // k, 2, k // 2, m)
+            _exchange(blocks[:, 0], blocks[:, 1, ::-1])
+            j = k // 4
+            while j:
+                blocks = keys.reshape(size // (2 * j), 2, j, m)
+                _exchange(blocks[:, 0], blocks[:, 1])
+                j //= 2
+            k *= 2
+    out = np.ascontiguousarray(keys[:n].T)
+    return out.reshape(a.shape)
@@ -1,5 +1,6 @@
 from typing import Generator, List, Any, Dict
 from core.models.frame import Frame
+from core.models.budget import budgeted
 
 def _f(step, values, desc, hl=None, vars=None):
     return Frame(step=step, view=values[:], narration=desc, highlights=hl or {}, data=vars or {})
@@ -7,15 +8,17 @@ def _f(step, values, desc, hl=None, vars=None):
 # -----------------------------
 # Stack (LIFO)
 # -----------------------------
+@budgeted()
 def stack_push_frames(values: List[Any], x: Any) -> Generator[Frame, None, None]:
     a = values[:]
     step = 0
 
     yield _f(step, a, "Start push()", hl={"top": len(a)-1 if a else None}, vars={"push_value": x}); step += 1
     a.append(x)
-    yield _f(step, a, f"Push {x} to top", hl={"top": len(a)-1, "current": len(a)-1}, vars={"top": len(a)-1}); step += 1
+    yield _f(step, a, ("Push {} to top", x), hl={"top": len(a)-1, "current": len(a)-1}, vars={"top": len(a)-1}); step += 1
     yield _f(step, a, "Done."); step += 1
 
+@budgeted()
 def stack_pop_frames(values: List[Any]) -> Generator[Frame, None, Any]:
     a = values[:]
     step = 0
@@ -26,14 +29,15 @@ def stack_pop_frames(values: List[Any]) -> Generator[Frame, None, Any]:
 
     yield _f(step, a, "Start pop()", hl={"top": len(a)-1}, vars={"top": len(a)-1}); step += 1
     top_val = a[-1]
-    yield _f(step, a, f"Peek top = {top_val}", hl={"top": len(a)-1, "current": len(a)-1}, vars={"top": len(a)-1, "value": top_val}); step += 1
+    yield _f(step, a, ("Peek top = {}", top_val), hl={"top": len(a)-1, "current": len(a)-1}, vars={"top": len(a)-1, "value": top_val}); step += 1
     a.pop()
-    yield _f(step, a, f"Remove top {top_val}", hl={"moved": len(a)}, vars={"popped": top_val}); step += 1
+    yield _f(step, a, ("Remove top {}", top_val), hl={"moved": len(a)}, vars={"popped": top_val}); step += 1
     yield _f(step, a, "Done."); step += 1
 
 # -----------------------------
 # Queue (FIFO)
 # -----------------------------
+@budgeted()
 def queue_enqueue_frames(values: List[Any], x: Any) -> Generator[Frame, None, None]:
     q = values[:]
     step = 0
@@ -42,9 +46,10 @@ def queue_enqueue_frames(values: List[Any], x: Any) -> Generator[Frame, None, No
 
     yield _f(step, q, "Start enqueue()", hl={"front": front, "rear": rear}, vars={"enqueue_value": x}); step += 1
     q.append(x)
-    yield _f(step, q, f"Insert {x} at rear", hl={"front": 0 if q else None, "rear": len(q)-1, "current": len(q)-1}, vars={"rear": len(q)-1}); step += 1
+    yield _f(step, q, ("Insert {} at rear", x), hl={"front": 0 if q else None, "rear": len(q)-1, "current": len(q)-1}, vars={"rear": len(q)-1}); step += 1
     yield _f(step, q, "Done."); step += 1
 
+@budgeted()
 def queue_dequeue_frames(values: List[Any]) -> Generator[Frame, None, Any]:
     q = values[:]
     step = 0
@@ -54,7 +59,7 @@ def queue_dequeue_frames(values: List[Any]) -> Generator[Frame, None, Any]:
 
     yield _f(step, q, "Start dequeue()", hl={"front": 0, "rear": len(q)-1}, vars={"front": 0, "rear": len(q)-1}); step += 1
     front_val = q[0]
-    yield _f(step, q, f"Peek front = {front_val}", hl={"front": 0, "current": 0}, vars={"front": 0, "value": front_val}); step += 1
+    yield _f(step, q, ("Peek front = {}", front_val), hl={"front": 0, "current": 0}, vars={"front": 0, "value": front_val}); step += 1
     q.pop(0)
-    yield _f(step, q, f"Remove front {front_val}", hl={"moved": 0, "front": 0 if q else None, "rear": len(q)-1 if q else None}, vars={"dequeued": front_val}); step += 1
+    yield _f(step, q, ("Remove front {}", front_val), hl={"moved": 0, "front": 0 if q else None, "rear": len(q)-1 if q else None}, vars={"dequeued": front_val}); step += 1
     yield _f(step, q, "Done."); step += 1
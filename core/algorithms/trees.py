@@ -3,6 +3,7 @@
 from typing import Generator, Dict, Any
 from collections import deque
 from core.models.frame import Frame  # Assume this is your Frame class
+from core.models.budget import budgeted
 
 
 class Node:
@@ -39,9 +40,9 @@ class BST:
     def __init__(self):
         self.root = None
 
+    @budgeted("current")
     def insert_frames(self, value) -> Generator[Frame, None, None]:
         step = 0
-        comps = 0
         current = self.root
         parent = None
 
@@ -51,19 +52,17 @@ class BST:
             view=generate_view(self.root),
             narration="Start BST insertion.",
             data={"value": value},
-            metrics={"comparisons": comps},
             highlights={},
         )
         step += 1
 
         while current:
-            comps += 1
             yield Frame(
                 step=step,
                 view=generate_view(self.root),
-                narration=f"Compare with node {current.value}.",
+                narration=("Compare with node {}.", current.value),
                 data={"current": current.value, "value": value},
-                metrics={"comparisons": comps},
+                metrics={"comparisons": 1},
                 highlights={current.value: "yellow"},  # Highlight current comparison
             )
             step += 1
@@ -85,9 +84,8 @@ class BST:
         yield Frame(
             step=step,
             view=generate_view(self.root),
-            narration=f"Inserted {value}.",
+            narration=("Inserted {}.", value),
             data={"inserted": value},
-            metrics={"comparisons": comps},
             highlights={value: "green"},  # Highlight inserted node
         )
 
@@ -127,6 +125,7 @@ class AVL(BST):
         y.height = max(self.get_height(y.left), self.get_height(y.right)) + 1
         return y
 
+    @budgeted("current")
     def insert_frames(self, value) -> Generator[Frame, None, None]:
         # Similar to BST but with balancing steps
         # For brevity, use BST logic; expand for rotations with yields
@@ -137,13 +136,14 @@ class MinHeap:
     def __init__(self):
         self.heap = []
 
+    @budgeted("i")
     def insert_frames(self, value) -> Generator[Frame, None, None]:
         step = 0
         self.heap.append(value)
         yield Frame(
             step=step,
             view=self.heap[:],
-            narration=f"Append {value} to min-heap",
+            narration=("Append {} to min-heap", value),
             data={"value": value},
             metrics={},
             highlights={"append": [len(self.heap) - 1]},
@@ -156,7 +156,7 @@ class MinHeap:
             yield Frame(
                 step=step,
                 view=self.heap[:],
-                narration=f"Compare {self.heap[i]} with parent {self.heap[parent]}",
+                narration=("Compare {} with parent {}", self.heap[i], self.heap[parent]),
                 data={"i": i, "parent": parent},
                 metrics={"comparisons": 1},
                 highlights={"compare": [i, parent]},
@@ -168,7 +168,7 @@ class MinHeap:
                 yield Frame(
                     step=step,
                     view=self.heap[:],
-                    narration=f"Swap {self.heap[i]} with {self.heap[parent]}",
+                    narration=("Swap {} with {}", self.heap[i], self.heap[parent]),
                     data={"i": i, "parent": parent},
                     metrics={"swaps": 1},
                     highlights={"swap": [i, parent]},
@@ -181,7 +181,7 @@ class MinHeap:
         yield Frame(
             step=step,
             view=self.heap[:],
-            narration=f"Inserted {value} into min-heap",
+            narration=("Inserted {} into min-heap", value),
             data={"inserted": value},
             metrics={},
             highlights={"inserted": [0]},  # Highlight root
@@ -192,13 +192,14 @@ class MaxHeap:
     def __init__(self):
         self.heap = []
 
+    @budgeted("i")
     def insert_frames(self, value) -> Generator[Frame, None, None]:
         step = 0
         self.heap.append(value)
         yield Frame(
             step=step,
             view=self.heap[:],
-            narration=f"Append {value} to max-heap",
+            narration=("Append {} to max-heap", value),
             data={"value": value},
             metrics={},
             highlights={"append": [len(self.heap) - 1]},
@@ -211,7 +212,7 @@ class MaxHeap:
             yield Frame(
                 step=step,
                 view=self.heap[:],
-                narration=f"Compare {self.heap[i]} with parent {self.heap[parent]}",
+                narration=("Compare {} with parent {}", self.heap[i], self.heap[parent]),
                 data={"i": i, "parent": parent},
                 metrics={"comparisons": 1},
                 highlights={"compare": [i, parent]},
@@ -223,7 +224,7 @@ class MaxHeap:
                 yield Frame(
                     step=step,
                     view=self.heap[:],
-                    narration=f"Swap {self.heap[i]} with {self.heap[parent]}",
+                    narration=("Swap {} with {}", self.heap[i], self.heap[parent]),
                     data={"i": i, "parent": parent},
                     metrics={"swaps": 1},
                     highlights={"swap": [i, parent]},
@@ -236,7 +237,7 @@ class MaxHeap:
         yield Frame(
             step=step,
             view=self.heap[:],
-            narration=f"Inserted {value} into max-heap",
+            narration=("Inserted {} into max-heap", value),
             data={"inserted": value},
             metrics={},
             highlights={"inserted": [0]},  # Highlight root
@@ -0,0 +1,182 @@
+from functools import wraps
+
+from core.models.frame import OP_SWAP, OP_WRITE, OP_VISIT
+
+
+class FrameBudget:
+    """
+    Decides which frames of a generator are worth keeping.
+
+    Dropped frames never lose their metrics: their deltas are folded into
+    the next kept frame, and the last frame is always kept, so the totals
+    at every kept frame (and the final totals) are exactly those of the
+    undecimated run.
+
+    Modes:
+      - ``every``: keep every Nth frame
+      - ``significant``: keep frames whose op changed the structure
+        (swaps, writes, visits by default)
+      - ``passes``: keep the last frame of each pass, where a pass is a run
+        of frames sharing the generator's pass variable (e.g. ``i`` in
+        bubble sort)
+      - ``adaptive``: keep roughly ``target`` evenly spaced frames
+    """
+
+    MODES = ("every", "significant", "passes", "adaptive")
+
+    def __init__(self, mode, every=1, ops=(OP_SWAP, OP_WRITE, OP_VISIT), target=None):
+        if mode not in self.MODES:
+            raise ValueError(f"unknown budget mode {mode!r}")
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        if mode == "adaptive" and (target is None or target < 2):
+            raise ValueError("adaptive budget needs a target of at least 2 frames")
+        self.mode = mode
+        self.every = every
+        self.ops = frozenset(ops)
+        self.target = target
+
+    @classmethod
+    def every_nth(cls, n):
+        return cls("every", every=n)
+
+    @classmethod
+    def significant(cls, ops=(OP_SWAP, OP_WRITE, OP_VISIT)):
+        return cls("significant", ops=ops)
+
+    @classmethod
+    def passes(cls):
+        return cls("passes")
+
+    @classmethod
+    def adaptive(cls, target):
+        return cls("adaptive", target=target)
+
+    def __repr__(self):
+        return f"FrameBudget({self.mode!r}, every={self.every}, target={self.target})"
+
+
+def _fold(frame, pending):
+    if pending:
+        frame.add_metrics(pending)
+        pending.clear()
+    return frame
+
+
+def _carry(pending, frame):
+    for name, value in frame.metrics.items():
+        pending[name] = pending.get(name, 0) + value
+
+
+def _selective(frames, budget, pass_key):
+    """Keep-or-drop with one frame of lookahead; returns the generator's return value."""
+    if budget.mode == "every":
+        keep = lambda k, frame, nxt: k % budget.every == 0
+    elif budget.mode == "significant":
+        keep = lambda k, frame, nxt: frame.op in budget.ops
+    else:
+        # A pass ends when the next frame names a different pass; frames
+        # without the pass variable stay in the current one
+        current = [None]
+
+        def keep(k, frame, nxt):
+            mine = frame.data.get(pass_key, current[0])
+            current[0] = mine
+            return nxt.data.get(pass_key, mine) != mine
+
+    pending = {}
+    held = None
+    k = 0
+    while True:
+        try:
+            frame = next(frames)
+        except StopIteration as stop:
+            if held is not None:
+                yield _fold(held, pending)
+            return stop.value
+        if held is not None:
+            if k == 0 or keep(k, held, frame):
+                yield _fold(held, pending)
+            else:
+                _carry(pending, held)
+            k += 1
+        held = frame
+
+
+def _adaptive(frames, target):
+    """
+    Thin a stream of unknown length down to at most ``target`` frames.
+
+    Kept frames are buffered; whenever the buffer reaches twice the target,
+    every other frame is dropped and the sampling stride doubles. Nothing is
+    yielded until the generator is exhausted, so memory stays O(target).
+    """
+    kept = []
+    pending = {}
+    skipped = None  # last frame seen, if the stride skipped it
+    stride = 1
+    k = 0
+    while True:
+        try:
+            frame = next(frames)
+        except StopIteration as stop:
+            result = stop.value
+            break
+        if skipped is not None:
+            _carry(pending, skipped)
+            skipped = None
+        if k % stride == 0:
+            kept.append(_fold(frame, pending))
+            if len(kept) >= 2 * target:
+                kept = _halve(kept)
+                stride *= 2
+        else:
+            skipped = frame
+        k += 1
+    if skipped is not None:
+        # The real last frame fell between strides: keep it, so the final
+        # state and totals are exact
+        kept.append(_fold(skipped, pending))
+    while len(kept) > target:
+        kept = _halve(kept)
+    yield from kept
+    return result
+
+
+def _halve(kept):
+    """Drop every other frame (keeping the first and last), folding metrics forward."""
+    last = len(kept) - 1
+    out = []
+    pending = {}
+    for i, frame in enumerate(kept):
+        if i % 2 == 0 or i == last:
+            out.append(_fold(frame, pending))
+        else:
+            _carry(pending, frame)
+    return out
+
+
+def decimate(frames, budget=None, pass_key=None):
+    """Apply ``budget`` to a frame generator (no-op when budget is None)."""
+    frames = iter(frames)
+    if budget is None:
+        return frames
+    if budget.mode == "adaptive":
+        return _adaptive(frames, budget.target)
+    return _selective(frames, budget, pass_key)
+
+
+def budgeted(pass_key=None):
+    """
+    Give a frame generator a ``budget=`` keyword.
+
+    ``pass_key`` names the data variable that identifies a pass of the
+    algorithm, used by the ``passes`` mode.
+    """
+    def wrap(fn):
+        @wraps(fn)
+        def run(*args, budget=None, **kwargs):
+            return decimate(fn(*args, **kwargs), budget, pass_key)
+        run.pass_key = pass_key
+        return run
+    return wrap
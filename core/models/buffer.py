@@ -0,0 +1,121 @@
+from collections import OrderedDict
+
+from core.models.frame import DeltaTrace
+from core.models.metrics import MetricTotals
+from core.models.trace import FrameTrace
+
+
+class FrameBuffer:
+    """
+    Pulls frames from a generator only as playback reaches them.
+
+    Frames near the cursor are kept as Frame objects (at most ``window`` of
+    them, least recently used dropped first). Every pulled frame is also
+    appended to a DeltaTrace, so frames that fell out of the window are
+    rebuilt from that compact store when the user scrubs back to them.
+    The first frame is available as soon as the generator yields it.
+
+    With ``keep_errors`` an exception raised by the generator ends the run
+    instead of propagating from whichever call pulled it: the frames before
+    it stay playable and the exception is kept on ``error``.
+    """
+
+    def __init__(self, frames, window=256, keyframe_every=256, prefetch=32, keep_errors=False):
+        self._source = iter(frames)
+        self.window = window
+        self.prefetch = prefetch
+        self.keep_errors = keep_errors
+        self.exhausted = False
+        self.error = None
+        self._store = DeltaTrace(keyframe_every)
+        self._recent = OrderedDict()  # frame index -> Frame
+        self._prefix = {}             # metric name -> running totals per pulled frame
+        self._totals = MetricTotals(self._prefix)
+        # Pull the first few frames up front so the page knows it has something to show
+        self.has(0)
+
+    def __len__(self):
+        """Frames pulled so far; the full length is known once ``exhausted``."""
+        return len(self._store)
+
+    def __bool__(self):
+        return self.has(0)
+
+    def _pull(self, upto):
+        while len(self._store) <= upto and not self.exhausted:
+            try:
+                frame = next(self._source)
+            except StopIteration:
+                self.exhausted = True
+                self._source = None
+                break
+            except Exception as exc:
+                if not self.keep_errors:
+                    raise
+                self.error = exc
+                self.exhausted = True
+                self._source = None
+                break
+            k = len(self._store)
+            self._store.append(frame)
+            self._remember(k, frame)
+            self._accumulate(k, frame)
+
+    def _remember(self, k, frame):
+        self._recent[k] = frame
+        self._recent.move_to_end(k)
+        while len(self._recent) > self.window:
+            self._recent.popitem(last=False)
+
+    def _accumulate(self, k, frame):
+        metrics = frame.metrics
+        for name in metrics:
+            if name not in self._prefix:
+                self._prefix[name] = [0] * k
+        for name, prefix in self._prefix.items():
+            prefix.append((prefix[-1] if prefix else 0) + metrics.get(name, 0))
+
+    def has(self, k):
+        """Whether frame k exists, pulling from the generator as needed."""
+        if k >= len(self):
+            self._pull(k + self.prefetch)
+        return 0 <= k < len(self)
+
+    def seek(self, k):
+        if not self.has(k):
+            raise IndexError("frame index out of range")
+        frame = self._recent.get(k)
+        if frame is None:
+            frame = self._store[k]
+            self._remember(k, frame)
+        else:
+            self._recent.move_to_end(k)
+        return frame
+
+    __getitem__ = seek
+
+    def __iter__(self):
+        # One forward pass over the store (it keeps growing as frames are
+        # pulled), instead of rebuilding each frame from its keyframe
+        stored = iter(self._store)
+        k = 0
+        while self.has(k):
+            frame = next(stored)
+            yield self._recent.get(k, frame)
+            k += 1
+
+    def totals_at(self, k):
+        """Cumulative metrics through frame k."""
+        if not self.has(k):
+            raise IndexError("frame index out of range")
+        return self._totals.at(k)
+
+    def to_frame_trace(self, meta=None):
+        """Drain, then pack the stored keyframes and deltas into a FrameTrace without diffing again."""
+        self.drain()
+        return FrameTrace.from_delta_trace(self._store, meta)
+
+    def drain(self):
+        """Pull everything that is left; returns the final length."""
+        self._pull(float("inf"))
+        return len(self)
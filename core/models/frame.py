@@ -1,14 +1,95 @@
+# Small-int op codes describing what a frame did to the structure
+OP_INFO = 0
+OP_COMPARE = 1
+OP_SWAP = 2
+OP_WRITE = 3
+OP_VISIT = 4
+OP_NAMES = ("info", "compare", "swap", "write", "visit")
+
+# Key tuples are shared between frames: a frame only owns its value tuples.
+# Only all-string shapes (variable, metric and highlight names) are
+# interned, and at most _MAX_SHAPES of them: keys such as graph node values
+# would grow the table forever, and 1, 1.0 and True are equal dict keys.
+_SHAPES = {}
+_MAX_SHAPES = 4096
+
+
+def _intern(keys):
+    shape = _SHAPES.get(keys)
+    if shape is not None:
+        return shape
+    if len(_SHAPES) < _MAX_SHAPES and all(type(k) is str for k in keys):
+        _SHAPES[keys] = keys
+    return keys
+
+
+def _split(mapping):
+    if not mapping:
+        return (), ()
+    return _intern(tuple(mapping)), tuple(mapping.values())
+
+
+def format_narration(narration):
+    """Render a narration that may still be a (template, *args) tuple."""
+    if type(narration) is tuple:
+        return narration[0].format(*narration[1:])
+    return narration
+
+
 class Frame:
-    def __init__(self, step, view, narration="", data=None, metrics=None, highlights=None):
+    __slots__ = ("step", "values", "_narration", "op",
+                 "_dk", "_dv", "_mk", "_mv", "_hk", "_hv")
+
+    def __init__(self, step, view, narration="", data=None, metrics=None, highlights=None, op=OP_INFO):
         self.step = step
-        # Always store view as a dict with values + highlights
-        self.view = {
-            "values": list(view),
-            "highlights": highlights or {}
-        }
-        self.narration = narration
-        self.data = data or {}
-        self.metrics = metrics or {}
+        self.values = list(view)
+        # Either a finished string or a (template, *args) tuple formatted on read
+        self._narration = narration
+        self.op = op
+        self._dk, self._dv = _split(data)
+        self._mk, self._mv = _split(metrics)
+        self._hk, self._hv = _split(highlights)
+
+    def _parts(self):
+        # Everything but the values, for stores that keep values elsewhere
+        return (self.step, self._narration, self.op,
+                self._dk, self._dv, self._mk, self._mv, self._hk, self._hv)
+
+    @classmethod
+    def _from_parts(cls, values, parts):
+        frame = cls.__new__(cls)
+        frame.values = list(values)
+        (frame.step, frame._narration, frame.op,
+         frame._dk, frame._dv, frame._mk, frame._mv, frame._hk, frame._hv) = parts
+        return frame
+
+    def add_metrics(self, extra):
+        """Fold extra metric deltas into this frame (used when frames are dropped)."""
+        metrics = self.metrics
+        for name, value in extra.items():
+            metrics[name] = metrics.get(name, 0) + value
+        self._mk, self._mv = _split(metrics)
+
+    @property
+    def narration(self):
+        return format_narration(self._narration)
+
+    @property
+    def data(self):
+        return dict(zip(self._dk, self._dv))
+
+    @property
+    def metrics(self):
+        return dict(zip(self._mk, self._mv))
+
+    @property
+    def highlights(self):
+        return dict(zip(self._hk, self._hv))
+
+    @property
+    def view(self):
+        # Same shape the views have always consumed: values + highlights
+        return {"values": self.values, "highlights": self.highlights}
 
     def to_dict(self):
         return {
@@ -17,4 +98,90 @@ class Frame:
             "narration": self.narration,
             "data": self.data,
             "metrics": self.metrics,
+            "op": OP_NAMES[self.op],
         }
+
+
+def _diff(prev, cur):
+    """Return (length, indices, values) for the positions where cur differs from prev."""
+    idx = tuple(i for i, (x, y) in enumerate(zip(prev, cur)) if x != y)
+    # Positions past the old end are always new
+    idx += tuple(range(len(prev), len(cur)))
+    return len(cur), idx, tuple(cur[i] for i in idx)
+
+
+class DeltaTrace:
+    """
+    Frame store that keeps only the changed indices/values of each frame.
+
+    A full copy of the values is kept every ``keyframe_every`` frames; any
+    other frame is rebuilt from the nearest keyframe before it, so memory
+    grows with the number of writes rather than frames x array length.
+    """
+
+    def __init__(self, keyframe_every=256):
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every must be >= 1")
+        self.keyframe_every = keyframe_every
+        self._keyframes = []  # full value lists, one per block of frames
+        self._deltas = []     # (length, indices, values) per frame, None on keyframes
+        self._meta = []       # Frame._parts() per frame
+        self._last = None
+
+    @classmethod
+    def from_frames(cls, frames, keyframe_every=256):
+        trace = cls(keyframe_every)
+        for frame in frames:
+            trace.append(frame)
+        return trace
+
+    def append(self, frame):
+        values = frame.values
+        if len(self._meta) % self.keyframe_every == 0:
+            self._keyframes.append(list(values))
+            self._deltas.append(None)
+        else:
+            self._deltas.append(_diff(self._last, values))
+        self._last = list(values)
+        self._meta.append(frame._parts())
+
+    def __len__(self):
+        return len(self._meta)
+
+    def values_at(self, k):
+        """Rebuild the value list of frame k from its keyframe."""
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("frame index out of range")
+        base = k - k % self.keyframe_every
+        values = list(self._keyframes[base // self.keyframe_every])
+        for j in range(base + 1, k + 1):
+            values = _apply(values, self._deltas[j])
+        return values
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        values = self.values_at(k)
+        return Frame._from_parts(values, self._meta[k])
+
+    def __iter__(self):
+        values = None
+        for k, delta in enumerate(self._deltas):
+            if delta is None:
+                values = list(self._keyframes[k // self.keyframe_every])
+            else:
+                values = _apply(values, delta)
+            yield Frame._from_parts(values, self._meta[k])
+
+
+def _apply(values, delta):
+    length, idx, vals = delta
+    if length < len(values):
+        del values[length:]
+    elif length > len(values):
+        values.extend([None] * (length - len(values)))
+    for i, v in zip(idx, vals):
+        values[i] = v
+    return values
@@ -0,0 +1,53 @@
+from itertools import accumulate
+
+import numpy as np
+
+# Metrics every page shows, even when an algorithm never emits them
+STANDARD_METRICS = ("comparisons", "swaps", "writes", "visited")
+
+
+class MetricTotals:
+    """
+    Running totals of per-frame metric deltas.
+
+    All generators emit metrics as deltas (``{"comparisons": 1}`` on the
+    frame that compared). The prefix sums are built once per trace, so the
+    totals through any frame are a single array lookup per metric.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix  # metric name -> cumulative totals, one entry per frame
+
+    @classmethod
+    def from_trace(cls, trace):
+        """Prefix sums over the metric columns of a FrameTrace (vectorized)."""
+        return cls({name: np.cumsum(column) for name, column in trace.metrics.items()})
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Prefix sums over any iterable of frames."""
+        rows = [frame.metrics for frame in frames]
+        names = dict.fromkeys(name for row in rows for name in row)
+        return cls({name: list(accumulate(row.get(name, 0) for row in rows)) for name in names})
+
+    def __len__(self):
+        return len(next(iter(self.prefix.values()), ()))
+
+    def at(self, k):
+        """Totals of every metric through frame k (inclusive)."""
+        totals = dict.fromkeys(STANDARD_METRICS, 0)
+        for name, prefix in self.prefix.items():
+            value = prefix[k]
+            totals[name] = value.item() if hasattr(value, "item") else value
+        return totals
+
+    def between(self, start, stop):
+        """Totals accumulated by frames start..stop-1."""
+        after = self.at(stop - 1)
+        if start == 0:
+            return after
+        before = self.at(start - 1)
+        return {name: after[name] - before[name] for name in after}
+
+    def final(self):
+        return self.at(len(self) - 1) if len(self) else dict.fromkeys(STANDARD_METRICS, 0)
@@ -0,0 +1,243 @@
+import numpy as np
+
+from core.models.frame import DeltaTrace, Frame, _apply
+from core.models.metrics import MetricTotals
+
+
+def _column(values):
+    """Pack a list into the narrowest NumPy column that holds it exactly."""
+    if all(type(v) is int for v in values):
+        try:
+            return np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif all(type(v) in (int, float) for v in values):
+        return np.asarray(values, dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class FrameTrace:
+    """
+    Columnar store for a drained frame generator.
+
+    Each frame is one row across parallel NumPy columns: ``step``, ``op``,
+    the frame length, and one column per metric. The indices touched by a
+    frame (and the values written there) live in flat ``touched``/``written``
+    arrays sliced by ``offsets``. Full values are kept every
+    ``keyframe_every`` frames so ``trace[k]`` only replays one block.
+
+    The columns are packed from a DeltaTrace, which does the diffing; this
+    is the form used for analysis (totals, snapshot matrices) and trace
+    files, while playback goes through FrameBuffer.
+    """
+
+    def __init__(self, keyframe_every=256, meta=None):
+        self.keyframe_every = keyframe_every
+        self.meta = meta or {}  # e.g. algorithm name and input, kept by trace files
+        self.step = self.op = self.length = None
+        self.offsets = self.touched = self.written = None
+        self.metrics = {}
+        self._keyframes = []
+        self._narration_ids = None
+        self._narrations = []
+        self._narration_args = []
+        self._extra = []  # (data keys, data values, highlight keys, highlight values, metric keys)
+        self._totals = None
+
+    @classmethod
+    def from_frames(cls, frames, keyframe_every=256, meta=None):
+        """Drain any ``*_frames`` generator (or list of frames) into a trace."""
+        return cls.from_delta_trace(DeltaTrace.from_frames(frames, keyframe_every), meta)
+
+    @classmethod
+    def from_delta_trace(cls, store, meta=None):
+        """
+        Pack a DeltaTrace into columns.
+
+        The store's keyframes and per-frame deltas are reused as they are,
+        so nothing is diffed again: the cost is one pass over the recorded
+        writes, not over every frame's full values.
+        """
+        trace = cls(store.keyframe_every, meta)
+        steps, ops, lengths, offsets = [], [], [], [0]
+        touched, written, metric_rows = [], [], []
+        narration_ids, narration_args, interned = [], [], {}
+        for k, (delta, parts) in enumerate(zip(store._deltas, store._meta)):
+            if delta is None:
+                values = store._keyframes[k // store.keyframe_every]
+                trace._keyframes.append(_column(values))
+                lengths.append(len(values))
+            else:
+                length, idx, vals = delta
+                touched.extend(idx)
+                written.extend(vals)
+                lengths.append(length)
+            offsets.append(len(touched))
+            step, narration, op, dk, dv, mk, mv, hk, hv = parts
+            steps.append(step)
+            ops.append(op)
+            metric_rows.append((mk, mv))
+            # Templates are interned across the trace; only the arguments are per frame
+            if type(narration) is tuple:
+                narration_ids.append(interned.setdefault(narration[0], len(interned)))
+                narration_args.append(narration[1:])
+            else:
+                narration_ids.append(interned.setdefault(narration, len(interned)))
+                narration_args.append(None)
+            trace._extra.append((dk, dv, hk, hv, mk))
+
+        trace.step = np.asarray(steps, dtype=np.int64)
+        trace.op = np.asarray(ops, dtype=np.int8)
+        trace.length = np.asarray(lengths, dtype=np.int32)
+        trace.offsets = np.asarray(offsets, dtype=np.int64)
+        trace.touched = np.asarray(touched, dtype=np.int32)
+        trace.written = _column(written)
+        trace._narration_ids = np.asarray(narration_ids, dtype=np.int32)
+        trace._narrations = list(interned)
+        trace._narration_args = narration_args
+
+        names = dict.fromkeys(name for keys, _ in metric_rows for name in keys)
+        for name in names:
+            trace.metrics[name] = _column(
+                [dict(zip(keys, vals)).get(name, 0) for keys, vals in metric_rows])
+        return trace
+
+    def __len__(self):
+        return 0 if self.step is None else len(self.step)
+
+    def values_at(self, k):
+        """Return the values of frame k as a NumPy array."""
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("frame index out of range")
+        base = k - k % self.keyframe_every
+        keyframe = self._keyframes[base // self.keyframe_every]
+        size = max(int(self.length[base:k + 1].max()), len(keyframe))
+        values = np.empty(size, dtype=np.result_type(keyframe.dtype, self.written.dtype))
+        values[:len(keyframe)] = keyframe
+        lo, hi = self.offsets[base + 1], self.offsets[k + 1]
+        if hi > lo:
+            # Later writes win: keep the last occurrence of every index
+            idx = self.touched[lo:hi][::-1]
+            uniq, first = np.unique(idx, return_index=True)
+            values[uniq] = self.written[lo:hi][::-1][first]
+        return values[:self.length[k]]
+
+    def snapshot_matrix(self, rows=None, cols=None):
+        """
+        Replay the whole trace into a (frames x n) matrix in one vectorized pass.
+
+        Keyframes and recorded writes are scattered into the matrix by
+        (row, index) and every column is forward-filled, so no frame is
+        rebuilt on its own. With ``rows``, only that many evenly spaced
+        frames are kept (the first and last always are); with ``cols``,
+        adjacent indices are averaged into at most that many bins. Indices
+        past a frame's length keep their last value.
+
+        Returns (matrix, frame indices of the rows, first index of each column).
+        """
+        total = len(self)
+        if not total:
+            return np.empty((0, 0)), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        n = int(self.length.max())
+        if rows is None or rows >= total:
+            frames = np.arange(total, dtype=np.int64)
+        else:
+            frames = np.unique(np.linspace(0, total - 1, max(rows, 2)).round().astype(np.int64))
+
+        # Every write as (frame, index, value); a keyframe writes its whole array
+        key_lengths = [len(keyframe) for keyframe in self._keyframes]
+        key_frames = np.arange(len(self._keyframes), dtype=np.int64) * self.keyframe_every
+        frame = np.concatenate([np.repeat(key_frames, key_lengths),
+                                np.repeat(np.arange(total, dtype=np.int64), np.diff(self.offsets))])
+        index = np.concatenate([np.arange(size, dtype=np.int64) for size in key_lengths] + [self.touched])
+        value = np.concatenate(self._keyframes + [self.written])
+        if value.dtype == object:
+            raise TypeError("snapshot_matrix needs numeric frame values")
+
+        # A write shows from the first kept row at or after its frame; later writes win
+        order = np.argsort(frame, kind="stable")
+        row = np.searchsorted(frames, frame[order])
+        keep = row < len(frames)
+        cell = (row[keep] * n + index[order][keep])[::-1]
+        cell, last = np.unique(cell, return_index=True)
+        matrix = np.zeros(len(frames) * n, dtype=value.dtype)
+        matrix[cell] = value[order][keep][::-1][last]
+        source = np.zeros(len(frames) * n, dtype=np.int64)
+        source[cell] = cell // n
+        source = np.maximum.accumulate(source.reshape(len(frames), n), axis=0)
+        matrix = matrix.reshape(len(frames), n)[source, np.arange(n)]
+
+        starts = np.arange(n, dtype=np.int64)
+        if cols is not None and cols < n:
+            starts = np.unique(np.linspace(0, n, max(cols, 1), endpoint=False).astype(np.int64))
+            widths = np.diff(np.append(starts, n))
+            matrix = np.add.reduceat(matrix.astype(np.float64), starts, axis=1) / widths
+        return matrix, frames, starts
+
+    def _frame(self, k, values):
+        dk, dv, hk, hv, mk = self._extra[k]
+        mv = tuple(self.metrics[name][k].item() for name in mk)
+        template = self._narrations[self._narration_ids[k]]
+        args = self._narration_args[k]
+        narration = template if args is None else (template, *args)
+        parts = (int(self.step[k]), narration, int(self.op[k]),
+                 dk, dv, mk, mv, hk, hv)
+        return Frame._from_parts(values, parts)
+
+    def __getitem__(self, k):
+        """Frame k in time bounded by the keyframe interval (or a list of frames for a slice)."""
+        if isinstance(k, slice):
+            return list(self._iter_range(*k.indices(len(self))))
+        values = self.values_at(k).tolist()
+        return self._frame(k if k >= 0 else k + len(self), values)
+
+    # Random access only: step-by-step playback with a cached window is FrameBuffer's job
+    seek = __getitem__
+
+    def _delta(self, k):
+        # Frame k's (length, indices, values), in the form DeltaTrace stores it
+        lo, hi = self.offsets[k], self.offsets[k + 1]
+        return int(self.length[k]), self.touched[lo:hi].tolist(), self.written[lo:hi].tolist()
+
+    def _iter_range(self, start, stop, stride=1):
+        if stride != 1 or start >= stop:
+            for k in range(start, stop, stride):
+                yield self[k]
+            return
+        # Roll forward from the first frame instead of replaying every block
+        values = self.values_at(start).tolist()
+        for k in range(start, stop):
+            if k > start:
+                if k % self.keyframe_every == 0:
+                    values = self._keyframes[k // self.keyframe_every].tolist()
+                else:
+                    values = _apply(values, self._delta(k))
+            yield self._frame(k, values)
+
+    def __iter__(self):
+        return self._iter_range(0, len(self))
+
+    @property
+    def totals(self):
+        """Prefix sums of the metric columns, built on first use and then reused."""
+        if self._totals is None:
+            self._totals = MetricTotals.from_trace(self)
+        return self._totals
+
+    def totals_at(self, k):
+        """Cumulative metrics through frame k."""
+        return self.totals.at(k)
+
+    def op_counts(self):
+        """Number of frames per op code, as an array indexed by op code."""
+        return np.bincount(self.op.astype(np.int64))
+
+    def nbytes(self):
+        """Bytes held by the NumPy columns (excluding per-frame data/highlights)."""
+        arrays = [self.step, self.op, self.length, self.offsets, self.touched,
+                  self.written, self._narration_ids, *self.metrics.values(), *self._keyframes]
+        return sum(a.nbytes for a in arrays if a is not None)
@@ -0,0 +1,465 @@
+"""
+Binary on-disk format for FrameTrace, replayed through numpy.memmap.
+
+Layout (all integers little-endian)::
+
+    magic      8 bytes   b"DSATRACE"
+    hdr_len    uint32    length of the JSON header that follows
+    header     JSON      version, meta, keyframe_every, count, record dtype,
+                         narration templates and the byte offset/size/dtype
+                         of every section below
+    sections   64-byte aligned arrays:
+        records     one fixed-width record per frame (step, op, length,
+                    narration template id, one field per metric)
+        offsets     int64[count + 1], slices touched/written per frame
+        touched     int32, indices written by each frame
+        written     int64, values written by each frame
+        keyframes   int64, full values of every keyframe back to back
+        key_index   int64[count_keyframes, 2], (start, length) in keyframes
+        extra       UTF-8 JSON rows (data, highlights, narration args);
+                    JSON objects are tags for the types JSON lacks, so
+                    int keys, tuples, sets and NumPy scalars read back
+                    as written
+        extra_index int64[count + 1], byte offsets into extra
+
+Only integer array traces can be written. Reading maps the file and hands
+back a FrameTrace whose columns are views into the mapping, so frames are
+decoded on demand and the OS page cache is shared by every reader.
+
+The chunked variant (``write_chunked``/``ChunkedTrace``) packs every
+``chunk_frames`` frames into the same section layout and compresses each
+chunk on its own with zlib or lzma::
+
+    magic      8 bytes   b"DSACHUNK"
+    chunks     compressed payloads, each a complete trace of its frames
+    footer     JSON      version, meta, codec, frame counts, chunk offsets
+    footer_at  uint64    byte offset of the footer
+
+Chunks start on a keyframe, so a reader inflates only the chunk holding the
+requested step.
+"""
+import itertools
+import json
+import lzma
+import zlib
+
+import numpy as np
+
+from core.models.frame import _intern
+from core.models.metrics import STANDARD_METRICS
+from core.models.trace import FrameTrace
+
+MAGIC = b"DSATRACE"
+CHUNK_MAGIC = b"DSACHUNK"
+VERSION = 2
+_ALIGN = 64
+
+
+def _shape(keys):
+    return _intern(tuple(keys))
+
+
+def _tag(value):
+    """Encode a frame value for the extra section; every JSON object written is a tag."""
+    kind = type(value)
+    if value is None or kind in (bool, int, float, str):
+        return value
+    if kind is list:
+        return [_tag(v) for v in value]
+    if kind is tuple:
+        return {"t": [_tag(v) for v in value]}
+    if kind is dict:
+        return {"d": [[_tag(k), _tag(v)] for k, v in value.items()]}
+    if kind is set or kind is frozenset:
+        return {"s" if kind is set else "f": [_tag(v) for v in value]}
+    if isinstance(value, np.generic) and value.dtype.kind in "biuf":
+        return {"n": [value.dtype.str, value.item()]}
+    raise TypeError(f"trace files cannot store {kind.__name__} values in frame data, highlights or narration")
+
+
+def _untag(obj):
+    # json.loads object_hook: objects are decoded innermost first
+    (tag, value), = obj.items()
+    if tag == "t":
+        return tuple(value)
+    if tag == "d":
+        return {k: v for k, v in value}
+    if tag == "s":
+        return set(value)
+    if tag == "f":
+        return frozenset(value)
+    return np.dtype(value[0]).type(value[1])
+
+
+class _JsonRows:
+    """Sequence view over the extra section, decoding one row per lookup."""
+
+    def __init__(self, blob, index, decode):
+        self._blob = blob
+        self._index = index
+        self._decode = decode
+
+    def __len__(self):
+        return len(self._index) - 1
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            start, stop, stride = k.indices(len(self))
+            if stride != 1:
+                return [self[i] for i in range(start, stop, stride)]
+            # Rows [start, stop) share the blob; only the index is narrowed
+            return _JsonRows(self._blob, self._index[start:max(stop, start) + 1], self._decode)
+        lo, hi = self._index[k], self._index[k + 1]
+        return self._decode(json.loads(self._blob[lo:hi].tobytes(), object_hook=_untag))
+
+
+def _extra_row(row):
+    dk, dv, hk, hv, mk, _ = row
+    return _shape(dk), tuple(dv), _shape(hk), tuple(hv), _shape(mk)
+
+
+def _args_row(row):
+    args = row[5]
+    return None if args is None else tuple(args)
+
+
+def _sections(trace):
+    """Split a FrameTrace into header fields and the flat arrays stored on disk."""
+    keyframes = trace._keyframes
+    if trace.written.dtype != np.int64 or any(kf.dtype != np.int64 for kf in keyframes):
+        raise ValueError("binary trace files only hold integer array traces")
+    for name, column in trace.metrics.items():
+        if column.dtype == object:
+            raise ValueError(f"metric {name!r} is not numeric")
+
+    count = len(trace)
+    fields = [("step", "<i8"), ("op", "<i1"), ("length", "<i4"), ("narration", "<i4")]
+    fields += [("m_" + name, column.dtype.newbyteorder("<").str)
+               for name, column in trace.metrics.items()]
+    records = np.zeros(count, dtype=fields)
+    records["step"] = trace.step
+    records["op"] = trace.op
+    records["length"] = trace.length
+    records["narration"] = trace._narration_ids
+    for name, column in trace.metrics.items():
+        records["m_" + name] = column
+
+    rows = []
+    for k in range(count):
+        dk, dv, hk, hv, mk = trace._extra[k]
+        args = trace._narration_args[k]
+        row = [list(dk), list(dv), list(hk), list(hv), list(mk), None if args is None else list(args)]
+        rows.append(json.dumps(_tag(row)).encode("utf-8"))
+    extra_index = np.zeros(count + 1, dtype="<i8")
+    extra_index[1:] = np.cumsum([len(r) for r in rows])
+
+    key_lengths = np.asarray([len(kf) for kf in keyframes], dtype="<i8")
+    key_index = np.zeros((len(keyframes), 2), dtype="<i8")
+    key_index[:, 1] = key_lengths
+    key_index[1:, 0] = np.cumsum(key_lengths)[:-1]
+
+    sections = {
+        "records": records,
+        "offsets": (trace.offsets - trace.offsets[0]).astype("<i8"),
+        "touched": trace.touched.astype("<i4"),
+        "written": trace.written.astype("<i8"),
+        "keyframes": (np.concatenate(keyframes) if keyframes
+                      else np.zeros(0, dtype="<i8")).astype("<i8"),
+        "key_index": key_index,
+        "extra": np.frombuffer(b"".join(rows), dtype=np.uint8),
+        "extra_index": extra_index,
+    }
+    header = {
+        "version": VERSION,
+        "meta": trace.meta,
+        "keyframe_every": trace.keyframe_every,
+        "count": count,
+        "metrics": list(trace.metrics),
+        "templates": trace._narrations,
+        "sections": {},
+    }
+    return header, sections
+
+
+def _encode(header, sections, prefix):
+    """Lay sections out after ``prefix`` + length + JSON header; return the header bytes."""
+    # Offsets depend on the header size, so settle the layout before writing
+    header_size = 0
+    while True:
+        pos = _aligned(len(prefix) + 4 + header_size)
+        for name, array in sections.items():
+            header["sections"][name] = {
+                "offset": pos,
+                "shape": list(array.shape),
+                "dtype": array.dtype.descr if array.dtype.names else array.dtype.str,
+            }
+            pos = _aligned(pos + array.nbytes)
+        encoded = json.dumps(header).encode("utf-8")
+        if len(encoded) == header_size:
+            return prefix + np.uint32(len(encoded)).astype("<u4").tobytes() + encoded
+        header_size = len(encoded)
+
+
+def _write_sections(fh, base, header, sections):
+    for name, array in sections.items():
+        fh.seek(base + header["sections"][name]["offset"])
+        fh.write(np.ascontiguousarray(array).tobytes())
+
+
+def _load(header, section):
+    """Build a FrameTrace whose columns come from ``section(name)``."""
+    records = section("records")
+    trace = FrameTrace(header["keyframe_every"], header["meta"])
+    trace.step = records["step"]
+    trace.op = records["op"]
+    trace.length = records["length"]
+    trace._narration_ids = records["narration"]
+    trace.metrics = {name: records["m_" + name] for name in header["metrics"]}
+    trace._narrations = header["templates"]
+    trace.offsets = section("offsets")
+    trace.touched = section("touched")
+    trace.written = section("written")
+    flat = section("keyframes")
+    trace._keyframes = [flat[start:start + length] for start, length in section("key_index").tolist()]
+    blob, index = section("extra"), section("extra_index")
+    trace._extra = _JsonRows(blob, index, _extra_row)
+    trace._narration_args = _JsonRows(blob, index, _args_row)
+    return trace
+
+
+def _dtype(spec):
+    dtype = spec["dtype"]
+    return np.dtype([tuple(f) for f in dtype]) if isinstance(dtype, list) else np.dtype(dtype)
+
+
+def write_trace(trace, path, meta=None):
+    """Write a FrameTrace of integer arrays to ``path``."""
+    header, sections = _sections(trace)
+    if meta is not None:
+        header["meta"] = meta
+    encoded = _encode(header, sections, MAGIC)
+    with open(path, "wb") as fh:
+        fh.write(encoded)
+        _write_sections(fh, 0, header, sections)
+
+
+def _aligned(pos):
+    return (pos + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def read_header(path):
+    with open(path, "rb") as fh:
+        if fh.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a trace file")
+        size = int(np.frombuffer(fh.read(4), dtype="<u4")[0])
+        header = json.loads(fh.read(size))
+    if header["version"] != VERSION:
+        raise ValueError(f"unsupported trace file version {header['version']}")
+    return header
+
+
+def read_trace(path):
+    """Map a trace file and return a FrameTrace reading straight from it."""
+    header = read_header(path)
+
+    def section(name):
+        spec = header["sections"][name]
+        shape = tuple(spec["shape"])
+        if 0 in shape:
+            return np.zeros(shape, dtype=_dtype(spec))
+        return np.memmap(path, dtype=_dtype(spec), mode="r", offset=spec["offset"], shape=shape)
+
+    return _load(header, section)
+
+
+# ------------------------------------------------------
+# Chunked, compressed traces
+# ------------------------------------------------------
+_CODECS = {
+    "zlib": (lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress),
+    "lzma": (lambda data, level: lzma.compress(data, preset=6 if level is None else level), lzma.decompress),
+}
+
+
+def _pack(trace):
+    header, sections = _sections(trace)
+    head = _encode(header, sections, b"")
+    size = max((spec["offset"] + sections[name].nbytes
+                for name, spec in header["sections"].items()), default=len(head))
+    buf = bytearray(max(size, len(head)))
+    buf[:len(head)] = head
+    for name, array in sections.items():
+        offset = header["sections"][name]["offset"]
+        buf[offset:offset + array.nbytes] = np.ascontiguousarray(array).tobytes()
+    return bytes(buf)
+
+
+def _unpack(payload):
+    size = int(np.frombuffer(payload, dtype="<u4", count=1)[0])
+    header = json.loads(payload[4:4 + size])
+
+    def section(name):
+        spec = header["sections"][name]
+        shape = tuple(spec["shape"])
+        count = int(np.prod(shape))
+        return np.frombuffer(payload, dtype=_dtype(spec), count=count,
+                             offset=spec["offset"]).reshape(shape)
+
+    return _load(header, section)
+
+
+def _slice(trace, lo, hi):
+    """Frames [lo, hi) of a FrameTrace as a trace of their own; lo must be a keyframe."""
+    every = trace.keyframe_every
+    sub = FrameTrace(every, trace.meta)
+    sub.step = trace.step[lo:hi]
+    sub.op = trace.op[lo:hi]
+    sub.length = trace.length[lo:hi]
+    sub.offsets = trace.offsets[lo:hi + 1]
+    sub.touched = trace.touched[sub.offsets[0]:sub.offsets[-1]]
+    sub.written = trace.written[sub.offsets[0]:sub.offsets[-1]]
+    sub.metrics = {name: column[lo:hi] for name, column in trace.metrics.items()}
+    sub._keyframes = trace._keyframes[lo // every:(hi + every - 1) // every]
+    sub._narration_ids = trace._narration_ids[lo:hi]
+    sub._narrations = trace._narrations
+    sub._narration_args = trace._narration_args[lo:hi]
+    sub._extra = trace._extra[lo:hi]
+    return sub
+
+
+def _chunks(frames, chunk_frames, keyframe_every):
+    if isinstance(frames, FrameTrace):
+        for lo in range(0, len(frames), chunk_frames):
+            yield _slice(frames, lo, min(lo + chunk_frames, len(frames)))
+        return
+    frames = iter(frames)
+    while True:
+        batch = list(itertools.islice(frames, chunk_frames))
+        if not batch:
+            return
+        yield FrameTrace.from_frames(batch, keyframe_every)
+
+
+def write_chunked(frames, path, chunk_frames=4096, keyframe_every=256, codec="zlib",
+                  level=None, meta=None):
+    """
+    Write a FrameTrace, or stream any ``*_frames`` generator, as independently
+    compressed chunks. Only one chunk is held in memory at a time.
+    """
+    if isinstance(frames, FrameTrace):
+        keyframe_every = frames.keyframe_every
+        meta = frames.meta if meta is None else meta
+    if chunk_frames % keyframe_every:
+        raise ValueError("chunk_frames must be a multiple of keyframe_every")
+    if codec not in _CODECS:
+        raise ValueError(f"unknown codec {codec!r}; expected one of {sorted(_CODECS)}")
+    compress = _CODECS[codec][0]
+
+    index, sums, count, raw = [], [], 0, 0
+    with open(path, "wb") as fh:
+        fh.write(CHUNK_MAGIC)
+        for chunk in _chunks(frames, chunk_frames, keyframe_every):
+            payload = _pack(chunk)
+            packed = compress(payload, level)
+            index.append([fh.tell(), len(packed)])
+            sums.append({name: column.sum().item() for name, column in chunk.metrics.items()})
+            fh.write(packed)
+            count += len(chunk)
+            raw += len(payload)
+        footer = {
+            "version": VERSION,
+            "meta": meta or {},
+            "codec": codec,
+            "chunk_frames": chunk_frames,
+            "keyframe_every": keyframe_every,
+            "count": count,
+            "raw_bytes": raw,
+            "chunks": index,
+            "metric_sums": sums,
+        }
+        footer_at = fh.tell()
+        fh.write(json.dumps(footer).encode("utf-8"))
+        fh.write(np.uint64(footer_at).astype("<u8").tobytes())
+
+
+class ChunkedTrace:
+    """
+    Reader for ``write_chunked`` files with the FrameTrace access API.
+
+    Only the chunk holding the requested frame is read and inflated; the
+    last few decoded chunks are kept for scrubbing back and forth.
+    """
+
+    def __init__(self, path, cache_chunks=2):
+        self.path = path
+        with open(path, "rb") as fh:
+            if fh.read(len(CHUNK_MAGIC)) != CHUNK_MAGIC:
+                raise ValueError(f"{path} is not a chunked trace file")
+            fh.seek(-8, 2)
+            end = fh.tell()
+            footer_at = int(np.frombuffer(fh.read(8), dtype="<u8")[0])
+            fh.seek(footer_at)
+            self.footer = json.loads(fh.read(end - footer_at))
+        if self.footer["version"] != VERSION:
+            raise ValueError(f"unsupported trace file version {self.footer['version']}")
+        self.meta = self.footer["meta"]
+        self.chunk_frames = self.footer["chunk_frames"]
+        self._decompress = _CODECS[self.footer["codec"]][1]
+        self._cache = {}
+        self._cache_chunks = cache_chunks
+        # Totals carried into each chunk, from the per-chunk sums in the footer
+        self._chunk_base = [dict.fromkeys(STANDARD_METRICS, 0)]
+        for chunk_sums in self.footer["metric_sums"]:
+            base = dict(self._chunk_base[-1])
+            for name, value in chunk_sums.items():
+                base[name] = base.get(name, 0) + value
+            self._chunk_base.append(base)
+
+    def __len__(self):
+        return self.footer["count"]
+
+    def compressed_bytes(self):
+        return sum(size for _, size in self.footer["chunks"])
+
+    def compression_ratio(self):
+        return self.footer["raw_bytes"] / max(1, self.compressed_bytes())
+
+    def chunk_bytes(self, c):
+        """Raw compressed bytes of chunk c, e.g. to ship to a browser as-is."""
+        offset, size = self.footer["chunks"][c]
+        with open(self.path, "rb") as fh:
+            fh.seek(offset)
+            return fh.read(size)
+
+    def chunk(self, c):
+        """Decoded chunk c as an in-memory FrameTrace."""
+        if c not in self._cache:
+            if len(self._cache) >= self._cache_chunks:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[c] = _unpack(self._decompress(self.chunk_bytes(c)))
+        return self._cache[c]
+
+    def seek(self, k):
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("frame index out of range")
+        return self.chunk(k // self.chunk_frames).seek(k % self.chunk_frames)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self.seek(i) for i in range(*k.indices(len(self)))]
+        return self.seek(k)
+
+    def totals_at(self, k):
+        """Cumulative metrics through frame k, decoding only its chunk."""
+        if k < 0:
+            k += len(self)
+        c = k // self.chunk_frames
+        base = self._chunk_base[c]
+        within = self.chunk(c).totals_at(k % self.chunk_frames)
+        return {name: base.get(name, 0) + within.get(name, 0) for name in {**base, **within}}
+
+    def __iter__(self):
+        for c in range(len(self.footer["chunks"])):
+            yield from self.chunk(c)
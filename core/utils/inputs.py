@@ -0,0 +1,25 @@
+import random
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique", "organ_pipe", "nearly_sorted")
+
+
+def make_input(distribution, n, seed=0, swaps=10):
+    """Seeded test input of length n; ``swaps`` random transpositions make ``nearly_sorted``."""
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randrange(n * 4 or 1) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "few_unique":
+        return [rng.randrange(8) for _ in range(n)]
+    if distribution == "organ_pipe":
+        return [min(i, n - 1 - i) for i in range(n)]
+    if distribution == "nearly_sorted":
+        values = list(range(n))
+        for _ in range(swaps if n > 1 else 0):
+            i, j = rng.randrange(n), rng.randrange(n)
+            values[i], values[j] = values[j], values[i]
+        return values
+    raise ValueError(f"unknown distribution {distribution!r}")
@@ -0,0 +1,26 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+
+def render_evolution_heatmap(matrix, frames, starts, title: str = "Evolution"):
+    """One heatmap of a whole run, from ``FrameTrace.snapshot_matrix()``: a row per kept frame, a column per index bin."""
+    st.subheader(title)
+    if not len(frames):
+        st.caption("No frames to show.")
+        return
+    fig = go.Figure(go.Heatmap(
+        z=matrix,
+        x=starts,
+        y=frames,
+        colorscale="Viridis",
+        colorbar={"title": "value"},
+        hovertemplate="frame %{y}<br>index %{x}<br>value %{z}<extra></extra>",
+    ))
+    fig.update_layout(
+        xaxis_title="index",
+        yaxis_title="frame",
+        yaxis_autorange="reversed",
+        height=480,
+        margin={"l": 40, "r": 20, "t": 20, "b": 40},
+    )
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,13 @@
+import streamlit as st
+from typing import Dict
+
+
+def render_metrics(totals: Dict[str, float], title: str = "Totals so far"):
+    """Show cumulative metrics (from ``trace.totals_at(idx)``) as a row of counters."""
+    st.subheader(title)
+    if not totals:
+        st.caption("No metrics recorded.")
+        return
+    cols = st.columns(len(totals))
+    for col, (name, value) in zip(cols, totals.items()):
+        col.metric(name.replace("_", " ").title(), value)
@@ -0,0 +1,36 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+
+def render_pivot_study(rows, metric: str = "comparisons", title: str = "Pivot strategies"):
+    """Grouped bars of one metric from ``compare_pivots()``: p50 per strategy, whisker up to p99, max as a marker."""
+    st.subheader(title)
+    if not rows:
+        st.caption("No runs yet.")
+        return
+    timed_out = sum(row.get("timed_out", 0) for row in rows)
+    if timed_out:
+        st.warning(f"{timed_out} runs hit the time limit and are left out.")
+    fig = go.Figure()
+    for strategy in dict.fromkeys(row["strategy"] for row in rows):
+        mine = [row for row in rows if row["strategy"] == strategy and row[metric] is not None]
+        stats = [row[metric] for row in mine]
+        fig.add_trace(go.Bar(
+            name=strategy,
+            x=[row["distribution"] for row in mine],
+            y=[s["p50"] for s in stats],
+            error_y={"type": "data", "symmetric": False,
+                     "array": [s["p99"] - s["p50"] for s in stats], "arrayminus": [0] * len(stats)},
+            customdata=[[s["mean"], s["p99"], s["max"]] for s in stats],
+            hovertemplate=(f"{strategy}<br>p50 %{{y:,.0f}}<br>mean %{{customdata[0]:,.1f}}"
+                           "<br>p99 %{customdata[1]:,.0f}<br>max %{customdata[2]:,.0f}<extra></extra>"),
+        ))
+    fig.update_layout(barmode="group", yaxis_type="log", yaxis_title=f"{metric} (p50, whisker to p99)",
+                      height=420, margin={"l": 40, "r": 20, "t": 20, "b": 40})
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe([
+        {"distribution": row["distribution"], "strategy": row["strategy"],
+         **{stat: round(value, 1) for stat, value in (row[metric] or {}).items()},
+         "timed out": row.get("timed_out", 0)}
+        for row in rows
+    ])
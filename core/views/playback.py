@@ -0,0 +1,47 @@
+import streamlit as st
+
+from core.models.budget import FrameBudget
+
+
+def render_scrubber(frames, idx_key: str, playing_key: str, label: str = "Jump to step"):
+    """Slider over the trace, kept in sync with the page's frame index.
+
+    Dragging it pauses playback and moves ``st.session_state[idx_key]``;
+    the page then fetches the frame with ``trace.seek(idx)``. ``frames``
+    is the page's FrameBuffer (or a plain list). Until the generator is
+    exhausted the slider only spans the frames pulled so far, so dropping
+    it on its last step pulls as many again and the rerun shows a longer
+    slider.
+    """
+    total = len(frames)
+    if total < 2:
+        return
+    growing = not getattr(frames, "exhausted", True)
+    slider_key = f"{idx_key}_scrubber"
+
+    def _jump():
+        idx = st.session_state[slider_key]
+        if growing and idx == total - 1:
+            frames.has(2 * total)
+        st.session_state[idx_key] = idx
+        st.session_state[playing_key] = False
+
+    st.session_state[slider_key] = min(st.session_state[idx_key], total - 1)
+    st.slider(label, 0, total - 1, key=slider_key, on_change=_jump)
+    if growing:
+        st.caption(f"{total} steps loaded so far; drag to the end to load more")
+
+
+def render_budget_picker(key: str, label: str = "Frames to keep"):
+    """Choose a FrameBudget for large inputs; returns None for "All frames"."""
+    modes = ["All frames", "Every Nth", "Writes/swaps only", "Pass boundaries", "Target count"]
+    mode = st.selectbox(label, modes, key=key)
+    if mode == "Every Nth":
+        return FrameBudget.every_nth(st.number_input("N", 2, 10_000, 10, key=f"{key}_every"))
+    if mode == "Writes/swaps only":
+        return FrameBudget.significant()
+    if mode == "Pass boundaries":
+        return FrameBudget.passes()
+    if mode == "Target count":
+        return FrameBudget.adaptive(st.number_input("Target frames", 2, 100_000, 500, key=f"{key}_target"))
+    return None
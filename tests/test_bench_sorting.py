@@ -0,0 +1,44 @@
+import copy
+
+from benchmarks.bench_sorting import DISTRIBUTIONS, compare, make_input, run_suite
+
+
+def test_make_input_distributions():
+    assert make_input("sorted", 5) == [0, 1, 2, 3, 4]
+    assert make_input("reversed", 3) == [3, 2, 1]
+    assert make_input("organ_pipe", 6) == [0, 1, 2, 2, 1, 0]
+    assert len(set(make_input("few_unique", 500))) <= 8
+    nearly = make_input("nearly_sorted", 100, swaps=3)
+    assert sorted(nearly) == list(range(100))
+    assert sum(a != b for a, b in zip(nearly, range(100))) <= 6
+
+
+def test_suite_checks_correctness_and_flags_regressions():
+    report = run_suite(["merge", "pdq"], DISTRIBUTIONS, [10, 200], memory=False, log=None)
+    rows = report["results"]
+    assert len(rows) == 2 * len(DISTRIBUTIONS) * 2
+    assert all(r["correct"] and r["frames_per_sec"] for r in rows)
+    assert compare(report, report, threshold=0.1) == []
+
+    better = copy.deepcopy(report)
+    better["results"][0]["comparisons"] //= 2
+    failures = compare(report, better, threshold=0.1)
+    assert len(failures) == 1 and "comparisons" in failures[0]
+
+
+def test_suite_runs_parallel_and_network_sorts():
+    report = run_suite(["parallel", "bitonic", "odd_even"], ["random", "reversed"], [1, 37], memory=False, log=None)
+    rows = report["results"]
+    assert len(rows) == 3 * 2 * 2
+    assert all("error" not in r and r["correct"] and r["frames_per_sec"] for r in rows)
+    big = {r["algorithm"]: r for r in rows if r["n"] == 37 and r["distribution"] == "random"}
+    assert big["odd_even"]["comparisons"] < big["bitonic"]["comparisons"]
+
+
+def test_suite_abandons_slow_cases_and_skips_larger_sizes():
+    report = run_suite(["bubble"], ["reversed"], [10, 2500, 3000], memory=False, time_limit=0.05, log=None)
+    small, slow, skipped = report["results"]
+    assert small["correct"]
+    assert slow["error"].startswith("CaseTimeout")
+    assert skipped["error"].startswith("skipped")
+    assert compare(report, report, threshold=0.1) == []
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from core.models.budget import FrameBudget
+from core.models.frame import OP_SWAP, OP_WRITE
+from core.models.metrics import MetricTotals
+from core.algorithms.sorting import bubble_sort_frames, merge_sort_frames, heap_sort_frames
+from core.algorithms.graphs import Graph
+
+BUDGETS = [
+    FrameBudget.every_nth(7),
+    FrameBudget.significant(),
+    FrameBudget.passes(),
+    FrameBudget.adaptive(50),
+]
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=repr)
+@pytest.mark.parametrize("sort", [bubble_sort_frames, merge_sort_frames, heap_sort_frames])
+def test_budget_keeps_exact_final_state_and_totals(sort, budget):
+    arr = random.Random(3).sample(range(200), 60)
+    full = list(sort(arr))
+    kept = list(sort(arr, budget=budget))
+    assert len(kept) <= len(full)
+    assert kept[0].to_dict() == full[0].to_dict()
+    assert kept[-1].values == full[-1].values == sorted(arr)
+    assert MetricTotals.from_frames(kept).final() == MetricTotals.from_frames(full).final()
+
+
+def test_budget_modes_select_expected_frames():
+    arr = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    full = list(bubble_sort_frames(arr))
+    every = list(bubble_sort_frames(arr, budget=FrameBudget.every_nth(5)))
+    assert [f.step for f in every] == sorted({f.step for f in full[::5]} | {full[-1].step})
+    swaps = list(bubble_sort_frames(arr, budget=FrameBudget.significant()))
+    assert all(f.op in (OP_SWAP, OP_WRITE) for f in swaps[1:-1])
+    passes = list(bubble_sort_frames(arr, budget=FrameBudget.passes()))
+    # First frame plus the last frame of each of the n - 1 non-empty passes
+    assert len(passes) == len(arr)
+    assert len(list(bubble_sort_frames(list(range(500)), budget=FrameBudget.adaptive(40)))) <= 40
+
+
+def test_budget_applies_to_graph_traversals():
+    g = Graph()
+    for u in range(30):
+        g.add_edge(u, u + 1)
+    full = list(g.bfs_frames(0))
+    kept = list(g.bfs_frames(0, budget=FrameBudget.passes()))
+    assert len(kept) < len(full)
+    assert MetricTotals.from_frames(kept).final() == MetricTotals.from_frames(full).final()
+
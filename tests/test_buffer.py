@@ -0,0 +1,63 @@
+import itertools
+
+import pytest
+
+from core.models.buffer import FrameBuffer
+from core.models.metrics import MetricTotals
+from core.algorithms.sorting import bubble_sort_frames
+
+
+def test_buffer_pulls_lazily_and_matches_generator():
+    arr = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    frames = list(bubble_sort_frames(arr))
+    buf = FrameBuffer(bubble_sort_frames(arr), window=8, keyframe_every=5, prefetch=4)
+    assert len(buf) == 5 and not buf.exhausted
+    assert buf[0].to_dict() == frames[0].to_dict()
+    for k in (3, 40, 2, len(frames) - 1, 10, 0):
+        assert buf.seek(k).to_dict() == frames[k].to_dict()
+        assert len(buf._recent) <= 8
+    assert buf.exhausted and buf.drain() == len(frames)
+    assert not buf.has(len(frames))
+    assert [f.to_dict() for f in buf] == [f.to_dict() for f in frames]
+
+
+def test_buffer_iterates_while_pulling():
+    arr = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    frames = list(bubble_sort_frames(arr))
+    buf = FrameBuffer(bubble_sort_frames(arr), window=4, keyframe_every=8, prefetch=2)
+    assert [f.to_dict() for f in buf] == [f.to_dict() for f in frames]
+    assert buf.exhausted and len(buf._recent) <= 4
+
+
+def test_buffer_packs_into_a_frame_trace():
+    arr = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    frames = list(bubble_sort_frames(arr))
+    buf = FrameBuffer(bubble_sort_frames(arr), keyframe_every=16, prefetch=2)
+    trace = buf.to_frame_trace()
+    assert buf.exhausted and len(trace) == len(frames)
+    assert [f.to_dict() for f in trace] == [f.to_dict() for f in frames]
+    matrix, rows, _ = trace.snapshot_matrix()
+    assert matrix[-1].tolist() == sorted(arr) and len(rows) == len(frames)
+
+
+def test_buffer_totals_match_full_trace():
+    arr = [3, 1, 2, 5, 4]
+    frames = list(bubble_sort_frames(arr))
+    expected = MetricTotals.from_frames(frames)
+    buf = FrameBuffer(bubble_sort_frames(arr), prefetch=0)
+    for k in range(len(frames)):
+        assert buf.totals_at(k) == expected.at(k)
+
+
+def test_buffer_keeps_generator_errors_when_asked():
+    def failing(after):
+        yield from itertools.islice(bubble_sort_frames([3, 1, 2, 5, 4]), after)
+        raise ValueError("bad input")
+
+    buf = FrameBuffer(failing(3), prefetch=1)
+    with pytest.raises(ValueError):
+        buf.seek(10)
+    buf = FrameBuffer(failing(3), prefetch=1, keep_errors=True)
+    assert not buf.has(10) and buf.exhausted
+    assert isinstance(buf.error, ValueError) and len(buf) == 3
+    assert buf.seek(2).step == 2
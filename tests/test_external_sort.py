@@ -0,0 +1,33 @@
+import random
+
+from core.models.metrics import MetricTotals
+from core.algorithms.external_sort import external_sort_frames, write_ints
+
+
+def test_external_sort_multi_pass(tmp_path):
+    rng = random.Random(8)
+    values = [rng.randint(-10**9, 10**9) for _ in range(3000)]
+    src, out = tmp_path / "in.txt", tmp_path / "out.txt"
+    size = write_ints(src, values)
+    frames = list(external_sort_frames(src, out, chunk_size=200, fan_in=4, tmp_dir=tmp_path))
+    assert [int(line) for line in open(out)] == sorted(values)
+    # 15 runs -> 4 -> 1: one frame per run or merge, one summary per pass, one final frame
+    summaries = [f for f in frames if "done" in f.narration]
+    assert [f.data["runs"] for f in summaries] == [15, 4, 1]
+    assert all(f.data["bytes_read"] == f.data["bytes_written"] == size for f in summaries)
+    assert len(frames) == 15 + 4 + 1 + 3 + 1
+    totals = MetricTotals.from_frames(frames).final()
+    assert totals["writes"] == 3 * len(values)
+    assert totals["bytes_written"] == 3 * size
+    # Temporary runs are cleaned up; only the inputs and the output remain
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.txt", "out.txt"]
+
+
+def test_external_sort_counts_match_without_comparisons(tmp_path):
+    src = tmp_path / "in.txt"
+    write_ints(src, [3, 1, 2])
+    counted = list(external_sort_frames(src, tmp_path / "a.txt", chunk_size=2, fan_in=2))
+    plain = list(external_sort_frames(src, tmp_path / "b.txt", chunk_size=2, fan_in=2, count_comparisons=False))
+    assert [f.values for f in counted] == [f.values for f in plain]
+    assert MetricTotals.from_frames(counted).final()["comparisons"] > 0
+    assert open(tmp_path / "b.txt").read().split() == ["1", "2", "3"]
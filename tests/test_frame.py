@@ -0,0 +1,56 @@
+from core.models import frame as frame_module
+from core.models.frame import Frame, DeltaTrace
+from core.algorithms.sorting import bubble_sort_frames, merge_sort_frames
+
+
+def test_delta_trace_rebuilds_every_frame():
+    frames = list(bubble_sort_frames([5, 3, 4, 1, 2, 7, 8, 9]))
+    trace = DeltaTrace.from_frames(frames, keyframe_every=4)
+    assert len(trace) == len(frames)
+    for k, frame in enumerate(frames):
+        assert trace[k].view == frame.view
+        assert trace[k].narration == frame.narration
+    assert [f.view for f in trace] == [f.view for f in frames]
+
+
+def test_delta_trace_stores_only_changes():
+    arr = list(range(200, 0, -1))
+    trace = DeltaTrace.from_frames(merge_sort_frames(arr), keyframe_every=64)
+    stored = sum(len(d[1]) for d in trace._deltas if d is not None)
+    assert stored < len(trace) * 2
+    assert trace[-1].view["values"] == sorted(arr)
+
+
+def test_delta_trace_handles_length_changes():
+    frames = [Frame(0, [1, 2]), Frame(1, [1, 2, 3]), Frame(2, [2])]
+    trace = DeltaTrace.from_frames(frames, keyframe_every=8)
+    assert [trace[k].view["values"] for k in range(3)] == [[1, 2], [1, 2, 3], [2]]
+
+
+def test_frame_is_slotted_and_keeps_view_shape():
+    a = Frame(3, [1, 2], "Compare", {"i": 0}, {"comparisons": 1}, {"compare": [0, 1]})
+    b = Frame(4, [2, 1], "Compare", {"i": 1}, {"comparisons": 1}, {"compare": [1, 0]})
+    assert not hasattr(a, "__dict__")
+    assert a.view == {"values": [1, 2], "highlights": {"compare": [0, 1]}}
+    assert a.data == {"i": 0} and a.metrics == {"comparisons": 1}
+    # Key tuples are shared between frames with the same shape
+    assert a._dk is b._dk and a._hk is b._hk
+
+
+def test_key_shapes_keep_their_own_types():
+    # 1, 1.0 and True are equal dict keys; each frame must keep the keys it was given
+    frames = [Frame(0, [], "", {key: "node"}, {}, {key: [0]}) for key in (1, 1.0, True)]
+    for key, frame in zip((1, 1.0, True), frames):
+        assert [type(k) for k in frame.data] == [type(key)]
+        assert [type(k) for k in frame.highlights] == [type(key)]
+    shapes = len(frame_module._SHAPES)
+    Frame(0, [], "", {n: n for n in range(50)})
+    assert len(frame_module._SHAPES) == shapes
+
+
+def test_key_shape_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(frame_module, "_SHAPES", {})
+    monkeypatch.setattr(frame_module, "_MAX_SHAPES", 8)
+    frames = [Frame(0, [], "", {f"v{k}": k}) for k in range(20)]
+    assert len(frame_module._SHAPES) == 8
+    assert [f.data for f in frames] == [{f"v{k}": k} for k in range(20)]
@@ -0,0 +1,28 @@
+from core.models.metrics import MetricTotals
+from core.models.trace import FrameTrace
+from core.algorithms.sorting import bubble_sort_frames
+from core.algorithms.searching import binary_search_frames
+from core.algorithms.linked_list import SinglyLinkedList
+
+
+def test_totals_are_prefix_sums_of_deltas():
+    arr = [5, 3, 4, 1, 2]
+    frames = list(bubble_sort_frames(arr))
+    trace = FrameTrace.from_frames(frames)
+    for k in (0, 3, len(frames) - 1):
+        expected = sum(f.metrics.get("comparisons", 0) for f in frames[:k + 1])
+        assert trace.totals_at(k)["comparisons"] == expected
+    assert trace.totals_at(-1) == MetricTotals.from_frames(frames).final()
+    assert trace.totals.between(0, len(frames))["comparisons"] == 10
+
+
+def test_searching_and_linked_list_emit_deltas():
+    frames = list(binary_search_frames([1, 3, 4, 7, 9, 12, 15], 12))
+    assert [f.metrics.get("comparisons", 0) for f in frames].count(1) == 2
+    assert MetricTotals.from_frames(frames).final()["comparisons"] == 2
+
+    ll = SinglyLinkedList()
+    for v in (4, 8, 15):
+        list(ll.insert_tail_frames(v))
+    totals = MetricTotals.from_frames(ll.delete_value_frames(15)).final()
+    assert (totals["comparisons"], totals["deletions"], totals["links_changed"]) == (3, 1, 1)
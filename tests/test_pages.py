@@ -0,0 +1,25 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+PAGES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "pages")
+
+
+def test_sorting_scrubber_grows_past_the_first_window():
+    at = AppTest.from_file(os.path.join(PAGES, "1_Sorting.py"), default_timeout=60).run()
+    at.text_input[0].set_value(",".join(str(v) for v in range(60, 0, -1))).run()
+    at.button(key="btn_generate").click().run()
+    frames = at.session_state.frames
+    first = len(frames)
+    assert not frames.exhausted and first < 256
+    # Each drag to the slider's end pulls more frames until the run is done
+    for _ in range(12):
+        slider = at.slider(key="idx_scrubber")
+        end = slider.max
+        slider.set_value(end).run()
+        assert at.session_state.idx == end
+        if frames.exhausted:
+            break
+        assert at.slider(key="idx_scrubber").max > end
+        assert any("loaded so far" in caption.value for caption in at.caption)
+    assert frames.exhausted and at.slider(key="idx_scrubber").max == len(frames) - 1 > 256
@@ -0,0 +1,33 @@
+import random
+
+from core.models.metrics import MetricTotals
+from core.algorithms.parallel_sort import lane_bounds, parallel_merge_sort, parallel_merge_sort_frames
+
+
+def test_lane_bounds_cover_the_input():
+    assert lane_bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert lane_bounds(2, 4) == [(0, 1), (1, 2)]
+    assert lane_bounds(0, 4) == [(0, 0)]
+
+
+def test_parallel_merge_sort_headless():
+    rng = random.Random(4)
+    values = [rng.randint(-10**6, 10**6) for _ in range(5000)]
+    out, stats = parallel_merge_sort(values, workers=3)
+    assert out == sorted(values)
+    assert stats["lanes"] == 3 and len(stats["chunk_seconds"]) == 3
+
+
+def test_parallel_merge_sort_frames_are_lane_tagged():
+    arr = random.Random(9).sample(range(100), 23)
+    frames = list(parallel_merge_sort_frames(arr, lanes=3))
+    assert frames[-1].values == sorted(arr)
+    sort_frames = [f for f in frames if f.data.get("phase") == "sort"]
+    assert {f.data["lane"] for f in sort_frames} == {0, 1, 2}
+    # Highlights are rebased onto the whole array, inside the frame's lane
+    for f in sort_frames:
+        lo, hi = lane_bounds(len(arr), 3)[f.data["lane"]]
+        assert all(lo <= i < hi for idx in f.highlights.values() for i in idx)
+    merges = [f for f in frames if f.data.get("phase") == "merge"]
+    assert len(merges) == len(arr)
+    assert MetricTotals.from_frames(merges).final()["writes"] == len(arr)
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from core.algorithms.pivot_study import PIVOT_STRATEGIES, STUDY_METRICS, compare_pivots, summarize
+from core.algorithms.sorting import count_only, quick_sort_frames
+from core.models.metrics import MetricTotals
+
+
+def test_max_depth_metric_totals_recursion_depth():
+    frames = list(quick_sort_frames(list(range(50)), pivot_strategy="last"))
+    assert MetricTotals.from_frames(frames).final()["max_depth"] == 49
+    assert max(f.data["level"] for f in frames if "level" in f.data) == 49
+    _, counts = count_only(quick_sort_frames, list(range(50)), pivot_strategy="median3")
+    assert counts["max_depth"] <= 6
+
+
+def test_summarize_percentiles():
+    stats = summarize(list(range(1, 101)))
+    assert stats["mean"] == 50.5 and stats["max"] == 100
+    assert stats["p50"] == 50.5 and 99 <= stats["p99"] <= 100
+
+
+def test_compare_pivots_reports_every_strategy_and_distribution():
+    with ThreadPoolExecutor(2) as pool:
+        rows = compare_pivots(("random", "sorted"), n=64, seeds=4, executor=pool)
+    assert [(r["distribution"], r["strategy"]) for r in rows] == [
+        (d, s) for d in ("random", "sorted") for s in PIVOT_STRATEGIES]
+    by = {(r["distribution"], r["strategy"]): r for r in rows}
+    # Sorted input is the worst case for first/last, not for median-of-three
+    assert by["sorted", "last"]["comparisons"]["p50"] == 64 * 63 / 2
+    assert by["sorted", "last"]["max_depth"]["max"] == 63
+    assert by["sorted", "median3"]["max_depth"]["max"] < 10
+    assert all(r["swaps"]["p50"] <= r["swaps"]["p99"] <= r["swaps"]["max"] for r in rows)
+
+
+def test_compare_pivots_in_a_process_pool():
+    rows = compare_pivots(("few_unique",), n=40, seeds=2, strategies=("median3",), workers=2)
+    assert len(rows) == 1 and rows[0]["comparisons"]["max"] > 0
+
+
+def test_random_pivot_runs_repeat_across_threads():
+    def study():
+        with ThreadPoolExecutor(4) as pool:
+            rows = compare_pivots(("random",), n=200, seeds=8, strategies=("random",), executor=pool)
+        return [{metric: row[metric] for metric in STUDY_METRICS} for row in rows]
+    assert study() == study()
+
+
+def test_compare_pivots_drops_runs_past_the_time_limit():
+    with ThreadPoolExecutor(2) as pool:
+        rows = compare_pivots(("sorted",), n=3000, seeds=3, strategies=("median3", "last"),
+                              executor=pool, time_limit=0.3)
+    by = {r["strategy"]: r for r in rows}
+    assert by["last"]["timed_out"] == 3 and by["last"]["comparisons"] is None
+    assert sum(r["wall_seconds"] for r in rows) < 5
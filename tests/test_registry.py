@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+from core.algorithms.registry import SORTING, choices, info, input_type, load, supports
+
+
+@pytest.mark.parametrize("name", list(SORTING))
+def test_every_registered_algorithm_sorts_with_default_options(name):
+    spec = SORTING[name]
+    options = {param: option["default"] for param, option in spec["options"].items()}
+    for param, option in spec["options"].items():
+        if "choices" in option:
+            assert option["default"] in choices(option)
+    arr = [5, -3, 4, 1, 4, 0, 9, 2]
+    frames = list(load(name)(arr, **options))
+    assert frames[-1].values == sorted(arr)
+    assert {"best", "average", "worst"} <= set(spec["time"]) and spec["inputs"]
+    assert info(name)["description"]
+
+
+def test_input_types():
+    assert input_type([3, 1]) == "int" and input_type([3, 1.5]) == "float"
+    assert supports("Merge Sort", [0.5, 0.25]) and not supports("Counting Sort", [0.5, 0.25])
+    assert supports("Counting Sort", [3, 1])
+
+
+def test_registry_imports_algorithms_lazily():
+    code = ("import sys; import core.algorithms.registry as r; "
+            "assert 'core.algorithms.sorting' not in sys.modules; "
+            "r.load('Timsort'); assert 'core.algorithms.sorting' in sys.modules; "
+            "assert 'core.algorithms.parallel_sort' not in sys.modules; "
+            "r.choices(r.SORTING['Quick Sort']['options']['pivot_strategy']); "
+            "assert 'core.algorithms.pivot_study' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
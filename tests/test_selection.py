@@ -0,0 +1,94 @@
+import heapq
+import random
+
+import numpy as np
+import pytest
+
+from core.models.metrics import MetricTotals
+from core.algorithms.sorting import count_only
+from core.algorithms.selection import (
+    SELECT_METHODS,
+    quickselect_frames,
+    nth_element,
+    nth_element_numpy,
+    top_k_frames,
+    top_k,
+)
+
+
+def assert_nth_element(values, arr, k):
+    assert sorted(values) == sorted(arr)
+    assert values[k] == sorted(arr)[k]
+    assert all(v <= values[k] for v in values[:k])
+    assert all(v >= values[k] for v in values[k + 1:])
+
+
+@pytest.mark.parametrize("method", SELECT_METHODS)
+def test_quickselect_leaves_nth_element_order(method):
+    for seed in range(20):
+        rng = random.Random(seed)
+        arr = [rng.randint(0, rng.choice([4, 1000])) for _ in range(rng.randint(1, 80))]
+        k = rng.randrange(len(arr))
+        frames = list(quickselect_frames(arr, k, method=method))
+        assert_nth_element(frames[-1].values, arr, k)
+        assert frames[-1].data["value"] == sorted(arr)[k]
+        values, counts = nth_element(arr, k, method=method)
+        assert values == frames[-1].values
+        assert counts["comparisons"] == MetricTotals.from_frames(frames).final()["comparisons"]
+
+
+def test_introselect_falls_back_to_median_of_medians():
+    # A sorted input with last-element pivots makes every partition peel off one key
+    arr = list(range(150))
+    plain = list(quickselect_frames(arr, 0, method="quickselect", pivot_strategy="last"))
+    intro = list(quickselect_frames(arr, 0, method="introselect", pivot_strategy="last"))
+    assert not plain[-1].data["fallback"] and intro[-1].data["fallback"]
+    assert_nth_element(intro[-1].values, arr, 0)
+    cmp = lambda frames: MetricTotals.from_frames(frames).final()["comparisons"]
+    assert cmp(intro) * 3 < cmp(plain)
+
+
+def test_random_pivots_follow_the_given_rng():
+    arr = [random.Random(1).randint(0, 500) for _ in range(300)]
+    runs = [[f.to_dict() for f in quickselect_frames(arr, 77, method="quickselect", pivot_strategy="random",
+                                                     rng=random.Random(4))] for _ in range(2)]
+    assert runs[0] == runs[1]
+    assert_nth_element(runs[0][-1]["view"]["values"], arr, 77)
+    first, second = (nth_element(arr, 77, pivot_strategy="random", rng=random.Random(4)) for _ in range(2))
+    assert first[0] == second[0] and first[1]["comparisons"] == second[1]["comparisons"]
+
+
+def test_quickselect_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        next(quickselect_frames([3, 1, 2], 3))
+    with pytest.raises(ValueError):
+        next(quickselect_frames([3, 1, 2], 1, method="floyd_rivest"))
+
+
+def test_nth_element_numpy():
+    a = np.random.default_rng(2).integers(0, 50, 10_000)
+    out = nth_element_numpy(a, 1234)
+    assert out[1234] == np.sort(a)[1234]
+    assert out[:1234].max() <= out[1234] <= out[1235:].min()
+
+
+def test_top_k_frames_keep_at_most_k_values():
+    rng = random.Random(5)
+    stream = [rng.randint(0, 100) for _ in range(200)]
+    frames = list(top_k_frames(iter(stream), 7))
+    assert frames[-1].values == sorted(stream, reverse=True)[:7]
+    assert frames[-1].data["seen"] == 200
+    assert max(len(f.values) for f in frames) == 7
+    # Short streams return everything they had
+    assert list(top_k_frames([3, 1], 5))[-1].values == [3, 1]
+    assert count_only(top_k_frames, iter(stream), k=7)[0] == frames[-1].values
+
+
+def test_top_k_streams_lazily():
+    rng = random.Random(8)
+    stream = (rng.random() for _ in range(50_000))
+    copy = random.Random(8)
+    expected = heapq.nlargest(10, (copy.random() for _ in range(50_000)))
+    out, stats = top_k(stream, 10)
+    assert out == expected
+    assert stats["seen"] == 50_000 and 10 <= stats["pushed"] < 1000
@@ -0,0 +1,232 @@
+import random
+import sys
+from functools import partial
+
+import numpy as np
+import pytest
+
+from core.models.frame import Frame, OP_WRITE
+from core.models.budget import FrameBudget
+from core.models.metrics import MetricTotals
+from core.algorithms.parallel_sort import parallel_merge_sort_frames
+from core.algorithms.sorting import (
+    insertion_sort_frames,
+    bubble_sort_frames,
+    selection_sort_frames,
+    merge_sort_frames,
+    quick_sort_frames,
+    QUICK_PARTITIONS,
+    heap_sort_frames,
+    HEAP_SIFTS,
+    count_only,
+    counting_sort_frames,
+    radix_sort_frames,
+    radix_sort_numpy,
+    RADIX_BASES,
+    shell_sort_frames,
+    SHELL_GAP_SEQUENCES,
+    intro_sort_frames,
+    tim_sort_frames,
+    pdq_sort_frames,
+)
+
+
+def test_counting_sort_handles_negative_and_sparse_keys():
+    for arr in ([3, -2, 5, -2, 0], [10**9, -5, 3, 3], [7], []):
+        frames = list(counting_sort_frames(arr))
+        assert frames[-1].values == sorted(arr)
+    assert list(counting_sort_frames([10**9, 0]))[0].data["mode"] == "sparse"
+    assert list(counting_sort_frames([-3, 0, 2]))[0].data["mode"] == "dense"
+
+
+def test_counting_sort_emits_one_frame_per_count_and_write():
+    rng = random.Random(1)
+    arr = [rng.randint(-50, 50) for _ in range(300)]
+    frames = list(counting_sort_frames(arr))
+    writes = [f for f in frames if f.op == OP_WRITE]
+    assert len(frames) == 2 * len(arr) + 2
+    assert [f.data["value"] for f in writes] == sorted(arr)
+    assert [f.highlights["swap"] for f in writes] == [[i] for i in range(len(arr))]
+
+
+def test_radix_sort_bases_and_signed_keys():
+    arr = [170, 45, -75, 90, 802, -24, 2, 66, -75]
+    for base in RADIX_BASES:
+        frames = list(radix_sort_frames(arr, base=base))
+        assert frames[-1].values == sorted(arr)
+        histograms = [f.data["histogram"] for f in frames if "histogram" in f.data]
+        assert histograms and all(sum(h.values()) == len(arr) for h in histograms)
+    # 877 spans three base-10 digits but fits in one base-2**11 digit
+    assert len(list(radix_sort_frames(arr, base=1 << 11))) < len(list(radix_sort_frames(arr)))
+
+
+def test_radix_sort_numpy_matches_np_sort():
+    rng = np.random.default_rng(7)
+    x = rng.integers(-2**63, 2**63 - 1, 20_000, dtype=np.int64)
+    for base in RADIX_BASES[1:]:
+        assert np.array_equal(radix_sort_numpy(x, base), np.sort(x))
+    assert radix_sort_numpy([]).size == 0
+
+
+HYBRID_SORTS = [intro_sort_frames, tim_sort_frames, pdq_sort_frames] + [
+    partial(shell_sort_frames, gaps=gaps) for gaps in SHELL_GAP_SEQUENCES
+]
+
+
+@pytest.mark.parametrize("sort", HYBRID_SORTS, ids=lambda f: getattr(f, "__name__", None) or f.keywords["gaps"])
+def test_hybrid_sorts_on_patterned_inputs(sort):
+    rng = random.Random(5)
+    for n in (0, 1, 2, 17, 24, 65, 300):
+        for arr in (list(range(n)), list(range(n, 0, -1)), [rng.randint(0, 3) for _ in range(n)],
+                    [rng.randint(-999, 999) for _ in range(n)], [min(i, n - i) for i in range(n)]):
+            frames = list(sort(arr))
+            assert not arr or frames[-1].values == sorted(arr)
+
+
+def test_timsort_and_pdqsort_are_linear_on_sorted_input():
+    arr = list(range(2000))
+    for sort in (tim_sort_frames, pdq_sort_frames):
+        comparisons = MetricTotals.from_frames(sort(arr)).final()["comparisons"]
+        assert comparisons < 3 * len(arr)
+    # Reversed input is a single descending run for Timsort
+    assert MetricTotals.from_frames(tim_sort_frames(arr[::-1])).final()["comparisons"] == len(arr) - 1
+
+
+def test_timsort_gallops_and_stays_stable():
+    keyed = [(k % 5, i) for i, k in enumerate(random.Random(2).sample(range(400), 400))]
+    blocks = [b * 100 + i for b in range(10) for i in range(30)]
+    merged = blocks + [x + 50 for x in blocks]
+    frames = list(tim_sort_frames(merged))
+    assert frames[-1].values == sorted(merged)
+    assert any(f.narration.startswith("Gallop") for f in frames)
+    # Keys compare on the first field only, so ties must keep input order
+    out = list(tim_sort_frames([_Key(*p) for p in keyed], min_run=8))[-1].values
+    assert [(x.k, x.i) for x in out] == sorted(keyed)
+
+
+class _Key:
+    def __init__(self, k, i):
+        self.k, self.i = k, i
+
+    def __lt__(self, other):
+        return self.k < other.k
+
+
+ALL_SORTS = [insertion_sort_frames, bubble_sort_frames, selection_sort_frames, merge_sort_frames,
+             quick_sort_frames, heap_sort_frames, counting_sort_frames, radix_sort_frames,
+             parallel_merge_sort_frames] + HYBRID_SORTS
+
+
+@pytest.mark.parametrize("sort", ALL_SORTS, ids=lambda f: getattr(f, "__name__", None) or f.keywords["gaps"])
+def test_count_only_matches_traced_counts(sort):
+    rng = random.Random(6)
+    arr = [rng.randint(-300, 300) for _ in range(120)]
+    traced = MetricTotals.from_frames(sort(arr)).final()
+    values, counts = count_only(sort, arr)
+    assert values == sorted(arr)
+    assert counts["wall_seconds"] >= 0
+    assert {name: counts.get(name, 0) for name in traced} == traced
+
+
+@pytest.mark.parametrize("sort", [heap_sort_frames, parallel_merge_sort_frames], ids=lambda f: f.__name__)
+def test_count_only_ignores_budget(sort):
+    arr = random.Random(2).sample(range(500), 90)
+    traced = MetricTotals.from_frames(sort(arr)).final()
+    for budget in (FrameBudget.every_nth(7), FrameBudget.adaptive(10)):
+        values, counts = count_only(sort, arr, budget=budget)
+        assert values == sorted(arr)
+        assert {name: counts.get(name, 0) for name in traced} == traced
+
+
+def test_count_only_rejects_frame_generators():
+    def direct(arr):
+        yield Frame(0, arr, "start")
+
+    with pytest.raises(TypeError, match="_yield_array"):
+        count_only(direct, [2, 1])
+
+
+@pytest.mark.parametrize("pivot_strategy", ["first", "last"])
+def test_quick_sort_is_iterative_on_adversarial_input(pivot_strategy):
+    # Sorted input is the worst case for first/last pivots: n-1 nested partitions
+    n = 600
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        values, _ = count_only(quick_sort_frames, list(range(n, 0, -1)), pivot_strategy=pivot_strategy)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert values == list(range(1, n + 1))
+    rng = random.Random(9)
+    arr = [rng.randint(0, 99) for _ in range(200)] + list(range(200))
+    depths = [f.data["depth"] for f in quick_sort_frames(arr, pivot_strategy=pivot_strategy) if "depth" in f.data]
+    assert max(depths) <= len(arr).bit_length()
+
+
+def test_merge_sort_stack_keeps_top_down_order():
+    rng = random.Random(8)
+    arr = [rng.randint(0, 50) for _ in range(37)]
+    frames = list(merge_sort_frames(arr))
+    ranges = []
+    for f in frames:
+        if f.data["range"] not in ranges[-1:]:
+            ranges.append(f.data["range"])
+
+    def expected(l, r):
+        if l >= r:
+            return []
+        m = (l + r) // 2
+        return expected(l, m) + expected(m + 1, r) + [[l, r]]
+
+    assert ranges == expected(0, len(arr) - 1)
+    assert frames[-1].values == sorted(arr)
+
+
+@pytest.mark.parametrize("partition", ["three_way", "dual_pivot"])
+def test_duplicate_aware_partitions(partition):
+    rng = random.Random(10)
+    arr = [rng.randrange(4) for _ in range(300)]
+    frames = list(quick_sort_frames(arr, pivot_strategy="median3", partition=partition))
+    assert frames[-1].values == sorted(arr)
+    for f in frames:
+        h = f.highlights
+        if "equal" not in h:
+            continue
+        less, equal, greater = ([f.values[i] for i in h[name]] for name in ("less", "equal", "greater"))
+        if partition == "three_way":
+            pivot = f.data["pivot"]
+            assert all(v < pivot for v in less) and all(v == pivot for v in equal)
+            assert all(v > pivot for v in greater)
+        else:
+            p, q = f.data["p"], f.data["q"]
+            assert all(v < p for v in less) and all(p <= v <= q for v in equal)
+            assert all(v > q for v in greater)
+
+    traced = MetricTotals.from_frames(frames).final()
+    values, counts = count_only(quick_sort_frames, arr, pivot_strategy="median3", partition=partition)
+    assert values == sorted(arr)
+    assert {name: counts.get(name, 0) for name in traced} == traced
+    _, lomuto = count_only(quick_sort_frames, arr, pivot_strategy="median3")
+    assert counts["comparisons"] * 5 < lomuto["comparisons"]
+
+
+def test_quick_sort_rejects_unknown_partition():
+    assert "lomuto" in QUICK_PARTITIONS
+    with pytest.raises(ValueError):
+        list(quick_sort_frames([2, 1], partition="hoare"))
+
+
+def test_floyd_heap_sort_halves_comparisons():
+    rng = random.Random(12)
+    arr = [rng.randint(0, 10_000) for _ in range(500)]
+    counts = {}
+    for sift in HEAP_SIFTS:
+        frames = list(heap_sort_frames(arr, sift=sift))
+        assert frames[-1].values == sorted(arr)
+        phases = [f.data["phase"] for f in frames]
+        assert phases[0] == "build" and phases[-1] == "extract"
+        assert phases == sorted(phases)  # all build frames come before extraction
+        counts[sift] = MetricTotals.from_frames(frames).final()
+    assert counts["floyd"]["comparisons"] < 0.7 * counts["classic"]["comparisons"]
+    with pytest.raises(ValueError):
+        list(heap_sort_frames(arr, sift="ternary"))
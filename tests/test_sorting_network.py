@@ -0,0 +1,65 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from core.models.frame import OP_SWAP
+from core.models.metrics import MetricTotals
+from core.algorithms.sorting import count_only
+from core.algorithms.sorting_network import NETWORKS, network_layers, network_sort_numpy, sorting_network_frames
+
+
+@pytest.mark.parametrize("network", NETWORKS)
+def test_networks_sort_every_zero_one_input(network):
+    # By the 0-1 principle, sorting all 2^n bit strings proves the network sorts everything
+    for n in range(11):
+        layers = network_layers(n, network)
+        for layer in layers:
+            used = [k for pair in layer for k in pair]
+            assert len(used) == len(set(used)) and all(i < j < n for i, j in layer)
+        for bits in itertools.product((0, 1), repeat=n):
+            a = list(bits)
+            for layer in layers:
+                for i, j in layer:
+                    if a[j] < a[i]:
+                        a[i], a[j] = a[j], a[i]
+            assert a == sorted(bits)
+
+
+def test_network_sizes():
+    # Both networks have log2(n)(log2(n)+1)/2 layers; odd-even merge needs fewer comparators
+    assert [len(network_layers(16, network)) for network in NETWORKS] == [10, 10]
+    assert sum(map(len, network_layers(16, "bitonic"))) == 80
+    assert sum(map(len, network_layers(16, "odd_even_merge"))) == 63
+
+
+@pytest.mark.parametrize("network", NETWORKS)
+def test_one_frame_per_layer(network):
+    rng = random.Random(3)
+    arr = [rng.randint(-50, 50) for _ in range(21)]
+    frames = list(sorting_network_frames(arr, network=network))
+    layers = network_layers(len(arr), network)
+    assert frames[-1].values == sorted(arr)
+    assert len(frames) == len(layers) + 2
+    assert [f.data["comparators"] for f in frames[1:-1]] == [[list(p) for p in layer] for layer in layers]
+    totals = MetricTotals.from_frames(frames).final()
+    assert totals["comparisons"] == sum(map(len, layers))
+    assert totals["swaps"] == sum(len(f.highlights["swap"]) // 2 for f in frames if f.op == OP_SWAP)
+    values, counts = count_only(sorting_network_frames, arr, network=network)
+    assert values == sorted(arr) and counts["comparisons"] == totals["comparisons"]
+
+
+@pytest.mark.parametrize("network", NETWORKS)
+def test_network_sort_numpy_sorts_every_row(network):
+    rng = np.random.default_rng(7)
+    for n in (1, 2, 5, 16, 27):
+        for dtype in (np.int16, np.int64, np.float64):
+            batch = rng.integers(-1000, 1000, (40, n)).astype(dtype)
+            before = batch.copy()
+            out = network_sort_numpy(batch, network)
+            assert out.dtype == dtype and (out == np.sort(batch, axis=1)).all()
+            assert (batch == before).all()
+            assert (network_sort_numpy(batch[0], network) == np.sort(batch[0])).all()
+    with pytest.raises(ValueError):
+        network_sort_numpy(np.zeros((2, 2, 2)), network)
@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+
+from core.models.frame import OP_COMPARE, DeltaTrace
+from core.models.trace import FrameTrace
+from core.algorithms.sorting import quick_sort_frames, heap_sort_frames, merge_sort_frames
+from core.algorithms.graphs import Graph
+
+
+def test_frame_trace_matches_drained_generator():
+    arr = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    frames = list(quick_sort_frames(arr))
+    trace = FrameTrace.from_frames(quick_sort_frames(arr), keyframe_every=7)
+    assert len(trace) == len(frames)
+    for k in (0, 1, 6, 7, 8, len(frames) - 1, -1):
+        assert trace[k].to_dict() == frames[k].to_dict()
+    assert [f.to_dict() for f in trace[3:20]] == [f.to_dict() for f in frames[3:20]]
+
+
+def test_frame_trace_columns_support_vectorized_analytics():
+    arr = list(range(40, 0, -1))
+    frames = list(heap_sort_frames(arr))
+    trace = FrameTrace.from_frames(frames)
+    assert int(trace.metrics["swaps"].sum()) == sum(f.metrics.get("swaps", 0) for f in frames)
+    assert trace.op_counts()[OP_COMPARE] == sum(f.op == OP_COMPARE for f in frames)
+    assert np.array_equal(trace.values_at(-1), sorted(arr))
+
+
+def test_frame_trace_handles_non_array_views():
+    g = Graph()
+    for u, v in [(0, 1), (0, 2), (1, 3)]:
+        g.add_edge(u, v)
+    frames = list(g.bfs_frames(0))
+    trace = FrameTrace.from_frames(frames, keyframe_every=2)
+    assert [f.to_dict() for f in trace] == [f.to_dict() for f in frames]
+
+
+def test_frame_trace_packs_a_delta_trace_as_is():
+    frames = list(merge_sort_frames([6, 2, 9, 1, 7, 3, 8]))
+    store = DeltaTrace.from_frames(frames, keyframe_every=4)
+    trace = FrameTrace.from_delta_trace(store)
+    assert trace.keyframe_every == 4 and len(trace) == len(store)
+    assert [f.to_dict() for f in trace] == [f.to_dict() for f in frames]
+    assert trace.touched.tolist() == [i for d in store._deltas if d for i in d[1]]
+
+
+def test_seek_matches_random_access_in_any_order():
+    arr = [5, 1, 4, 2, 8, 0, 3]
+    frames = list(quick_sort_frames(arr, pivot_strategy="median3"))
+    trace = FrameTrace.from_frames(frames, keyframe_every=5)
+    order = [0, 1, 2, 3, 12, 11, 10, 4, 5, 6, len(frames) - 1, len(frames) - 2, 7]
+    for k in order:
+        assert trace.seek(k).to_dict() == frames[k].to_dict()
+
+
+def test_narration_templates_are_interned_and_formatted_on_read():
+    frames = list(heap_sort_frames([3, 1, 2, 5, 4]))
+    assert type(frames[0]._narration) is tuple
+    trace = FrameTrace.from_frames(frames)
+    assert len(trace._narrations) < len(frames)
+    assert [f.narration for f in trace] == [f.narration for f in frames]
+
+
+def test_snapshot_matrix_matches_frames_and_downsamples():
+    rng = random.Random(11)
+    arr = [rng.randrange(100) for _ in range(30)]
+    frames = list(merge_sort_frames(arr))
+    trace = FrameTrace.from_frames(frames, keyframe_every=7)
+    matrix, rows, starts = trace.snapshot_matrix()
+    assert np.array_equal(matrix, [f.values for f in frames])
+    assert list(rows) == list(range(len(frames))) and list(starts) == list(range(30))
+
+    matrix, rows, starts = trace.snapshot_matrix(rows=9, cols=4)
+    assert matrix.shape == (9, 4) and rows[0] == 0 and rows[-1] == len(frames) - 1
+    full = np.array([frames[k].values for k in rows], dtype=float)
+    widths = np.diff(np.append(starts, 30))
+    assert np.allclose(matrix, np.add.reduceat(full, starts, axis=1) / widths)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from core.models.trace import FrameTrace
+from core.models.trace_file import write_trace, read_trace, read_header, write_chunked, ChunkedTrace
+from core.models.frame import Frame
+from core.algorithms.sorting import merge_sort_frames, radix_sort_frames
+from core.algorithms.trees import BST
+
+
+def test_trace_file_round_trip_through_memmap(tmp_path):
+    arr = [7, 2, 9, 4, 1, 8, 3, 6, 5, 0, 11, 10]
+    frames = list(merge_sort_frames(arr))
+    trace = FrameTrace.from_frames(frames, keyframe_every=8)
+    path = tmp_path / "merge.dtrace"
+    write_trace(trace, path, meta={"algorithm": "Merge Sort", "input": arr})
+
+    assert read_header(path)["meta"]["algorithm"] == "Merge Sort"
+    mapped = read_trace(path)
+    assert isinstance(mapped.written, np.memmap)
+    assert len(mapped) == len(frames)
+    assert [f.to_dict() for f in mapped] == [f.to_dict() for f in frames]
+    assert mapped.seek(len(frames) // 2).to_dict() == frames[len(frames) // 2].to_dict()
+    assert mapped.metrics["comparisons"].sum() == trace.metrics["comparisons"].sum()
+
+
+def test_trace_file_round_trips_frame_data_types(tmp_path):
+    # Radix frames carry a digit histogram keyed by int
+    arr = [170, 45, 75, 90, 802, 24, 2, 66]
+    frames = list(radix_sort_frames(arr))
+    assert any(isinstance(f.data.get("histogram"), dict) for f in frames)
+    frames.append(Frame(len(frames), sorted(arr), ("Done in {} passes", np.int64(3)),
+                        {"pair": (1, 2), "seen": {4, 5}, "frozen": frozenset({"a"}), "ratio": np.float32(0.5),
+                         "nested": {(0, 1): [True, None]}}, {}, {}))
+    write_trace(FrameTrace.from_frames(frames, keyframe_every=4), tmp_path / "radix.dtrace")
+    mapped = list(read_trace(tmp_path / "radix.dtrace"))
+    assert [f.to_dict() for f in mapped] == [f.to_dict() for f in frames]
+    # Equal dicts are not enough: {0: 8} == {0.0: 8}
+    assert list(mapped[0].data["histogram"]) == list(frames[0].data["histogram"])
+    assert all(type(k) is int for k in mapped[0].data["histogram"])
+    assert type(mapped[-1].data["ratio"]) is np.float32 and type(mapped[-1].data["pair"]) is tuple
+    assert mapped[-1].narration == "Done in 3 passes"
+
+
+def test_trace_file_rejects_unencodable_data(tmp_path):
+    frames = [Frame(0, [1, 2], "start", {"node": object()})]
+    with pytest.raises(TypeError, match="object"):
+        write_trace(FrameTrace.from_frames(frames), tmp_path / "bad.dtrace")
+
+
+def test_trace_file_rejects_non_integer_views(tmp_path):
+    tree = BST()
+    frames = [f for v in (5, 8) for f in tree.insert_frames(v)]
+    assert None in frames[-1].values  # level order [5, None, 8]
+    with pytest.raises(ValueError):
+        write_trace(FrameTrace.from_frames(frames), tmp_path / "tree.dtrace")
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_chunked_trace_streams_and_reads_single_chunks(tmp_path, codec):
+    arr = list(range(60, 0, -1))
+    frames = list(merge_sort_frames(arr))
+    path = tmp_path / f"merge.{codec}"
+    write_chunked(merge_sort_frames(arr), path, chunk_frames=64, keyframe_every=16, codec=codec)
+
+    chunked = ChunkedTrace(path)
+    assert len(chunked) == len(frames)
+    k = len(frames) - 5
+    assert chunked.seek(k).to_dict() == frames[k].to_dict()
+    assert list(chunked._cache) == [k // 64]
+    assert [f.to_dict() for f in chunked] == [f.to_dict() for f in frames]
+    assert chunked.compression_ratio() > 5
+
+
+def test_chunked_trace_from_frame_trace_matches(tmp_path):
+    frames = list(merge_sort_frames([4, 1, 3, 9, 7, 2, 8, 6, 5]))
+    trace = FrameTrace.from_frames(frames, keyframe_every=4)
+    write_chunked(trace, tmp_path / "t.chunks", chunk_frames=8)
+    assert [f.to_dict() for f in ChunkedTrace(tmp_path / "t.chunks")] == [f.to_dict() for f in frames]
+
+
+def test_chunked_trace_from_a_mapped_trace_file(tmp_path):
+    frames = list(merge_sort_frames([4, 1, 3, 9, 7, 2, 8, 6, 5, 0]))
+    write_trace(FrameTrace.from_frames(frames, keyframe_every=4), tmp_path / "t.dtrace")
+    write_chunked(read_trace(tmp_path / "t.dtrace"), tmp_path / "t.chunks", chunk_frames=8)
+    assert [f.to_dict() for f in ChunkedTrace(tmp_path / "t.chunks")] == [f.to_dict() for f in frames]
+
+
+def test_chunked_trace_totals_cross_chunk_boundaries(tmp_path):
+    frames = list(merge_sort_frames(list(range(40, 0, -1))))
+    trace = FrameTrace.from_frames(frames, keyframe_every=8)
+    write_chunked(trace, tmp_path / "m.chunks", chunk_frames=32)
+    chunked = ChunkedTrace(tmp_path / "m.chunks")
+    for k in (0, 31, 32, 100, len(frames) - 1):
+        assert chunked.totals_at(k) == trace.totals_at(k)